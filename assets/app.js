@@ -1,5 +1,125 @@
 // C Programming Zero to Hero - JavaScript
 
+// The search index lives next to this script (assets/search/), built by
+// tools/build_search_index.py. Resolved now because currentScript is only
+// set while the script is first executing.
+const SEARCH_INDEX_BASE = document.currentScript && document.currentScript.src
+  ? new URL('search/', document.currentScript.src).href
+  : null;
+
+// The service worker (sw.js, see tools/build_precache.py) sits at the site
+// root, one level above this script, so its scope covers every page.
+const SERVICE_WORKER_URL = document.currentScript && document.currentScript.src
+  ? new URL('../sw.js', document.currentScript.src).href
+  : null;
+
+const SEARCH_STOPWORDS = new Set([
+  'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'can', 'from', 'has',
+  'have', 'how', 'in', 'is', 'it', 'its', 'of', 'on', 'or', 'so',
+  'that', 'the', 'their', 'then', 'this', 'to', 'was', 'we', 'what', 'when',
+  'which', 'will', 'with', 'you', 'your'
+]);
+
+// Full-text search over the prebuilt inverted index. Terms are sharded by
+// first character and sorted, so a query fetches only the shards it needs
+// and finds prefix completions with a binary search.
+class SiteSearch {
+  constructor(baseUrl) {
+    this.baseUrl = baseUrl;
+    this.siteRoot = new URL('../../', baseUrl).href;
+    this.docsPromise = null;
+    this.shards = new Map();
+  }
+  
+  static tokenize(text) {
+    return (text.toLowerCase().match(/[a-z0-9_]+/g) || [])
+      .filter(t => t.length > 1 && !SEARCH_STOPWORDS.has(t));
+  }
+  
+  fetchJson(name) {
+    return fetch(this.baseUrl + name).then(response => {
+      if (!response.ok) throw new Error(`Search index unavailable: ${name}`);
+      return response.json();
+    });
+  }
+  
+  loadDocs() {
+    if (!this.docsPromise) {
+      this.docsPromise = this.fetchJson('docs.json');
+    }
+    return this.docsPromise;
+  }
+  
+  loadShard(key) {
+    if (!this.shards.has(key)) {
+      this.shards.set(key, this.fetchJson(`terms-${key}.json`));
+    }
+    return this.shards.get(key);
+  }
+  
+  // Scores for every doc matching one token; the last token of a query
+  // also matches as a prefix so results appear while typing
+  async matchToken(token, isPrefix, index) {
+    const scores = new Map();
+    if (!index.shards.includes(token[0])) return scores;
+    
+    const shard = await this.loadShard(token[0]);
+    const terms = shard.terms;
+    let lo = 0;
+    let hi = terms.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if (terms[mid] < token) lo = mid + 1; else hi = mid;
+    }
+    
+    const docCount = index.docs.length;
+    for (let i = lo, seen = 0; i < terms.length && seen < 50; i++, seen++) {
+      const term = terms[i];
+      if (isPrefix ? !term.startsWith(token) : term !== token) break;
+      
+      const postings = shard.postings[i];
+      const idf = Math.log(1 + docCount / (postings.length / 2));
+      // Exact matches outrank completions of a prefix
+      const boost = term === token ? 1 : 0.5;
+      let docId = 0;
+      for (let j = 0; j < postings.length; j += 2) {
+        docId += postings[j];
+        scores.set(docId, (scores.get(docId) || 0) + postings[j + 1] * idf * boost);
+      }
+    }
+    return scores;
+  }
+  
+  async search(query, limit = 8) {
+    const tokens = SiteSearch.tokenize(query);
+    if (!tokens.length) return [];
+    
+    const index = await this.loadDocs();
+    let combined = null;
+    for (let i = 0; i < tokens.length; i++) {
+      const scores = await this.matchToken(tokens[i], i === tokens.length - 1, index);
+      if (combined === null) {
+        combined = scores;
+      } else {
+        // Every token must match
+        for (const [docId, score] of combined) {
+          if (scores.has(docId)) combined.set(docId, score + scores.get(docId));
+          else combined.delete(docId);
+        }
+      }
+      if (!combined.size) return [];
+    }
+    
+    return Array.from(combined)
+      .sort((a, b) => b[1] - a[1])
+      .slice(0, limit)
+      .map(([docId]) => {
+        const [url, title, snippet] = index.docs[docId];
+        return { url: new URL(url, this.siteRoot).href, title, snippet };
+      });
+  }
+}
+
 class App {
   constructor() {
     this.sidebar = document.querySelector('.sidebar');
@@ -7,6 +127,9 @@ class App {
     this.navLinks = document.querySelectorAll('.nav-link');
     this.navGroups = document.querySelectorAll('.nav-group');
     this.copyButtons = document.querySelectorAll('.copy-btn');
+    this.siteSearch = SEARCH_INDEX_BASE ? new SiteSearch(SEARCH_INDEX_BASE) : null;
+    this.searchResults = null;
+    this.searchSeq = 0;
     
     this.init();
   }
@@ -18,6 +141,7 @@ class App {
     this.setupKeyboardShortcuts();
     this.setupCodeBlocks();
     this.restoreState();
+    this.showEarnedBadges();
   }
   
   setupEventListeners() {
@@ -89,19 +213,90 @@ class App {
   setupSearch() {
     if (!this.searchInput) return;
     
+    let debounce = null;
     this.searchInput.addEventListener('input', (e) => {
-      this.filterNavigation(e.target.value);
+      const query = e.target.value;
+      clearTimeout(debounce);
+      debounce = setTimeout(() => this.runSearch(query), 80);
     });
     
     this.searchInput.addEventListener('keydown', (e) => {
       if (e.key === 'Escape') {
         this.searchInput.value = '';
         this.filterNavigation('');
+        this.renderSearchResults(null);
         this.searchInput.blur();
+      } else if (e.key === 'Enter') {
+        const first = this.searchResults && this.searchResults.querySelector('a');
+        if (first) {
+          e.preventDefault();
+          window.location.href = first.href;
+        }
       }
     });
   }
   
+  async runSearch(query) {
+    const seq = ++this.searchSeq;
+    if (!query.trim() || !this.siteSearch) {
+      this.filterNavigation(query);
+      this.renderSearchResults(null);
+      return;
+    }
+    
+    try {
+      const results = await this.siteSearch.search(query);
+      if (seq !== this.searchSeq) return; // a newer query is in flight
+      this.filterNavigation('');
+      this.renderSearchResults(results);
+    } catch (err) {
+      // No index (e.g. opened via file://): fall back to filtering nav titles
+      this.siteSearch = null;
+      this.filterNavigation(query);
+      this.renderSearchResults(null);
+    }
+  }
+  
+  renderSearchResults(results) {
+    if (!this.searchResults) {
+      if (!results) return;
+      this.searchResults = document.createElement('ul');
+      this.searchResults.className = 'search-results';
+      this.searchResults.setAttribute('role', 'listbox');
+      this.searchInput.parentElement.appendChild(this.searchResults);
+    }
+    
+    this.searchResults.replaceChildren();
+    if (!results) {
+      this.searchResults.hidden = true;
+      return;
+    }
+    
+    if (!results.length) {
+      const empty = document.createElement('li');
+      empty.className = 'search-empty';
+      empty.textContent = 'No matches';
+      this.searchResults.appendChild(empty);
+    }
+    
+    results.forEach(result => {
+      const item = document.createElement('li');
+      const link = document.createElement('a');
+      const title = document.createElement('span');
+      const snippet = document.createElement('span');
+      link.href = result.url;
+      link.setAttribute('role', 'option');
+      title.className = 'search-result-title';
+      title.textContent = result.title;
+      snippet.className = 'search-result-snippet';
+      snippet.textContent = result.snippet;
+      link.append(title, snippet);
+      item.appendChild(link);
+      this.searchResults.appendChild(item);
+    });
+    this.searchResults.hidden = false;
+  }
+  
   filterNavigation(query) {
     const links = document.querySelectorAll('.nav-link');
     const groups = document.querySelectorAll('.nav-group');
@@ -288,6 +483,27 @@ class App {
     }
   }
   
+  // Show badges earned in quizzes (saved by the widget bundles) in the footer
+  showEarnedBadges() {
+    const badges = JSON.parse(localStorage.getItem('czh.badges') || '{}');
+    if (Object.keys(badges).length > 0) {
+      const footer = document.querySelector('footer');
+      if (footer) {
+        let badgeDisplay = footer.querySelector('.badge-display');
+        if (!badgeDisplay) {
+          badgeDisplay = document.createElement('div');
+          badgeDisplay.className = 'badge-display';
+          badgeDisplay.style.marginTop = '1rem';
+          footer.appendChild(badgeDisplay);
+        }
+      
+        const badgeCount = Object.keys(badges).length;
+        const badgeNames = Object.values(badges).map(b => b.name).join(', ');
+        badgeDisplay.innerHTML = `<small style="color: var(--muted);">🏆 Earned badges (${badgeCount}): ${badgeNames}</small>`;
+      }
+    }
+  }
+  
   isInputFocused() {
     const activeElement = document.activeElement;
     return activeElement && (
@@ -506,6 +722,14 @@ document.addEventListener('DOMContentLoaded', () => {
   new IndexPage();
 });
 
+// Precache the site for offline reading once the page has loaded. Skipped
+// for local previews (tools/serve_site.py), where cached pages would hide edits.
+if (SERVICE_WORKER_URL && 'serviceWorker' in navigator && location.protocol === 'https:') {
+  window.addEventListener('load', () => {
+    navigator.serviceWorker.register(SERVICE_WORKER_URL).catch(() => {});
+  });
+}
+
 // Export for potential module usage
 if (typeof module !== 'undefined' && module.exports) {
   module.exports = App;
@@ -0,0 +1,256 @@
+// Generated by tools/build_widgets.py from src/quiz.js - edit that file instead
+
+/**
+ * Decision Tree Visualizer Widget
+ * Visualizes conditional logic flow for educational purposes
+ */
+class DecisionVisualizerWidget {
+  constructor(container) {
+    this.container = container;
+    this.codeInput = container.querySelector('.decision-code-input');
+    this.runBtn = container.querySelector('.run-decision');
+    this.resetBtn = container.querySelector('.reset-decision');
+    this.ageInput = container.querySelector('#age-input');
+    this.licenseInput = container.querySelector('#license-input');
+    this.updateBtn = container.querySelector('.update-values');
+    this.variableValuesEl = container.querySelector('#variable-values');
+    
+    this.variables = { age: 25, hasLicense: 1 };
+    
+    if (this.codeInput && this.runBtn) {
+      this.init();
+    }
+  }
+  
+  init() {
+    this.setupEventListeners();
+    this.updateVisualization();
+  }
+  
+  setupEventListeners() {
+    if (this.runBtn) {
+      this.runBtn.addEventListener('click', () => this.runVisualization());
+    }
+    
+    if (this.resetBtn) {
+      this.resetBtn.addEventListener('click', () => this.resetVisualization());
+    }
+    
+    if (this.updateBtn) {
+      this.updateBtn.addEventListener('click', () => this.updateVariables());
+    }
+    
+    // Update on input changes
+    if (this.ageInput) {
+      this.ageInput.addEventListener('change', () => this.updateVariables());
+    }
+    
+    if (this.licenseInput) {
+      this.licenseInput.addEventListener('change', () => this.updateVariables());
+    }
+  }
+  
+  updateVariables() {
+    if (this.ageInput && this.licenseInput) {
+      this.variables.age = parseInt(this.ageInput.value) || 0;
+      this.variables.hasLicense = parseInt(this.licenseInput.value) || 0;
+      
+      // Update code
+      const newCode = `int age = ${this.variables.age};
+int hasLicense = ${this.variables.hasLicense};
+
+if (age >= 18) {
+    if (hasLicense == 1) {
+        printf("You can drive!\\n");
+    } else {
+        printf("Get your license first.\\n");
+    }
+} else {
+    printf("Too young to drive.\\n");
+}`;
+      
+      if (this.codeInput) {
+        this.codeInput.value = newCode;
+      }
+      
+      this.updateVisualization();
+    }
+  }
+  
+  runVisualization() {
+    this.updateVisualization();
+    // Animate the decision path
+    this.animateDecisionPath();
+  }
+  
+  resetVisualization() {
+    this.variables = { age: 25, hasLicense: 1 };
+    
+    if (this.ageInput) this.ageInput.value = '25';
+    if (this.licenseInput) this.licenseInput.value = '1';
+    
+    const resetCode = `int age = 25;
+int hasLicense = 1;
+
+if (age >= 18) {
+    if (hasLicense == 1) {
+        printf("You can drive!\\n");
+    } else {
+        printf("Get your license first.\\n");
+    }
+} else {
+    printf("Too young to drive.\\n");
+}`;
+    
+    if (this.codeInput) {
+      this.codeInput.value = resetCode;
+    }
+    
+    this.updateVisualization();
+  }
+  
+  updateVisualization() {
+    // Update variable values display
+    if (this.variableValuesEl) {
+      this.variableValuesEl.textContent = `age = ${this.variables.age}, hasLicense = ${this.variables.hasLicense}`;
+    }
+    
+    // Evaluate conditions
+    const firstCondition = this.variables.age >= 18;
+    const secondCondition = this.variables.hasLicense == 1;
+    
+    // Update first condition
+    const firstConditionNode = this.container.querySelector('[data-condition="age >= 18"]');
+    if (firstConditionNode) {
+      const resultEl = firstConditionNode.querySelector('.condition-result');
+      if (resultEl) {
+        resultEl.textContent = `${this.variables.age} >= 18 = ${firstCondition}`;
+      }
+    }
+    
+    // Update second condition if applicable
+    const secondConditionNode = this.container.querySelector('[data-condition="hasLicense == 1"]');
+    if (secondConditionNode) {
+      const resultEl = secondConditionNode.querySelector('.condition-result');
+      if (resultEl) {
+        resultEl.textContent = `${this.variables.hasLicense} == 1 = ${secondCondition}`;
+      }
+    }
+    
+    // Update active states
+    this.updateActiveStates(firstCondition, secondCondition);
+  }
+  
+  updateActiveStates(firstCondition, secondCondition) {
+    // Reset all states
+    const nodes = this.container.querySelectorAll('.tree-node');
+    const branches = this.container.querySelectorAll('.branch-label');
+    
+    nodes.forEach(node => {
+      node.classList.remove('active', 'inactive');
+    });
+    
+    branches.forEach(branch => {
+      branch.classList.remove('active');
+    });
+    
+    // Set active path based on conditions
+    if (firstCondition) {
+      // Age >= 18: TRUE path
+      const trueBranch = this.container.querySelector('.true-branch');
+      if (trueBranch && trueBranch.closest('.tree-branches')) {
+        trueBranch.classList.add('active');
+      }
+      
+      const secondConditionNode = this.container.querySelector('[data-condition="hasLicense == 1"]');
+      if (secondConditionNode) {
+        secondConditionNode.classList.add('active');
+      }
+      
+      if (secondCondition) {
+        // hasLicense == 1: TRUE path
+        const nestedTrueBranch = this.container.querySelector('.nested-branches .true-branch');
+        if (nestedTrueBranch) {
+          nestedTrueBranch.classList.add('active');
+        }
+        
+        const driveNode = this.container.querySelector('.nested-branches .branch-right .result-node');
+        if (driveNode) {
+          driveNode.classList.add('active');
+          driveNode.classList.remove('inactive');
+        }
+        
+        // Mark other result nodes as inactive
+        const otherResults = this.container.querySelectorAll('.result-node');
+        otherResults.forEach(node => {
+          if (!node.classList.contains('active')) {
+            node.classList.add('inactive');
+          }
+        });
+      } else {
+        // hasLicense == 1: FALSE path
+        const nestedFalseBranch = this.container.querySelector('.nested-branches .false-branch');
+        if (nestedFalseBranch) {
+          nestedFalseBranch.classList.add('active');
+        }
+        
+        const licenseNode = this.container.querySelector('.nested-branches .branch-left .result-node');
+        if (licenseNode) {
+          licenseNode.classList.add('active');
+          licenseNode.classList.remove('inactive');
+        }
+        
+        // Mark other result nodes as inactive
+        const otherResults = this.container.querySelectorAll('.result-node');
+        otherResults.forEach(node => {
+          if (!node.classList.contains('active')) {
+            node.classList.add('inactive');
+          }
+        });
+      }
+    } else {
+      // Age >= 18: FALSE path
+      const falseBranch = this.container.querySelector('.false-branch');
+      if (falseBranch && falseBranch.closest('.tree-branches')) {
+        falseBranch.classList.add('active');
+      }
+      
+      const tooYoungNode = this.container.querySelector('.branch-left .result-node');
+      if (tooYoungNode) {
+        tooYoungNode.classList.add('active');
+        tooYoungNode.classList.remove('inactive');
+      }
+      
+      // Mark other nodes as inactive
+      const secondConditionNode = this.container.querySelector('[data-condition="hasLicense == 1"]');
+      if (secondConditionNode) {
+        secondConditionNode.classList.remove('active');
+      }
+      
+      const otherResults = this.container.querySelectorAll('.result-node');
+      otherResults.forEach(node => {
+        if (!node.classList.contains('active')) {
+          node.classList.add('inactive');
+        }
+      });
+    }
+  }
+  
+  animateDecisionPath() {
+    // Add a brief animation to highlight the decision flow
+    const activeNodes = this.container.querySelectorAll('.tree-node.active, .branch-label.active');
+    
+    activeNodes.forEach((node, index) => {
+      setTimeout(() => {
+        node.style.transform = 'scale(1.05)';
+        setTimeout(() => {
+          node.style.transform = '';
+        }, 300);
+      }, index * 200);
+    });
+  }
+}
+
+document.addEventListener('DOMContentLoaded', () => {
+  document.querySelectorAll('.decision-visualizer').forEach(container => new DecisionVisualizerWidget(container));
+});
@@ -0,0 +1,291 @@
+// Generated by tools/build_widgets.py from src/quiz.js - edit that file instead
+
+/**
+ * Loop Visualizer Widget - Step-by-step loop execution visualization
+ */
+class LoopVisualizerWidget {
+  constructor(container) {
+    this.container = container;
+    this.currentStep = 0;
+    this.isRunning = false;
+    this.isPaused = false;
+    this.intervalId = null;
+    this.currentLoopType = 'for';
+    this.loopConfigs = this.initializeLoopConfigs();
+    
+    this.init();
+  }
+  
+  initializeLoopConfigs() {
+    return {
+      for: {
+        code: `for (int i = 1; i <= 5; i++) {
+    printf("%d ", i);
+}`,
+        steps: [
+          { step: 1, description: "Initialize: i = 1", variables: { i: 1 }, output: "", highlight: "i = 1" },
+          { step: 2, description: "Check condition: i <= 5 (1 <= 5 = true)", variables: { i: 1 }, output: "", highlight: "i <= 5" },
+          { step: 3, description: "Execute body: printf", variables: { i: 1 }, output: "1 ", highlight: "printf" },
+          { step: 4, description: "Update: i++", variables: { i: 2 }, output: "1 ", highlight: "i++" },
+          { step: 5, description: "Check condition: i <= 5 (2 <= 5 = true)", variables: { i: 2 }, output: "1 ", highlight: "i <= 5" },
+          { step: 6, description: "Execute body: printf", variables: { i: 2 }, output: "1 2 ", highlight: "printf" },
+          { step: 7, description: "Update: i++", variables: { i: 3 }, output: "1 2 ", highlight: "i++" },
+          { step: 8, description: "Check condition: i <= 5 (3 <= 5 = true)", variables: { i: 3 }, output: "1 2 ", highlight: "i <= 5" },
+          { step: 9, description: "Execute body: printf", variables: { i: 3 }, output: "1 2 3 ", highlight: "printf" },
+          { step: 10, description: "Update: i++", variables: { i: 4 }, output: "1 2 3 ", highlight: "i++" },
+          { step: 11, description: "Check condition: i <= 5 (4 <= 5 = true)", variables: { i: 4 }, output: "1 2 3 ", highlight: "i <= 5" },
+          { step: 12, description: "Execute body: printf", variables: { i: 4 }, output: "1 2 3 4 ", highlight: "printf" },
+          { step: 13, description: "Update: i++", variables: { i: 5 }, output: "1 2 3 4 ", highlight: "i++" },
+          { step: 14, description: "Check condition: i <= 5 (5 <= 5 = true)", variables: { i: 5 }, output: "1 2 3 4 ", highlight: "i <= 5" },
+          { step: 15, description: "Execute body: printf", variables: { i: 5 }, output: "1 2 3 4 5 ", highlight: "printf" },
+          { step: 16, description: "Update: i++", variables: { i: 6 }, output: "1 2 3 4 5 ", highlight: "i++" },
+          { step: 17, description: "Check condition: i <= 5 (6 <= 5 = false)", variables: { i: 6 }, output: "1 2 3 4 5 ", highlight: "i <= 5" },
+          { step: 18, description: "Loop ends", variables: { i: 6 }, output: "1 2 3 4 5 ", highlight: "" }
+        ]
+      },
+      while: {
+        code: `int i = 1;
+while (i <= 5) {
+    printf("%d ", i);
+    i++;
+}`,
+        steps: [
+          { step: 1, description: "Initialize: i = 1", variables: { i: 1 }, output: "", highlight: "i = 1" },
+          { step: 2, description: "Check condition: i <= 5 (1 <= 5 = true)", variables: { i: 1 }, output: "", highlight: "i <= 5" },
+          { step: 3, description: "Execute body: printf", variables: { i: 1 }, output: "1 ", highlight: "printf" },
+          { step: 4, description: "Execute body: i++", variables: { i: 2 }, output: "1 ", highlight: "i++" },
+          { step: 5, description: "Check condition: i <= 5 (2 <= 5 = true)", variables: { i: 2 }, output: "1 ", highlight: "i <= 5" },
+          { step: 6, description: "Execute body: printf", variables: { i: 2 }, output: "1 2 ", highlight: "printf" },
+          { step: 7, description: "Execute body: i++", variables: { i: 3 }, output: "1 2 ", highlight: "i++" },
+          { step: 8, description: "Check condition: i <= 5 (3 <= 5 = true)", variables: { i: 3 }, output: "1 2 ", highlight: "i <= 5" },
+          { step: 9, description: "Execute body: printf", variables: { i: 3 }, output: "1 2 3 ", highlight: "printf" },
+          { step: 10, description: "Execute body: i++", variables: { i: 4 }, output: "1 2 3 ", highlight: "i++" },
+          { step: 11, description: "Check condition: i <= 5 (4 <= 5 = true)", variables: { i: 4 }, output: "1 2 3 ", highlight: "i <= 5" },
+          { step: 12, description: "Execute body: printf", variables: { i: 4 }, output: "1 2 3 4 ", highlight: "printf" },
+          { step: 13, description: "Execute body: i++", variables: { i: 5 }, output: "1 2 3 4 ", highlight: "i++" },
+          { step: 14, description: "Check condition: i <= 5 (5 <= 5 = true)", variables: { i: 5 }, output: "1 2 3 4 ", highlight: "i <= 5" },
+          { step: 15, description: "Execute body: printf", variables: { i: 5 }, output: "1 2 3 4 5 ", highlight: "printf" },
+          { step: 16, description: "Execute body: i++", variables: { i: 6 }, output: "1 2 3 4 5 ", highlight: "i++" },
+          { step: 17, description: "Check condition: i <= 5 (6 <= 5 = false)", variables: { i: 6 }, output: "1 2 3 4 5 ", highlight: "i <= 5" },
+          { step: 18, description: "Loop ends", variables: { i: 6 }, output: "1 2 3 4 5 ", highlight: "" }
+        ]
+      },
+      'do-while': {
+        code: `int i = 1;
+do {
+    printf("%d ", i);
+    i++;
+} while (i <= 5);`,
+        steps: [
+          { step: 1, description: "Initialize: i = 1", variables: { i: 1 }, output: "", highlight: "i = 1" },
+          { step: 2, description: "Execute body: printf (runs at least once)", variables: { i: 1 }, output: "1 ", highlight: "printf" },
+          { step: 3, description: "Execute body: i++", variables: { i: 2 }, output: "1 ", highlight: "i++" },
+          { step: 4, description: "Check condition: i <= 5 (2 <= 5 = true)", variables: { i: 2 }, output: "1 ", highlight: "i <= 5" },
+          { step: 5, description: "Execute body: printf", variables: { i: 2 }, output: "1 2 ", highlight: "printf" },
+          { step: 6, description: "Execute body: i++", variables: { i: 3 }, output: "1 2 ", highlight: "i++" },
+          { step: 7, description: "Check condition: i <= 5 (3 <= 5 = true)", variables: { i: 3 }, output: "1 2 ", highlight: "i <= 5" },
+          { step: 8, description: "Execute body: printf", variables: { i: 3 }, output: "1 2 3 ", highlight: "printf" },
+          { step: 9, description: "Execute body: i++", variables: { i: 4 }, output: "1 2 3 ", highlight: "i++" },
+          { step: 10, description: "Check condition: i <= 5 (4 <= 5 = true)", variables: { i: 4 }, output: "1 2 3 ", highlight: "i <= 5" },
+          { step: 11, description: "Execute body: printf", variables: { i: 4 }, output: "1 2 3 4 ", highlight: "printf" },
+          { step: 12, description: "Execute body: i++", variables: { i: 5 }, output: "1 2 3 4 ", highlight: "i++" },
+          { step: 13, description: "Check condition: i <= 5 (5 <= 5 = true)", variables: { i: 5 }, output: "1 2 3 4 ", highlight: "i <= 5" },
+          { step: 14, description: "Execute body: printf", variables: { i: 5 }, output: "1 2 3 4 5 ", highlight: "printf" },
+          { step: 15, description: "Execute body: i++", variables: { i: 6 }, output: "1 2 3 4 5 ", highlight: "i++" },
+          { step: 16, description: "Check condition: i <= 5 (6 <= 5 = false)", variables: { i: 6 }, output: "1 2 3 4 5 ", highlight: "i <= 5" },
+          { step: 17, description: "Loop ends", variables: { i: 6 }, output: "1 2 3 4 5 ", highlight: "" }
+        ]
+      },
+      nested: {
+        code: `for (int i = 1; i <= 3; i++) {
+    for (int j = 1; j <= 3; j++) {
+        printf("(%d,%d) ", i, j);
+    }
+    printf("\\n");
+}`,
+        steps: [
+          { step: 1, description: "Outer loop: i = 1", variables: { i: 1, j: 0 }, output: "", highlight: "i = 1" },
+          { step: 2, description: "Inner loop: j = 1", variables: { i: 1, j: 1 }, output: "", highlight: "j = 1" },
+          { step: 3, description: "Print (1,1)", variables: { i: 1, j: 1 }, output: "(1,1) ", highlight: "printf" },
+          { step: 4, description: "Inner loop: j++", variables: { i: 1, j: 2 }, output: "(1,1) ", highlight: "j++" },
+          { step: 5, description: "Print (1,2)", variables: { i: 1, j: 2 }, output: "(1,1) (1,2) ", highlight: "printf" },
+          { step: 6, description: "Inner loop: j++", variables: { i: 1, j: 3 }, output: "(1,1) (1,2) ", highlight: "j++" },
+          { step: 7, description: "Print (1,3)", variables: { i: 1, j: 3 }, output: "(1,1) (1,2) (1,3) ", highlight: "printf" },
+          { step: 8, description: "Inner loop ends, print newline", variables: { i: 1, j: 4 }, output: "(1,1) (1,2) (1,3) \\n", highlight: "printf" },
+          { step: 9, description: "Outer loop: i++", variables: { i: 2, j: 4 }, output: "(1,1) (1,2) (1,3) \\n", highlight: "i++" },
+          { step: 10, description: "Inner loop: j = 1", variables: { i: 2, j: 1 }, output: "(1,1) (1,2) (1,3) \\n", highlight: "j = 1" },
+          { step: 11, description: "Print (2,1)", variables: { i: 2, j: 1 }, output: "(1,1) (1,2) (1,3) \\n(2,1) ", highlight: "printf" },
+          { step: 12, description: "Inner loop: j++", variables: { i: 2, j: 2 }, output: "(1,1) (1,2) (1,3) \\n(2,1) ", highlight: "j++" },
+          { step: 13, description: "Print (2,2)", variables: { i: 2, j: 2 }, output: "(1,1) (1,2) (1,3) \\n(2,1) (2,2) ", highlight: "printf" },
+          { step: 14, description: "Inner loop: j++", variables: { i: 2, j: 3 }, output: "(1,1) (1,2) (1,3) \\n(2,1) (2,2) ", highlight: "j++" },
+          { step: 15, description: "Print (2,3)", variables: { i: 2, j: 3 }, output: "(1,1) (1,2) (1,3) \\n(2,1) (2,2) (2,3) ", highlight: "printf" },
+          { step: 16, description: "Inner loop ends, print newline", variables: { i: 2, j: 4 }, output: "(1,1) (1,2) (1,3) \\n(2,1) (2,2) (2,3) \\n", highlight: "printf" },
+          { step: 17, description: "Outer loop: i++", variables: { i: 3, j: 4 }, output: "(1,1) (1,2) (1,3) \\n(2,1) (2,2) (2,3) \\n", highlight: "i++" },
+          { step: 18, description: "Inner loop: j = 1", variables: { i: 3, j: 1 }, output: "(1,1) (1,2) (1,3) \\n(2,1) (2,2) (2,3) \\n", highlight: "j = 1" },
+          { step: 19, description: "Print (3,1)", variables: { i: 3, j: 1 }, output: "(1,1) (1,2) (1,3) \\n(2,1) (2,2) (2,3) \\n(3,1) ", highlight: "printf" },
+          { step: 20, description: "Inner loop: j++", variables: { i: 3, j: 2 }, output: "(1,1) (1,2) (1,3) \\n(2,1) (2,2) (2,3) \\n(3,1) ", highlight: "j++" },
+          { step: 21, description: "Print (3,2)", variables: { i: 3, j: 2 }, output: "(1,1) (1,2) (1,3) \\n(2,1) (2,2) (2,3) \\n(3,1) (3,2) ", highlight: "printf" },
+          { step: 22, description: "Inner loop: j++", variables: { i: 3, j: 3 }, output: "(1,1) (1,2) (1,3) \\n(2,1) (2,2) (2,3) \\n(3,1) (3,2) ", highlight: "j++" },
+          { step: 23, description: "Print (3,3)", variables: { i: 3, j: 3 }, output: "(1,1) (1,2) (1,3) \\n(2,1) (2,2) (2,3) \\n(3,1) (3,2) (3,3) ", highlight: "printf" },
+          { step: 24, description: "Inner loop ends, print newline", variables: { i: 3, j: 4 }, output: "(1,1) (1,2) (1,3) \\n(2,1) (2,2) (2,3) \\n(3,1) (3,2) (3,3) \\n", highlight: "printf" },
+          { step: 25, description: "Outer loop ends", variables: { i: 4, j: 4 }, output: "(1,1) (1,2) (1,3) \\n(2,1) (2,2) (2,3) \\n(3,1) (3,2) (3,3) \\n", highlight: "" }
+        ]
+      }
+    };
+  }
+  
+  init() {
+    this.setupEventListeners();
+    this.updateDisplay();
+  }
+  
+  setupEventListeners() {
+    const loopSelect = this.container.querySelector('#loop-type-select');
+    const startBtn = this.container.querySelector('#start-visualization');
+    const stepBtn = this.container.querySelector('#step-visualization');
+    const resetBtn = this.container.querySelector('#reset-visualization');
+    
+    if (loopSelect) {
+      loopSelect.addEventListener('change', (e) => {
+        this.currentLoopType = e.target.value;
+        this.reset();
+        this.updateDisplay();
+      });
+    }
+    
+    if (startBtn) {
+      startBtn.addEventListener('click', () => this.startVisualization());
+    }
+    
+    if (stepBtn) {
+      stepBtn.addEventListener('click', () => this.stepForward());
+    }
+    
+    if (resetBtn) {
+      resetBtn.addEventListener('click', () => this.reset());
+    }
+  }
+  
+  updateDisplay() {
+    const config = this.loopConfigs[this.currentLoopType];
+    const codeDisplay = this.container.querySelector('#current-loop-code');
+    
+    if (codeDisplay) {
+      codeDisplay.textContent = config.code;
+    }
+    
+    this.updateExecutionState();
+  }
+  
+  updateExecutionState() {
+    const config = this.loopConfigs[this.currentLoopType];
+    const currentStepData = config.steps[this.currentStep] || config.steps[config.steps.length - 1];
+    
+    const variablesDiv = this.container.querySelector('#loop-variables');
+    const outputDiv = this.container.querySelector('#loop-output');
+    const stepDiv = this.container.querySelector('#current-step');
+    
+    if (variablesDiv) {
+      variablesDiv.innerHTML = '';
+      Object.entries(currentStepData.variables).forEach(([name, value]) => {
+        const varItem = document.createElement('div');
+        varItem.className = 'variable-item';
+        varItem.innerHTML = `
+          <span class="variable-name">${name}:</span>
+          <span class="variable-value">${value}</span>
+        `;
+        variablesDiv.appendChild(varItem);
+      });
+    }
+    
+    if (outputDiv) {
+      outputDiv.textContent = currentStepData.output.replace(/\\n/g, '\n');
+    }
+    
+    if (stepDiv) {
+      stepDiv.innerHTML = `
+        <div class="execution-step">
+          Step ${currentStepData.step}: ${currentStepData.description}
+        </div>
+      `;
+    }
+  }
+  
+  startVisualization() {
+    if (this.isRunning) {
+      this.pause();
+      return;
+    }
+    
+    this.isRunning = true;
+    this.container.classList.add('loop-running');
+    
+    const startBtn = this.container.querySelector('#start-visualization');
+    if (startBtn) startBtn.textContent = '⏸ Pause';
+    
+    this.intervalId = setInterval(() => {
+      this.stepForward();
+      if (this.currentStep >= this.loopConfigs[this.currentLoopType].steps.length - 1) {
+        this.complete();
+      }
+    }, 1000);
+  }
+  
+  pause() {
+    this.isRunning = false;
+    this.isPaused = true;
+    this.container.classList.remove('loop-running');
+    this.container.classList.add('loop-paused');
+    
+    if (this.intervalId) {
+      clearInterval(this.intervalId);
+      this.intervalId = null;
+    }
+    
+    const startBtn = this.container.querySelector('#start-visualization');
+    if (startBtn) startBtn.textContent = '▶ Resume';
+  }
+  
+  complete() {
+    this.isRunning = false;
+    this.container.classList.remove('loop-running', 'loop-paused');
+    this.container.classList.add('loop-completed');
+    
+    if (this.intervalId) {
+      clearInterval(this.intervalId);
+      this.intervalId = null;
+    }
+    
+    const startBtn = this.container.querySelector('#start-visualization');
+    if (startBtn) startBtn.textContent = '✓ Completed';
+  }
+  
+  stepForward() {
+    const config = this.loopConfigs[this.currentLoopType];
+    if (this.currentStep < config.steps.length - 1) {
+      this.currentStep++;
+      this.updateExecutionState();
+    }
+  }
+  
+  reset() {
+    this.currentStep = 0;
+    this.isRunning = false;
+    this.isPaused = false;
+    this.container.classList.remove('loop-running', 'loop-paused', 'loop-completed');
+    
+    if (this.intervalId) {
+      clearInterval(this.intervalId);
+      this.intervalId = null;
+    }
+    
+    const startBtn = this.container.querySelector('#start-visualization');
+    if (startBtn) startBtn.textContent = '▶ Start';
+    
+    this.updateExecutionState();
+  }
+}
+
+document.addEventListener('DOMContentLoaded', () => {
+  document.querySelectorAll('.loop-visualizer').forEach(container => new LoopVisualizerWidget(container));
+});
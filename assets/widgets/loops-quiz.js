@@ -0,0 +1,346 @@
+// Generated by tools/build_widgets.py from src/quiz.js - edit that file instead
+
+/**
+ * Initialize Enhanced Quiz for Chapter 4: Loops
+ */
+function initializeLoopsQuiz() {
+  const quizSection = document.querySelector('#loops-quiz');
+  if (!quizSection) return;
+  
+  // Questions, topics and badge thresholds come from the quiz shard built by
+  // tools/build_quizzes.py, fetched when the quiz is first started
+  let quiz = null;
+  let quizQuestions = [];
+  
+  async function loadQuiz() {
+    if (quiz) return true;
+    try {
+      const response = await fetch(quizSection.dataset.quizSrc);
+      if (!response.ok) throw new Error(`HTTP ${response.status}`);
+      quiz = await response.json();
+    } catch (e) {
+      console.error('Could not load quiz', quizSection.dataset.quizId, e);
+      // Shown where the questions would be; Start stays, to try again
+      questionsContainer.innerHTML = '';
+      const message = document.createElement('p');
+      message.className = 'quiz-unavailable';
+      message.setAttribute('role', 'status');
+      message.textContent = location.protocol === 'file:'
+        ? 'Quizzes can\'t load from a page opened as a file. Preview the site with python3 tools/serve_site.py instead.'
+        : 'This quiz couldn\'t be loaded. Check your connection and press Start Quiz to try again.';
+      questionsContainer.appendChild(message);
+      return false;
+    }
+    quizQuestions = quiz.items;
+    return true;
+  }
+  
+  // Set up enhanced quiz functionality
+  const startBtn = quizSection.querySelector('#start-quiz');
+  const nextBtn = quizSection.querySelector('#next-question');
+  const submitBtn = quizSection.querySelector('#submit-quiz');
+  const restartBtn = quizSection.querySelector('#restart-quiz');
+  const questionsContainer = quizSection.querySelector('#quiz-questions');
+  const resultsContainer = quizSection.querySelector('#quiz-results');
+  
+  let currentQuestion = 0;
+  let userAnswers = {};
+  let quizStarted = false;
+  
+  async function startQuiz() {
+    if (!(await loadQuiz())) return;
+    quizStarted = true;
+    currentQuestion = 0;
+    userAnswers = {};
+    
+    startBtn.style.display = 'none';
+    nextBtn.style.display = 'inline-block';
+    resultsContainer.style.display = 'none';
+    restartBtn.style.display = 'none';
+    
+    showQuestion(currentQuestion);
+  }
+  
+  function showQuestion(index) {
+    if (index >= quizQuestions.length) {
+      showSubmitButton();
+      return;
+    }
+    
+    const question = quizQuestions[index];
+    questionsContainer.innerHTML = `
+      <div class="question-container">
+        <div class="question-header">
+          <span class="question-number">Question ${index + 1} of ${quizQuestions.length}</span>
+          <span class="question-topic">${question.topic.replace('-', ' ').toUpperCase()}</span>
+        </div>
+        <h3 class="question-text">${question.q.replace(/\n/g, '<br>')}</h3>
+        <div class="options-container">
+          ${question.choices.map((option, i) => `
+            <label class="option-label">
+              <input type="radio" name="question-${question.id}" value="${i}" class="option-input">
+              <span class="option-text">${option}</span>
+            </label>
+          `).join('')}
+        </div>
+      </div>
+    `;
+    
+    // Update button states
+    nextBtn.style.display = index < quizQuestions.length - 1 ? 'inline-block' : 'none';
+    submitBtn.style.display = index === quizQuestions.length - 1 ? 'inline-block' : 'none';
+  }
+  
+  function showSubmitButton() {
+    nextBtn.style.display = 'none';
+    submitBtn.style.display = 'inline-block';
+  }
+  
+  function nextQuestion() {
+    // Save current answer
+    const selectedOption = questionsContainer.querySelector('input[type="radio"]:checked');
+    if (selectedOption) {
+      userAnswers[quizQuestions[currentQuestion].id] = parseInt(selectedOption.value);
+    }
+    
+    currentQuestion++;
+    showQuestion(currentQuestion);
+  }
+  
+  function submitQuiz() {
+    // Save final answer
+    const selectedOption = questionsContainer.querySelector('input[type="radio"]:checked');
+    if (selectedOption) {
+      userAnswers[quizQuestions[currentQuestion].id] = parseInt(selectedOption.value);
+    }
+    
+    // Calculate results
+    const results = calculateResults();
+    showResults(results);
+    updateBadges(results);
+  }
+  
+  function calculateResults() {
+    let correct = 0;
+    const topicScores = {};
+    const questionResults = [];
+    
+    quizQuestions.forEach(question => {
+      const userAnswer = userAnswers[question.id];
+      const isCorrect = userAnswer === question.answer;
+      
+      if (isCorrect) correct++;
+      
+      if (!topicScores[question.topic]) {
+        topicScores[question.topic] = { correct: 0, total: 0 };
+      }
+      topicScores[question.topic].total++;
+      if (isCorrect) topicScores[question.topic].correct++;
+      
+      questionResults.push({
+        question: question,
+        userAnswer: userAnswer,
+        isCorrect: isCorrect
+      });
+    });
+    
+    const score = Math.round((correct / quizQuestions.length) * 100);
+    
+    return {
+      score: score,
+      correct: correct,
+      total: quizQuestions.length,
+      topicScores: topicScores,
+      questionResults: questionResults
+    };
+  }
+  
+  function showResults(results) {
+    questionsContainer.style.display = 'none';
+    submitBtn.style.display = 'none';
+    resultsContainer.style.display = 'block';
+    restartBtn.style.display = 'inline-block';
+    
+    // Update score display
+    const scoreElement = resultsContainer.querySelector('#final-score');
+    if (scoreElement) {
+      scoreElement.textContent = results.score;
+      scoreElement.className = `score-number ${results.score >= 80 ? 'excellent' : results.score >= 60 ? 'good' : 'needs-improvement'}`;
+    }
+    
+    // Show performance breakdown
+    const breakdownElement = resultsContainer.querySelector('#performance-breakdown');
+    if (breakdownElement) {
+      let performanceText = '';
+      if (results.score >= 90) performanceText = '🏆 Excellent! Loop mastery achieved!';
+      else if (results.score >= 80) performanceText = '🎯 Great job! Strong loop understanding!';
+      else if (results.score >= 60) performanceText = '📚 Good work! Review the areas below.';
+      else performanceText = '🔄 Keep practicing! Loops take time to master.';
+      
+      breakdownElement.innerHTML = `<p>${performanceText}</p>`;
+    }
+    
+    // Show topic analysis
+    const topicScoresElement = resultsContainer.querySelector('#topic-scores');
+    if (topicScoresElement) {
+      topicScoresElement.innerHTML = '';
+      Object.entries(results.topicScores).forEach(([topic, scores]) => {
+        const percentage = Math.round((scores.correct / scores.total) * 100);
+        const topicDiv = document.createElement('div');
+        topicDiv.className = 'topic-score-item';
+        topicDiv.innerHTML = `
+          <span class="topic-name">${topic.replace('-', ' ').replace(/\b\w/g, l => l.toUpperCase())}:</span>
+          <span class="topic-score ${percentage >= 80 ? 'excellent' : percentage >= 60 ? 'good' : 'needs-work'}">${scores.correct}/${scores.total} (${percentage}%)</span>
+        `;
+        topicScoresElement.appendChild(topicDiv);
+      });
+    }
+    
+    // Show recommendations
+    const recommendationsElement = resultsContainer.querySelector('#recommendation-list');
+    if (recommendationsElement) {
+      const recommendations = generateRecommendations(results);
+      recommendationsElement.innerHTML = recommendations.map(rec => `<li>${rec}</li>`).join('');
+    }
+    
+    // Save progress
+    saveQuizProgress('loops', results);
+  }
+  
+  function generateRecommendations(results) {
+    const recommendations = [];
+    
+    quiz.topics.forEach(topic => {
+      const scores = results.topicScores[topic.name];
+      if (scores && (scores.correct / scores.total) * 100 < 60 && topic.advice) {
+        recommendations.push(topic.advice);
+      }
+    });
+    
+    if (results.score >= 90) {
+      recommendations.push('🎉 Excellent work! Try the advanced practice problems to challenge yourself further.');
+    } else if (results.score >= 80) {
+      recommendations.push('Great job! Practice the pattern generation problems to strengthen your nested loop skills.');
+    } else if (results.score >= 60) {
+      recommendations.push('Good foundation! Review the common errors section and practice more loop examples.');
+    } else {
+      recommendations.push('Take time to work through each loop type systematically. Start with simple for loops and build up.');
+    }
+    
+    return recommendations;
+  }
+  
+  function updateBadges(results) {
+    const badges = JSON.parse(localStorage.getItem('czh.badges') || '{}');
+    let newBadges = false;
+    
+    // Each badge needs a score of at least its threshold, on its topic or (with no topic) the whole quiz
+    quiz.badges.forEach(badge => {
+      if (badges[badge.id]) return;
+      const scores = badge.topic ? results.topicScores[badge.topic] : results;
+      if (!scores || scores.correct / scores.total < badge.threshold) return;
+      
+      badges[badge.id] = {
+        id: badge.id,
+        name: badge.name,
+        description: badge.description,
+        earnedAt: new Date().toISOString(),
+        chapter: 'loops'
+      };
+      newBadges = true;
+      showBadgeNotification(badge.name, badge.description);
+    });
+    
+    if (newBadges) {
+      localStorage.setItem('czh.badges', JSON.stringify(badges));
+      updateBadgeDisplay();
+    }
+  }
+  
+  function showBadgeNotification(name, description) {
+    const notification = document.createElement('div');
+    notification.className = 'badge-notification';
+    notification.innerHTML = `
+      <div class="badge-notification-content">
+        <div class="badge-icon">🏆</div>
+        <div>
+          <strong>Badge Earned!</strong><br>
+          <em>${name}</em><br>
+          <small>${description}</small>
+        </div>
+      </div>
+    `;
+    
+    notification.style.cssText = `
+      position: fixed;
+      top: 20px;
+      right: 20px;
+      background: var(--good);
+      color: white;
+      padding: 1rem;
+      border-radius: var(--radius-lg);
+      box-shadow: var(--elev);
+      z-index: 10000;
+      animation: slideInRight 0.5s ease-out;
+    `;
+    
+    document.body.appendChild(notification);
+    
+    setTimeout(() => {
+      notification.remove();
+    }, 5000);
+  }
+  
+  function updateBadgeDisplay() {
+    const badges = JSON.parse(localStorage.getItem('czh.badges') || '{}');
+    
+    // Update badge items on page
+    Object.keys(badges).forEach(badgeId => {
+      const badgeItem = document.querySelector(`[data-badge="${badgeId}"]`);
+      if (badgeItem) {
+        badgeItem.classList.add('earned');
+        const progressText = badgeItem.querySelector('.progress-text');
+        if (progressText) {
+          progressText.textContent = 'Earned!';
+        }
+      }
+    });
+  }
+  
+  function saveQuizProgress(chapter, results) {
+    const progress = JSON.parse(localStorage.getItem('czh.progress') || '{}');
+    if (!progress.quizzes) progress.quizzes = {};
+    
+    progress.quizzes[chapter] = {
+      score: results.score,
+      completedAt: new Date().toISOString(),
+      topicScores: results.topicScores
+    };
+    
+    localStorage.setItem('czh.progress', JSON.stringify(progress));
+  }
+  
+  function restartQuiz() {
+    questionsContainer.style.display = 'block';
+    resultsContainer.style.display = 'none';
+    restartBtn.style.display = 'none';
+    startBtn.style.display = 'inline-block';
+    
+    currentQuestion = 0;
+    userAnswers = {};
+    quizStarted = false;
+  }
+  
+  // Event listeners
+  if (startBtn) startBtn.addEventListener('click', startQuiz);
+  if (nextBtn) nextBtn.addEventListener('click', nextQuestion);
+  if (submitBtn) submitBtn.addEventListener('click', submitQuiz);
+  if (restartBtn) restartBtn.addEventListener('click', restartQuiz);
+  
+  // Load existing badge states
+  updateBadgeDisplay();
+}
+
+document.addEventListener('DOMContentLoaded', () => {
+  initializeLoopsQuiz();
+});
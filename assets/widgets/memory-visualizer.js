@@ -0,0 +1,176 @@
+// Generated by tools/build_widgets.py from src/quiz.js - edit that file instead
+
+/**
+ * Memory Visualizer Widget
+ * Parses simple C code and visualizes memory allocation
+ */
+class MemoryVisualizerWidget {
+  constructor(container) {
+    this.container = container;
+    this.codeInput = container.querySelector('.memory-code-input');
+    this.runBtn = container.querySelector('.run-simulation');
+    this.resetBtn = container.querySelector('.reset-memory');
+    this.memoryBlocks = container.querySelector('#memory-blocks');
+    this.totalMemoryEl = container.querySelector('#total-memory');
+    this.varCountEl = container.querySelector('#var-count');
+    this.nextAddressEl = container.querySelector('#next-address');
+    
+    this.baseAddress = 0x1000;
+    this.currentAddress = this.baseAddress;
+    this.variables = [];
+    
+    if (this.codeInput && this.runBtn) {
+      this.init();
+    }
+  }
+  
+  init() {
+    this.setupEventListeners();
+    this.runSimulation(); // Run initial simulation
+  }
+  
+  setupEventListeners() {
+    if (this.runBtn) {
+      this.runBtn.addEventListener('click', () => this.runSimulation());
+    }
+    
+    if (this.resetBtn) {
+      this.resetBtn.addEventListener('click', () => this.resetMemory());
+    }
+    
+    // Auto-run on code change (debounced)
+    if (this.codeInput) {
+      let timeout;
+      this.codeInput.addEventListener('input', () => {
+        clearTimeout(timeout);
+        timeout = setTimeout(() => this.runSimulation(), 500);
+      });
+    }
+  }
+  
+  parseCode(code) {
+    const variables = [];
+    const lines = code.split('\n').map(line => line.trim()).filter(line => line && !line.startsWith('//'));
+    
+    const typePattern = /^(int|float|double|char)\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*(?:=\s*(.+?))?;/;
+    
+    for (const line of lines) {
+      const match = line.match(typePattern);
+      if (match) {
+        const [, type, name, valueStr] = match;
+        let value = valueStr || '0';
+        
+        // Clean up the value
+        value = value.replace(/'/g, '').replace(/"/g, '').trim();
+        
+        variables.push({
+          type,
+          name,
+          value: this.formatValue(type, value),
+          size: this.getTypeSize(type)
+        });
+      }
+    }
+    
+    return variables;
+  }
+  
+  getTypeSize(type) {
+    const sizes = {
+      'char': 1,
+      'int': 4,
+      'float': 4,
+      'double': 8
+    };
+    return sizes[type] || 4;
+  }
+  
+  formatValue(type, value) {
+    switch (type) {
+      case 'char':
+        if (value.length === 1) {
+          return `'${value}'`;
+        }
+        return value;
+      case 'int':
+        return parseInt(value) || 0;
+      case 'float':
+        return parseFloat(value).toFixed(1) || '0.0';
+      case 'double':
+        return parseFloat(value).toFixed(5) || '0.00000';
+      default:
+        return value;
+    }
+  }
+  
+  runSimulation() {
+    const code = this.codeInput ? this.codeInput.value : '';
+    this.variables = this.parseCode(code);
+    this.currentAddress = this.baseAddress;
+    this.updateMemoryDisplay();
+    this.updateStats();
+  }
+  
+  resetMemory() {
+    if (this.codeInput) {
+      this.codeInput.value = `int age = 25;
+float height = 5.8;
+char grade = 'A';
+double pi = 3.14159;`;
+    }
+    this.runSimulation();
+  }
+  
+  updateMemoryDisplay() {
+    if (!this.memoryBlocks) return;
+    
+    // Clear existing blocks
+    this.memoryBlocks.innerHTML = '';
+    
+    if (this.variables.length === 0) {
+      this.memoryBlocks.innerHTML = '<div class="memory-placeholder">Run simulation to see memory allocation</div>';
+      return;
+    }
+    
+    // Add each variable as a memory block
+    this.variables.forEach((variable, index) => {
+      const block = document.createElement('div');
+      block.className = `memory-block ${variable.type} animated`;
+      
+      // Calculate address for this variable
+      const address = this.currentAddress;
+      this.currentAddress += variable.size;
+      
+      block.innerHTML = `
+        <div class="memory-address">0x${address.toString(16).toUpperCase()}</div>
+        <div class="memory-content">${variable.value}</div>
+        <div class="variable-label">${variable.name} (${variable.type})</div>
+      `;
+      
+      // Add with slight delay for animation effect
+      setTimeout(() => {
+        this.memoryBlocks.appendChild(block);
+      }, index * 200);
+    });
+  }
+  
+  updateStats() {
+    const totalMemory = this.variables.reduce((sum, variable) => sum + variable.size, 0);
+    
+    if (this.totalMemoryEl) {
+      this.totalMemoryEl.textContent = `${totalMemory} bytes`;
+    }
+    
+    if (this.varCountEl) {
+      this.varCountEl.textContent = this.variables.length.toString();
+    }
+    
+    if (this.nextAddressEl) {
+      this.nextAddressEl.textContent = `0x${this.currentAddress.toString(16).toUpperCase()}`;
+    }
+  }
+}
+
+document.addEventListener('DOMContentLoaded', () => {
+  document.querySelectorAll('.memory-visualizer').forEach(container => new MemoryVisualizerWidget(container));
+});
@@ -0,0 +1,360 @@
+// Generated by tools/build_widgets.py from src/quiz.js - edit that file instead
+
+/**
+ * Pattern Generator Widget - Interactive nested loop pattern creator
+ */
+class PatternGeneratorWidget {
+  constructor(container) {
+    this.container = container;
+    this.currentPattern = 'triangle';
+    this.currentSize = 5;
+    this.currentChar = '*';
+    this.patternsCreated = new Set();
+    
+    this.init();
+  }
+  
+  init() {
+    this.setupEventListeners();
+    this.generatePattern();
+  }
+  
+  setupEventListeners() {
+    const patternSelect = this.container.querySelector('#pattern-type');
+    const sizeSlider = this.container.querySelector('#pattern-size');
+    const charInput = this.container.querySelector('#pattern-char');
+    const generateBtn = this.container.querySelector('#generate-pattern');
+    const copyBtn = this.container.querySelector('.copy-btn');
+    
+    if (patternSelect) {
+      patternSelect.addEventListener('change', (e) => {
+        this.currentPattern = e.target.value;
+        this.generatePattern();
+      });
+    }
+    
+    if (sizeSlider) {
+      sizeSlider.addEventListener('input', (e) => {
+        this.currentSize = parseInt(e.target.value);
+        const sizeValue = this.container.querySelector('#size-value');
+        if (sizeValue) sizeValue.textContent = this.currentSize;
+        this.generatePattern();
+      });
+    }
+    
+    if (charInput) {
+      charInput.addEventListener('input', (e) => {
+        this.currentChar = e.target.value.charAt(0) || '*';
+        this.generatePattern();
+      });
+    }
+    
+    if (generateBtn) {
+      generateBtn.addEventListener('click', () => this.generatePattern());
+    }
+    
+    if (copyBtn) {
+      copyBtn.addEventListener('click', () => this.copyCode());
+    }
+  }
+  
+  generatePattern() {
+    const patternResult = this.container.querySelector('#pattern-result');
+    const patternCode = this.container.querySelector('#pattern-code-output');
+    
+    if (!patternResult || !patternCode) return;
+    
+    this.container.classList.add('pattern-generating');
+    
+    setTimeout(() => {
+      const { pattern, code } = this.createPattern();
+      
+      patternResult.textContent = pattern;
+      patternCode.textContent = code;
+      
+      this.container.classList.remove('pattern-generating');
+      this.container.classList.add('pattern-generated');
+      
+      // Track patterns created for badge progress
+      this.patternsCreated.add(this.currentPattern);
+      this.updateBadgeProgress();
+      
+      setTimeout(() => {
+        this.container.classList.remove('pattern-generated');
+      }, 300);
+    }, 100);
+  }
+  
+  createPattern() {
+    switch (this.currentPattern) {
+      case 'triangle':
+        return this.createTriangle();
+      case 'inverted-triangle':
+        return this.createInvertedTriangle();
+      case 'pyramid':
+        return this.createPyramid();
+      case 'diamond':
+        return this.createDiamond();
+      case 'multiplication':
+        return this.createMultiplicationTable();
+      default:
+        return this.createTriangle();
+    }
+  }
+  
+  createTriangle() {
+    let pattern = '';
+    let code = `#include <stdio.h>
+
+int main() {
+    // Right triangle pattern
+    for (int i = 1; i <= ${this.currentSize}; i++) {
+        for (int j = 1; j <= i; j++) {
+            printf("${this.currentChar} ");
+        }
+        printf("\\n");
+    }
+    return 0;
+}`;
+    
+    for (let i = 1; i <= this.currentSize; i++) {
+      for (let j = 1; j <= i; j++) {
+        pattern += this.currentChar + ' ';
+      }
+      pattern += '\n';
+    }
+    
+    return { pattern, code };
+  }
+  
+  createInvertedTriangle() {
+    let pattern = '';
+    let code = `#include <stdio.h>
+
+int main() {
+    // Inverted triangle pattern
+    for (int i = ${this.currentSize}; i >= 1; i--) {
+        for (int j = 1; j <= i; j++) {
+            printf("${this.currentChar} ");
+        }
+        printf("\\n");
+    }
+    return 0;
+}`;
+    
+    for (let i = this.currentSize; i >= 1; i--) {
+      for (let j = 1; j <= i; j++) {
+        pattern += this.currentChar + ' ';
+      }
+      pattern += '\n';
+    }
+    
+    return { pattern, code };
+  }
+  
+  createPyramid() {
+    let pattern = '';
+    let code = `#include <stdio.h>
+
+int main() {
+    // Pyramid pattern
+    for (int i = 1; i <= ${this.currentSize}; i++) {
+        // Print spaces
+        for (int j = 1; j <= ${this.currentSize} - i; j++) {
+            printf(" ");
+        }
+        // Print characters
+        for (int j = 1; j <= 2*i - 1; j++) {
+            printf("${this.currentChar}");
+        }
+        printf("\\n");
+    }
+    return 0;
+}`;
+    
+    for (let i = 1; i <= this.currentSize; i++) {
+      // Add spaces
+      for (let j = 1; j <= this.currentSize - i; j++) {
+        pattern += ' ';
+      }
+      // Add characters
+      for (let j = 1; j <= 2*i - 1; j++) {
+        pattern += this.currentChar;
+      }
+      pattern += '\n';
+    }
+    
+    return { pattern, code };
+  }
+  
+  createDiamond() {
+    let pattern = '';
+    let code = `#include <stdio.h>
+
+int main() {
+    // Diamond pattern
+    // Upper half
+    for (int i = 1; i <= ${this.currentSize}; i++) {
+        for (int j = 1; j <= ${this.currentSize} - i; j++) {
+            printf(" ");
+        }
+        for (int j = 1; j <= 2*i - 1; j++) {
+            printf("${this.currentChar}");
+        }
+        printf("\\n");
+    }
+    // Lower half
+    for (int i = ${this.currentSize - 1}; i >= 1; i--) {
+        for (int j = 1; j <= ${this.currentSize} - i; j++) {
+            printf(" ");
+        }
+        for (int j = 1; j <= 2*i - 1; j++) {
+            printf("${this.currentChar}");
+        }
+        printf("\\n");
+    }
+    return 0;
+}`;
+    
+    // Upper half
+    for (let i = 1; i <= this.currentSize; i++) {
+      for (let j = 1; j <= this.currentSize - i; j++) {
+        pattern += ' ';
+      }
+      for (let j = 1; j <= 2*i - 1; j++) {
+        pattern += this.currentChar;
+      }
+      pattern += '\n';
+    }
+    // Lower half
+    for (let i = this.currentSize - 1; i >= 1; i--) {
+      for (let j = 1; j <= this.currentSize - i; j++) {
+        pattern += ' ';
+      }
+      for (let j = 1; j <= 2*i - 1; j++) {
+        pattern += this.currentChar;
+      }
+      pattern += '\n';
+    }
+    
+    return { pattern, code };
+  }
+  
+  createMultiplicationTable() {
+    let pattern = '';
+    let code = `#include <stdio.h>
+
+int main() {
+    // Multiplication table
+    for (int i = 1; i <= ${this.currentSize}; i++) {
+        for (int j = 1; j <= ${this.currentSize}; j++) {
+            printf("%3d", i * j);
+        }
+        printf("\\n");
+    }
+    return 0;
+}`;
+    
+    for (let i = 1; i <= this.currentSize; i++) {
+      for (let j = 1; j <= this.currentSize; j++) {
+        const product = i * j;
+        pattern += product.toString().padStart(3, ' ');
+      }
+      pattern += '\n';
+    }
+    
+    return { pattern, code };
+  }
+  
+  copyCode() {
+    const codeElement = this.container.querySelector('#pattern-code-output');
+    if (codeElement) {
+      navigator.clipboard.writeText(codeElement.textContent).then(() => {
+        const copyBtn = this.container.querySelector('.copy-btn');
+        if (copyBtn) {
+          const originalText = copyBtn.innerHTML;
+          copyBtn.innerHTML = '✓ Copied!';
+          copyBtn.style.background = 'var(--good)';
+          
+          setTimeout(() => {
+            copyBtn.innerHTML = originalText;
+            copyBtn.style.background = 'var(--brand)';
+          }, 2000);
+        }
+      });
+    }
+  }
+  
+  updateBadgeProgress() {
+    const badgeItem = document.querySelector('[data-badge="pattern-artist"]');
+    if (badgeItem) {
+      const progressText = badgeItem.querySelector('.progress-text');
+      const count = this.patternsCreated.size;
+      
+      if (progressText) {
+        progressText.textContent = `${count}/5 patterns`;
+      }
+      
+      if (count >= 5) {
+        this.earnBadge('pattern-artist', 'Pattern Artist', 'Created 5 different patterns');
+        badgeItem.classList.add('earned');
+      }
+    }
+  }
+  
+  earnBadge(badgeId, name, description) {
+    // Same badge earning logic as other widgets
+    const badges = JSON.parse(localStorage.getItem('czh.badges') || '{}');
+    if (!badges[badgeId]) {
+      badges[badgeId] = {
+        id: badgeId,
+        name: name,
+        description: description,
+        earnedAt: new Date().toISOString(),
+        chapter: 'loops'
+      };
+      localStorage.setItem('czh.badges', JSON.stringify(badges));
+      
+      this.showBadgeNotification(name, description);
+    }
+  }
+  
+  showBadgeNotification(name, description) {
+    // Create and show badge notification
+    const notification = document.createElement('div');
+    notification.className = 'badge-notification';
+    notification.innerHTML = `
+      <div class="badge-notification-content">
+        <div class="badge-icon">🏆</div>
+        <div>
+          <strong>Badge Earned!</strong><br>
+          <em>${name}</em><br>
+          <small>${description}</small>
+        </div>
+      </div>
+    `;
+    
+    notification.style.cssText = `
+      position: fixed;
+      top: 20px;
+      right: 20px;
+      background: var(--good);
+      color: white;
+      padding: 1rem;
+      border-radius: var(--radius-lg);
+      box-shadow: var(--elev);
+      z-index: 10000;
+      animation: slideInRight 0.5s ease-out;
+    `;
+    
+    document.body.appendChild(notification);
+    
+    setTimeout(() => {
+      notification.remove();
+    }, 5000);
+  }
+}
+
+document.addEventListener('DOMContentLoaded', () => {
+  document.querySelectorAll('.pattern-generator').forEach(container => new PatternGeneratorWidget(container));
+});
@@ -0,0 +1,508 @@
+// Generated by tools/build_widgets.py from src/quiz.js - edit that file instead
+
+/**
+ * Lightweight Quiz Widget for C Programming Zero to Hero
+ * No dependencies, keyboard accessible, progress persistent
+ */
+
+class QuizWidget {
+  constructor(container) {
+    this.container = container;
+    this.quizId = container.dataset.quizId;
+    this.title = container.dataset.title || 'Quiz';
+    this.passMark = parseFloat(container.dataset.pass || '0.8');
+    this.data = null;
+    this.userAnswers = {};
+    this.isSubmitted = false;
+    this.score = 0;
+    
+    this.loadWhenVisible();
+  }
+  
+  // The question bank is a per-quiz shard built by tools/build_quizzes.py;
+  // fetch it only once the quiz is about to scroll into view
+  loadWhenVisible() {
+    if (!('IntersectionObserver' in window)) {
+      this.loadQuizData();
+      return;
+    }
+    
+    const observer = new IntersectionObserver((entries) => {
+      if (entries.some(entry => entry.isIntersecting)) {
+        observer.disconnect();
+        this.loadQuizData();
+      }
+    }, { rootMargin: '400px 0px' });
+    observer.observe(this.container);
+  }
+  
+  async loadQuizData() {
+    const src = this.container.dataset.quizSrc;
+    if (!src) {
+      console.warn('No data-quiz-src for quiz', this.quizId);
+      this.showUnavailable();
+      return;
+    }
+    
+    try {
+      const response = await fetch(src);
+      if (!response.ok) throw new Error(`HTTP ${response.status}`);
+      this.data = await response.json();
+    } catch (e) {
+      console.error('Could not load quiz', this.quizId, e);
+      this.showUnavailable();
+      return;
+    }
+    this.init();
+  }
+  
+  // Say why the quiz is empty instead of leaving a dead "Check answers" button
+  showUnavailable() {
+    const submitBtn = this.container.querySelector('.quiz-submit');
+    if (submitBtn) submitBtn.hidden = true;
+    const message = document.createElement('p');
+    message.className = 'quiz-unavailable';
+    message.setAttribute('role', 'status');
+    message.textContent = location.protocol === 'file:'
+      ? 'Quizzes can\'t load from a page opened as a file. Preview the site with python3 tools/serve_site.py instead.'
+      : 'This quiz couldn\'t be loaded. Check your connection and reload the page.';
+    const itemsList = this.container.querySelector('.quiz-items');
+    this.container.insertBefore(message, itemsList ? itemsList.nextSibling : null);
+  }
+  
+  init() {
+    this.setupEventListeners();
+    this.renderQuizItems();
+    this.loadProgress();
+    this.showBadgeIfEarned();
+  }
+  
+  renderQuizItems() {
+    const itemsList = this.container.querySelector('.quiz-items');
+    if (!itemsList) return;
+    
+    const items = this.data.shuffle ? this.shuffleArray([...this.data.items]) : this.data.items;
+    
+    itemsList.innerHTML = '';
+    items.forEach((item, index) => {
+      const li = document.createElement('li');
+      li.className = 'quiz-item';
+      li.innerHTML = this.renderQuizItem(item, index);
+      itemsList.appendChild(li);
+    });
+  }
+  
+  renderQuizItem(item, index) {
+    const questionId = `${this.quizId}-q${index}`;
+    const choices = item.choices.map((choice, choiceIndex) => {
+      const choiceId = `${questionId}-c${choiceIndex}`;
+      return `
+        <div class="quiz-choice">
+          <input type="radio" 
+                 id="${choiceId}" 
+                 name="${questionId}" 
+                 value="${choiceIndex}"
+                 aria-describedby="${questionId}-q">
+          <label for="${choiceId}">${this.escapeHtml(choice)}</label>
+        </div>
+      `;
+    }).join('');
+    
+    return `
+      <div class="quiz-question" id="${questionId}-q">${this.escapeHtml(item.q)}</div>
+      <div class="quiz-choices" role="radiogroup" aria-labelledby="${questionId}-q">
+        ${choices}
+      </div>
+      <div class="quiz-explanation" data-explanation="${index}">
+        <strong>Explanation:</strong> ${this.escapeHtml(item.explain)}
+      </div>
+    `;
+  }
+  
+  setupEventListeners() {
+    const submitBtn = this.container.querySelector('.quiz-submit');
+    if (submitBtn) {
+      submitBtn.addEventListener('click', () => this.handleSubmit());
+      
+      // Keyboard support
+      submitBtn.addEventListener('keydown', (e) => {
+        if (e.key === 'Enter' || e.key === ' ') {
+          e.preventDefault();
+          this.handleSubmit();
+        }
+      });
+    }
+    
+    // Track answers
+    this.container.addEventListener('change', (e) => {
+      if (e.target.type === 'radio') {
+        const questionIndex = this.getQuestionIndex(e.target.name);
+        this.userAnswers[questionIndex] = parseInt(e.target.value);
+        this.saveProgress();
+      }
+    });
+    
+    // Arrow key navigation within radio groups
+    this.container.addEventListener('keydown', (e) => {
+      if (e.target.type === 'radio' && (e.key === 'ArrowUp' || e.key === 'ArrowDown')) {
+        e.preventDefault();
+        this.navigateRadioGroup(e.target, e.key === 'ArrowDown');
+      }
+    });
+  }
+  
+  getQuestionIndex(name) {
+    return parseInt(name.split('-q')[1]);
+  }
+  
+  navigateRadioGroup(currentRadio, next) {
+    const radioGroup = currentRadio.closest('.quiz-choices');
+    const radios = Array.from(radioGroup.querySelectorAll('input[type="radio"]'));
+    const currentIndex = radios.indexOf(currentRadio);
+    
+    let newIndex;
+    if (next) {
+      newIndex = currentIndex + 1 >= radios.length ? 0 : currentIndex + 1;
+    } else {
+      newIndex = currentIndex - 1 < 0 ? radios.length - 1 : currentIndex - 1;
+    }
+    
+    radios[newIndex].focus();
+    radios[newIndex].checked = true;
+    radios[newIndex].dispatchEvent(new Event('change', { bubbles: true }));
+  }
+  
+  handleSubmit() {
+    if (this.isSubmitted) return;
+    
+    const totalQuestions = this.data.items.length;
+    const answeredQuestions = Object.keys(this.userAnswers).length;
+    
+    if (answeredQuestions < totalQuestions) {
+      alert(`Please answer all ${totalQuestions} questions before submitting.`);
+      return;
+    }
+    
+    this.isSubmitted = true;
+    this.gradeQuiz();
+    this.showResults();
+    this.saveProgress();
+    
+    // Disable further changes
+    const inputs = this.container.querySelectorAll('input[type="radio"]');
+    inputs.forEach(input => input.disabled = true);
+    
+    const submitBtn = this.container.querySelector('.quiz-submit');
+    if (submitBtn) {
+      submitBtn.disabled = true;
+      submitBtn.textContent = 'Submitted';
+    }
+  }
+  
+  gradeQuiz() {
+    let correct = 0;
+    
+    this.data.items.forEach((item, index) => {
+      const userAnswer = this.userAnswers[index];
+      const isCorrect = userAnswer === item.answer;
+      
+      if (isCorrect) correct++;
+      
+      // Visual feedback
+      const quizItem = this.container.querySelectorAll('.quiz-item')[index];
+      if (quizItem) {
+        quizItem.classList.add(isCorrect ? 'correct' : 'incorrect');
+        
+        // Show explanation
+        const explanation = quizItem.querySelector('.quiz-explanation');
+        if (explanation) {
+          explanation.classList.add('show');
+        }
+      }
+    });
+    
+    this.score = correct / this.data.items.length;
+  }
+  
+  showResults() {
+    const resultDiv = this.container.querySelector('.quiz-result');
+    if (!resultDiv) return;
+    
+    const percentage = Math.round(this.score * 100);
+    const passed = this.score >= this.passMark;
+    
+    resultDiv.className = `quiz-result show ${passed ? 'pass' : 'fail'}`;
+    resultDiv.innerHTML = `
+      <div class="quiz-score">Score: ${Math.round(this.score * this.data.items.length)}/${this.data.items.length} (${percentage}%)</div>
+      <div>${passed ? '🎉 Great job! You passed!' : '💪 Keep practicing and try again!'}</div>
+    `;
+    
+    // Focus result for screen readers
+    resultDiv.setAttribute('tabindex', '-1');
+    resultDiv.focus();
+    
+    // Show enhanced analytics
+    this.showAnalytics();
+    
+    if (passed) {
+      this.awardBadge();
+      this.showConfetti();
+    }
+  }
+  
+  awardBadge() {
+    const badgeDiv = this.container.querySelector('.quiz-badge');
+    if (badgeDiv) {
+      const badgeName = this.getBadgeName();
+      badgeDiv.textContent = `⭐ ${badgeName}`;
+      badgeDiv.hidden = false;
+      
+      // Save badge
+      this.saveBadge();
+      
+      // Update footer badge display
+      this.updateBadgeDisplay();
+    }
+  }
+  
+  getBadgeName() {
+    return this.data.badge || 'Quiz Badge';
+  }
+  
+  showConfetti() {
+    if (window.matchMedia('(prefers-reduced-motion: reduce)').matches) {
+      return; // Respect user preference
+    }
+    
+    const confettiContainer = document.createElement('div');
+    confettiContainer.className = 'confetti';
+    this.container.appendChild(confettiContainer);
+    
+    // Create confetti pieces
+    for (let i = 0; i < 15; i++) {
+      const piece = document.createElement('div');
+      piece.className = 'confetti-piece';
+      piece.style.left = Math.random() * 100 + '%';
+      piece.style.animationDelay = Math.random() * 0.3 + 's';
+      piece.style.animationDuration = (1.5 + Math.random() * 0.5) + 's';
+      confettiContainer.appendChild(piece);
+    }
+    
+    // Clean up after animation
+    setTimeout(() => {
+      confettiContainer.remove();
+    }, 2500);
+  }
+  
+  saveProgress() {
+    const progress = {
+      answers: this.userAnswers,
+      submitted: this.isSubmitted,
+      score: this.score,
+      timestamp: Date.now()
+    };
+    
+    localStorage.setItem(`czh.quiz.${this.quizId}`, JSON.stringify(progress));
+  }
+  
+  loadProgress() {
+    const saved = localStorage.getItem(`czh.quiz.${this.quizId}`);
+    if (!saved) return;
+    
+    try {
+      const progress = JSON.parse(saved);
+      this.userAnswers = progress.answers || {};
+      this.isSubmitted = progress.submitted || false;
+      this.score = progress.score || 0;
+      
+      // Restore UI state
+      Object.entries(this.userAnswers).forEach(([questionIndex, answerIndex]) => {
+        const radio = this.container.querySelector(`input[name="${this.quizId}-q${questionIndex}"][value="${answerIndex}"]`);
+        if (radio) radio.checked = true;
+      });
+      
+      if (this.isSubmitted) {
+        this.gradeQuiz();
+        this.showResults();
+        
+        // Disable inputs
+        const inputs = this.container.querySelectorAll('input[type="radio"]');
+        inputs.forEach(input => input.disabled = true);
+        
+        const submitBtn = this.container.querySelector('.quiz-submit');
+        if (submitBtn) {
+          submitBtn.disabled = true;
+          submitBtn.textContent = 'Submitted';
+        }
+      }
+    } catch (e) {
+      console.warn('Could not restore quiz progress:', e);
+    }
+  }
+  
+  saveBadge() {
+    const badges = this.getBadges();
+    badges[this.quizId] = {
+      name: this.getBadgeName(),
+      earned: Date.now(),
+      score: this.score
+    };
+    localStorage.setItem('czh.badges', JSON.stringify(badges));
+  }
+  
+  getBadges() {
+    try {
+      return JSON.parse(localStorage.getItem('czh.badges') || '{}');
+    } catch (e) {
+      return {};
+    }
+  }
+  
+  showBadgeIfEarned() {
+    const badges = this.getBadges();
+    if (badges[this.quizId]) {
+      const badgeDiv = this.container.querySelector('.quiz-badge');
+      if (badgeDiv) {
+        badgeDiv.textContent = `⭐ ${badges[this.quizId].name}`;
+        badgeDiv.hidden = false;
+      }
+    }
+  }
+  
+  updateBadgeDisplay() {
+    const badges = this.getBadges();
+    const badgeCount = Object.keys(badges).length;
+    
+    if (badgeCount > 0) {
+      // Add badge count to footer if it exists
+      const footer = document.querySelector('footer');
+      if (footer) {
+        let badgeDisplay = footer.querySelector('.badge-display');
+        if (!badgeDisplay) {
+          badgeDisplay = document.createElement('div');
+          badgeDisplay.className = 'badge-display';
+          footer.appendChild(badgeDisplay);
+        }
+        
+        const badgeNames = Object.values(badges).map(b => b.name).join(', ');
+        badgeDisplay.innerHTML = `<small>🏆 Earned badges (${badgeCount}): ${badgeNames}</small>`;
+      }
+    }
+  }
+  
+  shuffleArray(array) {
+    for (let i = array.length - 1; i > 0; i--) {
+      const j = Math.floor(Math.random() * (i + 1));
+      [array[i], array[j]] = [array[j], array[i]];
+    }
+    return array;
+  }
+  
+  escapeHtml(unsafe) {
+    return unsafe
+      .replace(/&/g, "&amp;")
+      .replace(/</g, "&lt;")
+      .replace(/>/g, "&gt;")
+      .replace(/"/g, "&quot;")
+      .replace(/'/g, "&#039;");
+  }
+
+  showAnalytics() {
+    const analyticsContainer = document.getElementById('quiz-analytics');
+    if (!analyticsContainer) return;
+    
+    // Calculate topic-based performance
+    const topicScores = this.calculateTopicScores();
+    
+    // Update performance breakdown
+    this.updatePerformanceBreakdown(topicScores);
+    
+    // Generate suggestions
+    this.generateImprovementSuggestions(topicScores);
+    
+    // Show analytics with animation
+    analyticsContainer.style.display = 'block';
+    setTimeout(() => {
+      analyticsContainer.scrollIntoView({ behavior: 'smooth', block: 'center' });
+    }, 500);
+  }
+
+  calculateTopicScores() {
+    const topics = {};
+    (this.data.topics || []).forEach(topic => {
+      topics[topic.name] = { correct: 0, total: 0 };
+    });
+    
+    // Each question's topic is precomputed in the quiz shard
+    this.data.items.forEach((item, index) => {
+      const score = topics[item.topic];
+      if (!score) return;
+      score.total++;
+      if (this.userAnswers[index] === item.answer) score.correct++;
+    });
+    
+    return topics;
+  }
+
+  updatePerformanceBreakdown(topicScores) {
+    const performanceElements = document.querySelectorAll('.topic-performance');
+    
+    Object.entries(topicScores).forEach(([topic, score], index) => {
+      if (performanceElements[index]) {
+        const scoreValue = performanceElements[index].querySelector('.score-value');
+        const progressFill = performanceElements[index].querySelector('.progress-fill');
+        
+        const percentage = score.total > 0 ? Math.round((score.correct / score.total) * 100) : 0;
+        
+        if (scoreValue && progressFill) {
+          scoreValue.textContent = `${percentage}%`;
+          progressFill.style.width = `${percentage}%`;
+          
+          // Update color classes
+          scoreValue.className = 'score-value';
+          progressFill.className = 'progress-fill';
+          
+          if (percentage >= 80) {
+            scoreValue.classList.add('good');
+            progressFill.classList.add('good');
+          } else if (percentage >= 60) {
+            scoreValue.classList.add('medium');
+            progressFill.classList.add('medium');
+          } else {
+            scoreValue.classList.add('needs-work');
+            progressFill.classList.add('needs-work');
+          }
+        }
+      }
+    });
+  }
+
+  generateImprovementSuggestions(topicScores) {
+    const suggestionsList = document.querySelector('.suggestions-list');
+    if (!suggestionsList) return;
+    
+    const suggestions = [];
+    const advice = {};
+    (this.data.topics || []).forEach(topic => {
+      advice[topic.name] = topic.advice;
+    });
+    
+    Object.entries(topicScores).forEach(([topic, score]) => {
+      const percentage = score.total > 0 ? Math.round((score.correct / score.total) * 100) : 0;
+      
+      if (percentage < 80 && advice[topic]) {
+        suggestions.push(advice[topic]);
+      }
+    });
+    
+    if (suggestions.length === 0) {
+      suggestions.push('Excellent work! You\'ve mastered all the topics. Try the Memory Visualizer above for more practice!');
+    }
+    
+    suggestionsList.innerHTML = suggestions.map(suggestion => `<li>${suggestion}</li>`).join('');
+  }
+}
+
+document.addEventListener('DOMContentLoaded', () => {
+  document.querySelectorAll('.quiz').forEach(container => new QuizWidget(container));
+});
@@ -0,0 +1,118 @@
+// Generated by tools/build_widgets.py from src/quiz.js - edit that file instead
+
+/**
+ * Interactive Timeline Widget
+ * Handles timeline navigation and animations
+ */
+class TimelineWidget {
+  constructor(container) {
+    this.container = container;
+    this.items = container.querySelectorAll('.timeline-item');
+    this.currentIndex = 0;
+    this.prevBtn = container.querySelector('[data-action="prev"]');
+    this.nextBtn = container.querySelector('[data-action="next"]');
+    this.progress = container.querySelector('.timeline-progress');
+    
+    if (this.items.length > 0) {
+      this.init();
+    }
+  }
+  
+  init() {
+    this.updateDisplay();
+    this.setupEventListeners();
+  }
+  
+  setupEventListeners() {
+    if (this.prevBtn) {
+      this.prevBtn.addEventListener('click', () => this.previous());
+    }
+    
+    if (this.nextBtn) {
+      this.nextBtn.addEventListener('click', () => this.next());
+    }
+    
+    // Keyboard navigation
+    document.addEventListener('keydown', (e) => {
+      if (this.isTimelineVisible()) {
+        if (e.key === 'ArrowLeft') {
+          e.preventDefault();
+          this.previous();
+        } else if (e.key === 'ArrowRight') {
+          e.preventDefault();
+          this.next();
+        }
+      }
+    });
+    
+    // Auto-advance every 10 seconds (optional)
+    // this.autoAdvanceTimer = setInterval(() => {
+    //   if (this.currentIndex < this.items.length - 1) {
+    //     this.next();
+    //   }
+    // }, 10000);
+  }
+  
+  isTimelineVisible() {
+    const rect = this.container.getBoundingClientRect();
+    return rect.top < window.innerHeight && rect.bottom > 0;
+  }
+  
+  previous() {
+    if (this.currentIndex > 0) {
+      this.currentIndex--;
+      this.updateDisplay();
+    }
+  }
+  
+  next() {
+    if (this.currentIndex < this.items.length - 1) {
+      this.currentIndex++;
+      this.updateDisplay();
+    }
+  }
+  
+  updateDisplay() {
+    // Update active item
+    this.items.forEach((item, index) => {
+      item.classList.remove('active', 'animating');
+      
+      if (index === this.currentIndex) {
+        item.classList.add('active');
+        setTimeout(() => item.classList.add('animating'), 50);
+      }
+    });
+    
+    // Update progress
+    if (this.progress) {
+      this.progress.textContent = `${this.currentIndex + 1} / ${this.items.length}`;
+    }
+    
+    // Update button states
+    if (this.prevBtn) {
+      this.prevBtn.disabled = this.currentIndex === 0;
+    }
+    
+    if (this.nextBtn) {
+      this.nextBtn.disabled = this.currentIndex === this.items.length - 1;
+    }
+    
+    // Accessibility
+    this.items[this.currentIndex].setAttribute('aria-current', 'step');
+    this.items.forEach((item, index) => {
+      if (index !== this.currentIndex) {
+        item.removeAttribute('aria-current');
+      }
+    });
+  }
+  
+  destroy() {
+    if (this.autoAdvanceTimer) {
+      clearInterval(this.autoAdvanceTimer);
+    }
+  }
+}
+
+document.addEventListener('DOMContentLoaded', () => {
+  document.querySelectorAll('.timeline-container').forEach(container => new TimelineWidget(container));
+});
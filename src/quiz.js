@@ -9,29 +9,63 @@ class QuizWidget {
     this.quizId = container.dataset.quizId;
     this.title = container.dataset.title || 'Quiz';
     this.passMark = parseFloat(container.dataset.pass || '0.8');
-    this.data = this.loadQuizData();
+    this.data = null;
     this.userAnswers = {};
     this.isSubmitted = false;
     this.score = 0;
     
-    if (this.data) {
-      this.init();
+    this.loadWhenVisible();
+  }
+  
+  // The question bank is a per-quiz shard built by tools/build_quizzes.py;
+  // fetch it only once the quiz is about to scroll into view
+  loadWhenVisible() {
+    if (!('IntersectionObserver' in window)) {
+      this.loadQuizData();
+      return;
     }
+    
+    const observer = new IntersectionObserver((entries) => {
+      if (entries.some(entry => entry.isIntersecting)) {
+        observer.disconnect();
+        this.loadQuizData();
+      }
+    }, { rootMargin: '400px 0px' });
+    observer.observe(this.container);
   }
   
-  loadQuizData() {
-    const dataScript = this.container.parentNode.querySelector('script.quiz-data');
-    if (!dataScript) {
-      console.warn('Quiz data script not found for', this.quizId);
-      return null;
+  async loadQuizData() {
+    const src = this.container.dataset.quizSrc;
+    if (!src) {
+      console.warn('No data-quiz-src for quiz', this.quizId);
+      this.showUnavailable();
+      return;
     }
     
     try {
-      return JSON.parse(dataScript.textContent);
+      const response = await fetch(src);
+      if (!response.ok) throw new Error(`HTTP ${response.status}`);
+      this.data = await response.json();
     } catch (e) {
-      console.error('Invalid quiz data JSON:', e);
-      return null;
+      console.error('Could not load quiz', this.quizId, e);
+      this.showUnavailable();
+      return;
     }
+    this.init();
+  }
+  
+  // Say why the quiz is empty instead of leaving a dead "Check answers" button
+  showUnavailable() {
+    const submitBtn = this.container.querySelector('.quiz-submit');
+    if (submitBtn) submitBtn.hidden = true;
+    const message = document.createElement('p');
+    message.className = 'quiz-unavailable';
+    message.setAttribute('role', 'status');
+    message.textContent = location.protocol === 'file:'
+      ? 'Quizzes can\'t load from a page opened as a file. Preview the site with python3 tools/serve_site.py instead.'
+      : 'This quiz couldn\'t be loaded. Check your connection and reload the page.';
+    const itemsList = this.container.querySelector('.quiz-items');
+    this.container.insertBefore(message, itemsList ? itemsList.nextSibling : null);
   }
   
   init() {
@@ -230,26 +264,7 @@ class QuizWidget {
   }
   
   getBadgeName() {
-    const titleMap = {
-      'basics': 'Basics Badge',
-      'intro': 'Introduction Badge',
-      'control': 'Control Flow Badge',
-      'loops': 'Loops Badge',
-      'arrays': 'Arrays Badge',
-      'functions': 'Functions Badge',
-      'pointers': 'Pointers Badge',
-      'structures': 'Structures Badge',
-      'files': 'Files Badge',
-      'algorithms': 'Algorithms Badge'
-    };
-    
-    for (const [key, name] of Object.entries(titleMap)) {
-      if (this.quizId.toLowerCase().includes(key)) {
-        return name;
-      }
-    }
-    
-    return 'Quiz Badge';
+    return this.data.badge || 'Quiz Badge';
   }
   
   showConfetti() {
@@ -411,33 +426,17 @@ class QuizWidget {
   }
 
   calculateTopicScores() {
-    const topics = {
-      'Variable Declaration': { correct: 0, total: 0 },
-      'Format Specifiers': { correct: 0, total: 0 },
-      'I/O Operations': { correct: 0, total: 0 },
-      'Syntax Rules': { correct: 0, total: 0 }
-    };
+    const topics = {};
+    (this.data.topics || []).forEach(topic => {
+      topics[topic.name] = { correct: 0, total: 0 };
+    });
     
-    // Map questions to topics based on content
+    // Each question's topic is precomputed in the quiz shard
     this.data.items.forEach((item, index) => {
-      const question = item.q.toLowerCase();
-      const userAnswer = this.userAnswers[index];
-      const isCorrect = userAnswer === item.answer;
-      
-      // Simple keyword-based categorization
-      if (question.includes('variable') || question.includes('declaration') || question.includes('identifier')) {
-        topics['Variable Declaration'].total++;
-        if (isCorrect) topics['Variable Declaration'].correct++;
-      } else if (question.includes('format') || question.includes('%') || question.includes('specifier')) {
-        topics['Format Specifiers'].total++;
-        if (isCorrect) topics['Format Specifiers'].correct++;
-      } else if (question.includes('scanf') || question.includes('printf') || question.includes('&')) {
-        topics['I/O Operations'].total++;
-        if (isCorrect) topics['I/O Operations'].correct++;
-      } else {
-        topics['Syntax Rules'].total++;
-        if (isCorrect) topics['Syntax Rules'].correct++;
-      }
+      const score = topics[item.topic];
+      if (!score) return;
+      score.total++;
+      if (this.userAnswers[index] === item.answer) score.correct++;
     });
     
     return topics;
@@ -481,25 +480,16 @@ class QuizWidget {
     if (!suggestionsList) return;
     
     const suggestions = [];
+    const advice = {};
+    (this.data.topics || []).forEach(topic => {
+      advice[topic.name] = topic.advice;
+    });
     
     Object.entries(topicScores).forEach(([topic, score]) => {
       const percentage = score.total > 0 ? Math.round((score.correct / score.total) * 100) : 0;
       
-      if (percentage < 80) {
-        switch (topic) {
-          case 'Variable Declaration':
-            suggestions.push('Review variable naming rules and declaration syntax');
-            break;
-          case 'Format Specifiers':
-            suggestions.push('Practice format specifiers - remember %d for int, %f for float, %c for char');
-            break;
-          case 'I/O Operations':
-            suggestions.push('Focus on scanf usage - don\'t forget the & for addresses!');
-            break;
-          case 'Syntax Rules':
-            suggestions.push('Review C syntax fundamentals and common programming patterns');
-            break;
-        }
+      if (percentage < 80 && advice[topic]) {
+        suggestions.push(advice[topic]);
       }
     });
     
@@ -1694,138 +1684,33 @@ function initializeLoopsQuiz() {
   const quizSection = document.querySelector('#loops-quiz');
   if (!quizSection) return;
   
-  const quizQuestions = [
-    {
-      id: 1,
-      question: "What happens first in a for loop?",
-      type: "multiple-choice",
-      topic: "for-loops",
-      options: [
-        "The condition is checked",
-        "The initialization statement runs",
-        "The update statement runs", 
-        "The loop body executes"
-      ],
-      correct: 1,
-      explanation: "In a for loop, the initialization statement runs first, only once at the beginning."
-    },
-    {
-      id: 2, 
-      question: "How many times will this loop run?\n\nfor (int i = 1; i <= 10; i++) {\n    printf(\"%d \", i);\n}",
-      type: "multiple-choice",
-      topic: "for-loops",
-      options: ["9 times", "10 times", "11 times", "Infinite times"],
-      correct: 1,
-      explanation: "The loop runs while i <= 10, starting from i=1, so it runs exactly 10 times (1,2,3,4,5,6,7,8,9,10)."
-    },
-    {
-      id: 3,
-      question: "What's the main difference between while and do-while loops?",
-      type: "multiple-choice", 
-      topic: "while-loops",
-      options: [
-        "while is faster than do-while",
-        "do-while executes at least once, while may not execute at all",
-        "while can only use integer conditions",
-        "There is no difference"
-      ],
-      correct: 1,
-      explanation: "do-while executes the body first, then checks the condition, so it always runs at least once."
-    },
-    {
-      id: 4,
-      question: "What will this code output?\n\nint i = 5;\nwhile (i > 0) {\n    printf(\"%d \", i);\n    i--;\n}",
-      type: "multiple-choice",
-      topic: "while-loops", 
-      options: [
-        "5 4 3 2 1",
-        "5 4 3 2 1 0", 
-        "1 2 3 4 5",
-        "Infinite loop"
-      ],
-      correct: 0,
-      explanation: "The loop starts with i=5 and decrements until i=0, printing 5 4 3 2 1."
-    },
-    {
-      id: 5,
-      question: "What does the 'break' statement do in a loop?", 
-      type: "multiple-choice",
-      topic: "break-continue",
-      options: [
-        "Skips the current iteration and continues with the next",
-        "Pauses the loop for a specified time",
-        "Immediately exits the loop entirely", 
-        "Restarts the loop from the beginning"
-      ],
-      correct: 2,
-      explanation: "The 'break' statement immediately terminates the loop and continues execution after the loop."
-    },
-    {
-      id: 6,
-      question: "What does the 'continue' statement do in a loop?",
-      type: "multiple-choice",
-      topic: "break-continue", 
-      options: [
-        "Exits the loop immediately",
-        "Skips the rest of the current iteration and moves to the next iteration",
-        "Repeats the current iteration",
-        "Pauses the loop execution"
-      ],
-      correct: 1,
-      explanation: "The 'continue' statement skips the remaining code in the current iteration and jumps to the next iteration."
-    },
-    {
-      id: 7,
-      question: "In nested loops, how many total iterations occur?\n\nfor (int i = 1; i <= 3; i++) {\n    for (int j = 1; j <= 4; j++) {\n        printf(\"*\");\n    }\n}",
-      type: "multiple-choice",
-      topic: "nested-loops",
-      options: ["7 iterations", "12 iterations", "3 iterations", "4 iterations"],
-      correct: 1, 
-      explanation: "Outer loop runs 3 times, inner loop runs 4 times for each outer iteration: 3 × 4 = 12 total iterations."
-    },
-    {
-      id: 8,
-      question: "Which loop type is best for input validation?",
-      type: "multiple-choice",
-      topic: "while-loops",
-      options: [
-        "for loop - because it has a built-in counter",
-        "while loop - because you don't know how many attempts are needed", 
-        "do-while loop - because it always validates at least once",
-        "All loops are equally good for validation"
-      ],
-      correct: 1,
-      explanation: "while loops are ideal for input validation because you repeat until valid input is received, and you don't know how many attempts that will take."
-    },
-    {
-      id: 9,
-      question: "What will happen with this code?\n\nfor (int i = 0; i < 5; i++)\n    printf(\"%d \", i);\n    printf(\"Done\");",
-      type: "multiple-choice",
-      topic: "for-loops",
-      options: [
-        "Prints: 0 1 2 3 4 Done",
-        "Prints: 0 1 2 3 4 Done Done Done Done Done",
-        "Syntax error",
-        "Infinite loop"
-      ],
-      correct: 0,
-      explanation: "Without braces, only the first printf is in the loop body. The second printf executes once after the loop completes."
-    },
-    {
-      id: 10,
-      question: "How do you create an infinite loop in C?",
-      type: "multiple-choice", 
-      topic: "while-loops",
-      options: [
-        "for (;;) or while(1)",
-        "while(0)",
-        "for(int i=0; i<10; i--)",
-        "You cannot create infinite loops in C"
-      ],
-      correct: 0,
-      explanation: "for(;;) or while(1) creates infinite loops. while(1) uses a condition that's always true, and for(;;) has empty initialization, condition, and update."
-    }
-  ];
+  // Questions, topics and badge thresholds come from the quiz shard built by
+  // tools/build_quizzes.py, fetched when the quiz is first started
+  let quiz = null;
+  let quizQuestions = [];
+  
+  async function loadQuiz() {
+    if (quiz) return true;
+    try {
+      const response = await fetch(quizSection.dataset.quizSrc);
+      if (!response.ok) throw new Error(`HTTP ${response.status}`);
+      quiz = await response.json();
+    } catch (e) {
+      console.error('Could not load quiz', quizSection.dataset.quizId, e);
+      // Shown where the questions would be; Start stays, to try again
+      questionsContainer.innerHTML = '';
+      const message = document.createElement('p');
+      message.className = 'quiz-unavailable';
+      message.setAttribute('role', 'status');
+      message.textContent = location.protocol === 'file:'
+        ? 'Quizzes can\'t load from a page opened as a file. Preview the site with python3 tools/serve_site.py instead.'
+        : 'This quiz couldn\'t be loaded. Check your connection and press Start Quiz to try again.';
+      questionsContainer.appendChild(message);
+      return false;
+    }
+    quizQuestions = quiz.items;
+    return true;
+  }
   
   // Set up enhanced quiz functionality
   const startBtn = quizSection.querySelector('#start-quiz');
@@ -1839,7 +1724,8 @@ function initializeLoopsQuiz() {
   let userAnswers = {};
   let quizStarted = false;
   
-  function startQuiz() {
+  async function startQuiz() {
+    if (!(await loadQuiz())) return;
     quizStarted = true;
     currentQuestion = 0;
     userAnswers = {};
@@ -1865,9 +1751,9 @@ function initializeLoopsQuiz() {
           <span class="question-number">Question ${index + 1} of ${quizQuestions.length}</span>
           <span class="question-topic">${question.topic.replace('-', ' ').toUpperCase()}</span>
         </div>
-        <h3 class="question-text">${question.question.replace(/\n/g, '<br>')}</h3>
+        <h3 class="question-text">${question.q.replace(/\n/g, '<br>')}</h3>
         <div class="options-container">
-          ${question.options.map((option, i) => `
+          ${question.choices.map((option, i) => `
             <label class="option-label">
               <input type="radio" name="question-${question.id}" value="${i}" class="option-input">
               <span class="option-text">${option}</span>
@@ -1918,7 +1804,7 @@ function initializeLoopsQuiz() {
     
     quizQuestions.forEach(question => {
       const userAnswer = userAnswers[question.id];
-      const isCorrect = userAnswer === question.correct;
+      const isCorrect = userAnswer === question.answer;
       
       if (isCorrect) correct++;
       
@@ -2001,24 +1887,10 @@ function initializeLoopsQuiz() {
   function generateRecommendations(results) {
     const recommendations = [];
     
-    Object.entries(results.topicScores).forEach(([topic, scores]) => {
-      const percentage = (scores.correct / scores.total) * 100;
-      
-      if (percentage < 60) {
-        switch (topic) {
-          case 'for-loops':
-            recommendations.push('Review for loop syntax and initialization → condition → update pattern');
-            break;
-          case 'while-loops':
-            recommendations.push('Practice while loop condition checking and preventing infinite loops');
-            break;
-          case 'break-continue':
-            recommendations.push('Study the difference between break (exit loop) and continue (skip iteration)');
-            break;
-          case 'nested-loops':
-            recommendations.push('Work through nested loop examples step by step to understand iteration counts');
-            break;
-        }
+    quiz.topics.forEach(topic => {
+      const scores = results.topicScores[topic.name];
+      if (scores && (scores.correct / scores.total) * 100 < 60 && topic.advice) {
+        recommendations.push(topic.advice);
       }
     });
     
@@ -2039,73 +1911,22 @@ function initializeLoopsQuiz() {
     const badges = JSON.parse(localStorage.getItem('czh.badges') || '{}');
     let newBadges = false;
     
-    // Loop Beginner Badge
-    if (!badges['loop-beginner']) {
-      badges['loop-beginner'] = {
-        id: 'loop-beginner',
-        name: 'Loop Beginner',
-        description: 'Completed first loop quiz',
-        earnedAt: new Date().toISOString(),
-        chapter: 'loops'
-      };
-      newBadges = true;
-      showBadgeNotification('Loop Beginner', 'Completed first loop quiz');
-    }
-    
-    // For Loop Master Badge
-    const forLoopScore = results.topicScores['for-loops'];
-    if (forLoopScore && (forLoopScore.correct / forLoopScore.total) >= 0.8 && !badges['for-master']) {
-      badges['for-master'] = {
-        id: 'for-master',
-        name: 'For Loop Master',
-        description: 'Scored 80%+ on for loop questions',
-        earnedAt: new Date().toISOString(),
-        chapter: 'loops'
-      };
-      newBadges = true;
-      showBadgeNotification('For Loop Master', 'Scored 80%+ on for loop questions');
-    }
-    
-    // While Loop Wizard Badge
-    const whileLoopScore = results.topicScores['while-loops'];
-    if (whileLoopScore && (whileLoopScore.correct / whileLoopScore.total) >= 0.8 && !badges['while-wizard']) {
-      badges['while-wizard'] = {
-        id: 'while-wizard',
-        name: 'While Loop Wizard',
-        description: 'Scored 80%+ on while loop questions',
-        earnedAt: new Date().toISOString(),
-        chapter: 'loops'
-      };
-      newBadges = true;
-      showBadgeNotification('While Loop Wizard', 'Scored 80%+ on while loop questions');
-    }
-    
-    // Nested Loop Ninja Badge
-    const nestedLoopScore = results.topicScores['nested-loops'];
-    if (nestedLoopScore && (nestedLoopScore.correct / nestedLoopScore.total) >= 0.8 && !badges['nested-ninja']) {
-      badges['nested-ninja'] = {
-        id: 'nested-ninja', 
-        name: 'Nested Loop Ninja',
-        description: 'Scored 80%+ on nested loop questions',
-        earnedAt: new Date().toISOString(),
-        chapter: 'loops'
-      };
-      newBadges = true;
-      showBadgeNotification('Nested Loop Ninja', 'Scored 80%+ on nested loop questions');
-    }
-    
-    // Loop Legend Badge (perfect score)
-    if (results.score === 100 && !badges['loop-legend']) {
-      badges['loop-legend'] = {
-        id: 'loop-legend',
-        name: 'Loop Legend', 
-        description: 'Perfect score on loops quiz',
+    // Each badge needs a score of at least its threshold, on its topic or (with no topic) the whole quiz
+    quiz.badges.forEach(badge => {
+      if (badges[badge.id]) return;
+      const scores = badge.topic ? results.topicScores[badge.topic] : results;
+      if (!scores || scores.correct / scores.total < badge.threshold) return;
+      
+      badges[badge.id] = {
+        id: badge.id,
+        name: badge.name,
+        description: badge.description,
         earnedAt: new Date().toISOString(),
         chapter: 'loops'
       };
       newBadges = true;
-      showBadgeNotification('Loop Legend', 'Perfect score on loops quiz');
-    }
+      showBadgeNotification(badge.name, badge.description);
+    });
     
     if (newBadges) {
       localStorage.setItem('czh.badges', JSON.stringify(badges));
@@ -2239,25 +2060,6 @@ document.addEventListener('DOMContentLoaded', () => {
   if (window.location.pathname.includes('04-loops.html')) {
     initializeLoopsQuiz();
   }
-  
-  // Show existing badges in footer on page load
-  const badges = JSON.parse(localStorage.getItem('czh.badges') || '{}');
-  if (Object.keys(badges).length > 0) {
-    const footer = document.querySelector('footer');
-    if (footer) {
-      let badgeDisplay = footer.querySelector('.badge-display');
-      if (!badgeDisplay) {
-        badgeDisplay = document.createElement('div');
-        badgeDisplay.className = 'badge-display';
-        badgeDisplay.style.marginTop = '1rem';
-        footer.appendChild(badgeDisplay);
-      }
-      
-      const badgeCount = Object.keys(badges).length;
-      const badgeNames = Object.values(badges).map(b => b.name).join(', ');
-      badgeDisplay.innerHTML = `<small style="color: var(--muted);">🏆 Earned badges (${badgeCount}): ${badgeNames}</small>`;
-    }
-  }
 });
 
 // Export for potential external use
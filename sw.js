@@ -0,0 +1,86 @@
+// C Programming Zero to Hero - Service Worker
+//
+// Precaches the pages and assets listed in precache-manifest.json (written
+// by tools/build_precache.py, which also stamps PRECACHE_VERSION below so
+// browsers see a changed worker on every deploy that changes a file) and
+// serves them cache-first, so pages open offline and shared assets aren't
+// refetched on every navigation.
+//
+// Each version gets its own cache. Installing a new version copies every
+// entry whose content hash is unchanged from the previous cache and fetches
+// only the changed ones; the old cache is dropped once the new worker takes
+// over.
+
+const PRECACHE_VERSION = 'e042f7bad4631aa8';
+const CACHE_PREFIX = 'czh-precache-';
+const CACHE_NAME = CACHE_PREFIX + PRECACHE_VERSION;
+// Stored in each cache under this URL: the manifest its entries came from
+const MANIFEST_URL = new URL('precache-manifest.json', self.location).href;
+
+function entryUrl(path) {
+  return new URL(path, self.location).href;
+}
+
+// The manifest and cache of the version installed before this one, if any
+async function previousVersion() {
+  for (const name of await caches.keys()) {
+    if (!name.startsWith(CACHE_PREFIX) || name === CACHE_NAME) continue;
+    const cache = await caches.open(name);
+    const response = await cache.match(MANIFEST_URL);
+    if (response) {
+      return { cache, entries: (await response.json()).entries || {} };
+    }
+  }
+  return { cache: null, entries: {} };
+}
+
+async function precache() {
+  const response = await fetch(`${MANIFEST_URL}?v=${PRECACHE_VERSION}`, { cache: 'no-cache' });
+  if (!response.ok) throw new Error(`Precache manifest unavailable: ${response.status}`);
+  const manifest = await response.clone().json();
+  const cache = await caches.open(CACHE_NAME);
+  const previous = await previousVersion();
+
+  await Promise.all(Object.entries(manifest.entries).map(async ([path, hash]) => {
+    const url = entryUrl(path);
+    if (previous.cache && previous.entries[path] === hash) {
+      const cached = await previous.cache.match(url);
+      if (cached) return cache.put(url, cached);
+    }
+    // Changed or new: revalidate with the server rather than trusting the HTTP cache
+    const fresh = await fetch(url, { cache: 'no-cache' });
+    if (!fresh.ok) throw new Error(`Cannot precache ${path}: ${fresh.status}`);
+    return cache.put(url, fresh);
+  }));
+  // Written last, so a cache holding the manifest holds all of its entries
+  await cache.put(MANIFEST_URL, response);
+}
+
+self.addEventListener('install', event => {
+  event.waitUntil(precache().then(() => self.skipWaiting()));
+});
+
+self.addEventListener('activate', event => {
+  event.waitUntil(caches.keys()
+    .then(names => Promise.all(names
+      .filter(name => name.startsWith(CACHE_PREFIX) && name !== CACHE_NAME)
+      .map(name => caches.delete(name))))
+    .then(() => self.clients.claim()));
+});
+
+self.addEventListener('fetch', event => {
+  const request = event.request;
+  const url = new URL(request.url);
+  if (request.method !== 'GET' || url.origin !== self.location.origin) return;
+
+  // Navigations ignore the query string and map directories to their index.html
+  const navigate = request.mode === 'navigate';
+  url.hash = '';
+  if (navigate) {
+    url.search = '';
+    if (url.pathname.endsWith('/')) url.pathname += 'index.html';
+  }
+  event.respondWith(caches.open(CACHE_NAME)
+    .then(cache => cache.match(url.href))
+    .then(cached => cached || fetch(request)));
+});
@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+Audit rules for C Programming Zero to Hero
+The per-page checks run by site_audit.py's HTMLValidator. Every rule
+subscribes to the parser events it needs and the validator feeds all of
+them from one parse of each page, keeping the stack of open elements so a
+rule can ask "am I inside an <h2>?" instead of tracking state itself.
+
+A rule is a Rule subclass with:
+
+- ``tags``: start/end tags it receives (None = every tag)
+- ``text_in``: text is delivered while one of these elements is open
+  (None = all text)
+- ``start(page, tag, attrs)``, ``end(page, tag)``, ``text(page, data)``,
+  ``decl(page, decl)`` and ``finish(page)`` hooks; only overridden hooks
+  are called
+- ``complete``: True once the rule has seen everything it needs, so
+  --structure-only can stop reading a page early
+- ``applies(context)``: whether the rule runs on a page at all
+
+``page`` is the HTMLValidator: ``page.stack`` holds the open elements as
+(tag, attrs) pairs, ``page.inside(tag)`` says whether a tag is open,
+``page.line`` is the current source line and ``page.data`` the file data
+handed to the cross-page checks. Findings go
+through ``self.report()``. To add a check, write a rule and list it in
+DEFAULT_RULES; the audit still makes a single pass over each page.
+"""
+
+from collections import namedtuple
+
+from critical_css import defined_classes
+from near_duplicates import signature
+
+# What a rule knows about the page it checks; accepted_* are the CSS/JS
+# hrefs a page may use (original or fingerprinted), expected_* the ones
+# reported when both are missing
+RuleContext = namedtuple('RuleContext', 'file_path structure_only accepted_css accepted_js expected_css expected_js')
+
+HEADING_TAGS = {'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
+
+
+class Rule:
+    """Base class for audit rules; see the module docstring"""
+
+    tags = None
+    text_in = None
+    complete = True
+
+    def __init__(self, context):
+        self.context = context
+        # (code, severity, line, message)
+        self.issues = []
+
+    @classmethod
+    def applies(cls, context):
+        return True
+
+    def report(self, code, message, line=None, severity='error'):
+        self.issues.append((code, severity, line, message))
+
+    def start(self, page, tag, attrs):
+        pass
+
+    def end(self, page, tag):
+        pass
+
+    def text(self, page, data):
+        pass
+
+    def decl(self, page, decl):
+        pass
+
+    def finish(self, page):
+        pass
+
+
+class StructureRule(Rule):
+    """DOCTYPE, <html lang>, one <h1> and the header/sidebar/main/footer landmarks"""
+
+    tags = {'html', 'h1', 'header', 'nav', 'main', 'footer'}
+    FLAGS = ('has_doctype', 'has_html_lang', 'has_header', 'has_nav_sidebar', 'has_main', 'has_footer')
+
+    def __init__(self, context):
+        super().__init__(context)
+        for flag in self.FLAGS:
+            setattr(self, flag, False)
+        self.h1_count = 0
+
+    @property
+    def complete(self):
+        return all(getattr(self, flag) for flag in self.FLAGS)
+
+    def decl(self, page, decl):
+        if decl.lower().startswith('doctype html'):
+            self.has_doctype = True
+
+    def start(self, page, tag, attrs):
+        if tag == 'html':
+            self.has_html_lang = self.has_html_lang or 'lang' in attrs
+        elif tag == 'h1':
+            self.h1_count += 1
+        elif tag == 'header':
+            self.has_header = True
+        elif tag == 'nav':
+            self.has_nav_sidebar = self.has_nav_sidebar or 'sidebar' in (attrs.get('class') or '')
+        elif tag == 'main':
+            self.has_main = True
+        elif tag == 'footer':
+            self.has_footer = True
+
+    def finish(self, page):
+        if not self.has_doctype:
+            self.report('missing-doctype', "Missing DOCTYPE html")
+        if not self.has_html_lang:
+            self.report('missing-lang', "Missing <html lang='en'>")
+        if not self.context.structure_only and self.h1_count != 1:
+            self.report('h1-count', f"Expected 1 <h1>, found {self.h1_count}")
+        if not self.has_header:
+            self.report('missing-header', "Missing <header>")
+        if not self.has_nav_sidebar:
+            self.report('missing-nav', "Missing <nav> with sidebar class")
+        if not self.has_main:
+            self.report('missing-main', "Missing <main>")
+        if not self.has_footer:
+            self.report('missing-footer', "Missing <footer>")
+
+
+class IncludesRule(Rule):
+    """The shared stylesheet and script are included; collects every CSS/JS reference"""
+
+    tags = {'link', 'script'}
+
+    def __init__(self, context):
+        super().__init__(context)
+        self.css_links = []
+        self.js_links = []
+
+    @property
+    def complete(self):
+        return (not self.context.accepted_css.isdisjoint(self.css_links)
+                and not self.context.accepted_js.isdisjoint(self.js_links))
+
+    def start(self, page, tag, attrs):
+        if tag == 'link' and attrs.get('rel') == 'stylesheet' and attrs.get('href'):
+            self.css_links.append(attrs['href'])
+        elif tag == 'script' and attrs.get('src'):
+            self.js_links.append(attrs['src'])
+
+    def finish(self, page):
+        if self.context.accepted_css.isdisjoint(self.css_links):
+            self.report('css-link', f"Missing or incorrect CSS link: expected {self.context.expected_css}")
+        if self.context.accepted_js.isdisjoint(self.js_links):
+            self.report('js-link', f"Missing or incorrect JS link: expected {self.context.expected_js}")
+        page.data['assets'] = self.css_links + self.js_links
+        page.data['stylesheets'] = self.css_links
+
+
+class CodeBlockRule(Rule):
+    """Counts C code blocks and warns about <pre><code> blocks without a language-* class"""
+
+    tags = {'code'}
+
+    def __init__(self, context):
+        super().__init__(context)
+        self.code_blocks = 0
+
+    def start(self, page, tag, attrs):
+        classes = (attrs.get('class') or '').split()
+        if classes == ['language-c']:
+            self.code_blocks += 1
+        if page.stack[-2:-1] and page.stack[-2][0] == 'pre' and not any(c.startswith('language-') for c in classes):
+            self.report('code-language', "Code block without a language-* class", page.line, 'warning')
+
+    def finish(self, page):
+        page.data['code_blocks'] = self.code_blocks
+
+
+class ChapterContentRule(Rule):
+    """Chapters have code blocks plus Practice and Common Errors headings"""
+
+    tags = {'h2', 'h3'}
+    text_in = {'h2', 'h3'}
+
+    def __init__(self, context):
+        super().__init__(context)
+        self.has_practice_section = False
+        self.has_common_errors = False
+        self._heading = []
+
+    @classmethod
+    def applies(cls, context):
+        return context.file_path.startswith('chapters/') and not context.structure_only
+
+    def text(self, page, data):
+        self._heading.append(data)
+
+    def end(self, page, tag):
+        # The whole heading, including text in nested elements like <span>
+        text = ''.join(self._heading).lower()
+        self._heading = []
+        if 'practice' in text:
+            self.has_practice_section = True
+        elif 'common errors' in text:
+            self.has_common_errors = True
+
+    def finish(self, page):
+        if self._heading:
+            self.end(page, None)
+        if page.data.get('code_blocks', 0) == 0:
+            self.report('chapter-code-blocks', "Chapter missing code blocks")
+        if not self.has_practice_section:
+            self.report('chapter-practice', "Chapter missing Practice section")
+        if not self.has_common_errors:
+            self.report('chapter-common-errors', "Chapter missing Common Errors section")
+
+
+class LinkRule(Rule):
+    """Collects every <a href> with its line for the cross-page link check"""
+
+    tags = {'a'}
+
+    def __init__(self, context):
+        super().__init__(context)
+        self.links = []
+        self.link_lines = []
+
+    def start(self, page, tag, attrs):
+        if attrs.get('href'):
+            self.links.append(attrs['href'])
+            self.link_lines.append(page.line)
+
+    def finish(self, page):
+        page.data['links'] = self.links
+        page.data['link_lines'] = self.link_lines
+
+
+class IdRule(Rule):
+    """Collects ids for anchor checks and reports duplicates"""
+
+    def __init__(self, context):
+        super().__init__(context)
+        self.ids = set()
+
+    def start(self, page, tag, attrs):
+        ident = attrs.get('id')
+        if ident:
+            if ident in self.ids:
+                self.report('duplicate-id', f"Duplicate id \"{ident}\"", page.line)
+            self.ids.add(ident)
+
+    def finish(self, page):
+        page.data['ids'] = self.ids
+
+
+class ClassRule(Rule):
+    """Collects the classes a page uses and those its inline <style> defines"""
+
+    text_in = {'style'}
+
+    def __init__(self, context):
+        super().__init__(context)
+        self.classes = set()
+        self.style_text = []
+
+    def start(self, page, tag, attrs):
+        if attrs.get('class'):
+            self.classes.update(attrs['class'].split())
+
+    def text(self, page, data):
+        self.style_text.append(data)
+
+    def finish(self, page):
+        page.data['classes'] = sorted(self.classes)
+        page.data['style_classes'] = sorted(defined_classes(''.join(self.style_text)))
+
+
+class ImageRule(Rule):
+    """Collects <img> sources and icon links for the SVG savings report"""
+
+    tags = {'img', 'link'}
+
+    def __init__(self, context):
+        super().__init__(context)
+        self.images = []
+
+    def start(self, page, tag, attrs):
+        if tag == 'img' and attrs.get('src'):
+            self.images.append(attrs['src'])
+        elif tag == 'link' and 'icon' in (attrs.get('rel') or '').split() and attrs.get('href'):
+            self.images.append(attrs['href'])
+
+    def finish(self, page):
+        page.data['images'] = self.images
+
+
+class AltTextRule(Rule):
+    """Every <img> has an alt attribute (empty for decorative images)"""
+
+    tags = {'img'}
+
+    def start(self, page, tag, attrs):
+        if 'alt' not in attrs:
+            self.report('missing-alt', f"Image {attrs.get('src', '')} has no alt text", page.line)
+
+
+class HeadingOrderRule(Rule):
+    """Headings don't skip levels on the way down (an <h2> followed by an <h4>)"""
+
+    tags = HEADING_TAGS
+
+    def __init__(self, context):
+        super().__init__(context)
+        self.level = None
+
+    def start(self, page, tag, attrs):
+        level = int(tag[1])
+        if self.level is not None and level > self.level + 1:
+            self.report('heading-order', f"<{tag}> follows <h{self.level}>, skipping a level", page.line, 'warning')
+        self.level = level
+
+
+class QuizRule(Rule):
+    """Collects quiz containers (``data-quiz-id``) and the shard each loads"""
+
+    def __init__(self, context):
+        super().__init__(context)
+        self.quizzes = []
+
+    def start(self, page, tag, attrs):
+        if 'data-quiz-id' in attrs:
+            self.quizzes.append([attrs['data-quiz-id'], attrs.get('data-quiz-src'), page.line])
+
+    def finish(self, page):
+        page.data['quizzes'] = self.quizzes
+
+
+class ContentRule(Rule):
+    """MinHash signatures of the page's main text and of each <h2> section in it.
+
+    site_audit.py compares them across pages to find near-duplicates; the
+    footer, scripts and styles inside <main> are left out.
+    """
+
+    tags = {'h2'}
+    text_in = {'main'}
+    SKIPPED = ('footer', 'script', 'style', 'nav')
+
+    def __init__(self, context):
+        super().__init__(context)
+        self.text_parts = []
+        # [heading, line, text parts] per <h2> section
+        self.sections = []
+
+    def start(self, page, tag, attrs):
+        if page.inside('main'):
+            self.sections.append(['', page.line, []])
+
+    def text(self, page, data):
+        if any(page.inside(tag) for tag in self.SKIPPED):
+            return
+        self.text_parts.append(data)
+        if self.sections:
+            if page.inside('h2'):
+                self.sections[-1][0] += data
+            self.sections[-1][2].append(data)
+
+    def finish(self, page):
+        page.data['content'] = {
+            'signature': signature(' '.join(self.text_parts)),
+            'sections': [[' '.join(heading.split()), line, sig] for heading, line, parts in self.sections
+                         if (sig := signature(' '.join(parts))) is not None],
+        }
+
+
+# Run in this order; a rule's finish() may use page.data set by an earlier one
+DEFAULT_RULES = [StructureRule, IncludesRule, CodeBlockRule, ChapterContentRule, LinkRule, IdRule, ClassRule,
+                 ImageRule, AltTextRule, HeadingOrderRule, QuizRule, ContentRule]
+# What --structure-only needs
+STRUCTURE_RULES = [StructureRule, IncludesRule]
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Benchmark harness for the tools/ scripts
+Generates a synthetic site of configurable size from the create_skeletons.py
+templates, runs each tool against it in a fresh process and records
+throughput (pages/s) and peak RSS, optionally comparing against a baseline.
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(TOOLS_DIR))
+
+from create_skeletons import create_chapter_skeleton, create_practice_skeleton, create_reference_skeleton
+from site_manifest import MANIFEST_NAME, load_manifest
+
+DEFAULT_BASELINE_PATH = TOOLS_DIR / 'bench-baseline.json'
+SECTIONS = ['chapters', 'practice', 'reference']
+SECTION_TYPES = {'chapters': 'chapter', 'practice': 'practice', 'reference': 'reference'}
+ASSETS = ['assets/styles.css', 'assets/app.js', 'assets/quiz.css', 'assets/favicon.svg']
+TOOLS = ['skeletons', 'sync', 'audit']
+
+SIDEBAR_PLACEHOLDER = '''<nav class="sidebar" aria-label="Course Navigation">
+            <!-- Sidebar will be populated by sync tool -->
+        </nav>'''
+
+FILLER = ("C gives you direct control over memory, which is why every pointer, array "
+          "and string example in this course pays attention to bounds and lifetimes. ")
+
+CODE_BLOCK = '''
+                        <pre><code class="language-c">#include &lt;stdio.h&gt;
+
+int main() {{
+    int values[{n}];
+    for (int i = 0; i &lt; {n}; i++) {{
+        values[i] = i * i;
+        printf("%d\\n", values[i]);
+    }}
+    return 0;
+}}</code></pre>
+'''
+
+
+def page_plan(pages):
+    """Return [(section, file_path, title)] for a synthetic site, round-robin over sections"""
+    plan = []
+    for i in range(pages):
+        section = SECTIONS[i % len(SECTIONS)]
+        if section == 'chapters':
+            plan.append((section, f"chapters/{i:05d}-topic-{i}.html", f"Topic {i}"))
+        else:
+            plan.append((section, f"{section}/topic-{i}.html", f"Topic {i}"))
+    return plan
+
+
+def render_page(section_type, file_path, title, index):
+    """Render one page with the matching create_skeletons.py template"""
+    if section_type == 'chapter':
+        return create_chapter_skeleton(file_path, index, title)
+    if section_type == 'practice':
+        return create_practice_skeleton(file_path, title)
+    return create_reference_skeleton(file_path, title)
+
+
+def build_sidebar(plan, sidebar_links):
+    """Build an index.html-style sidebar linking the first sidebar_links pages"""
+    groups = []
+    for section in SECTIONS:
+        links = [(path, title) for sec, path, title in plan[:sidebar_links] if sec == section]
+        if not links:
+            continue
+        anchors = '\n'.join(f'                        <a href="{path}" class="nav-link">{title}</a>'
+                            for path, title in links)
+        groups.append(f'''            <div class="nav-section">
+                <div class="nav-group" data-group="{section}">
+                    <button class="nav-group-header" aria-expanded="true">
+                        {section.title()}
+                        <span class="arrow">▼</span>
+                    </button>
+                    <div class="nav-links">
+{anchors}
+                    </div>
+                </div>
+            </div>''')
+    return '<nav class="sidebar" aria-label="Course Navigation">\n' + '\n\n'.join(groups) + '\n        </nav>'
+
+
+def generate_site(root, pages=200, links_per_page=10, code_blocks=3, page_kb=20,
+                  sidebar_links=30, seed=0, source_root=None):
+    """Write a synthetic site under root and return its page list.
+
+    Every page gets links_per_page extra links (to other pages, sometimes with
+    an anchor), code_blocks extra C snippets and filler text up to page_kb.
+    A site.json manifest discovers the pages by glob, as a large course would.
+    """
+    root = Path(root)
+    source_root = Path(source_root or TOOLS_DIR.parent)
+    rng = random.Random(seed)
+    plan = page_plan(pages)
+
+    for section in SECTIONS:
+        (root / section).mkdir(parents=True, exist_ok=True)
+    (root / 'assets').mkdir(parents=True, exist_ok=True)
+    (root / 'tools').mkdir(parents=True, exist_ok=True)
+    for asset in ASSETS:
+        shutil.copyfile(source_root / asset, root / asset)
+
+    index_html = create_reference_skeleton('index.html', 'Synthetic Course')
+    index_html = index_html.replace(SIDEBAR_PLACEHOLDER, build_sidebar(plan, sidebar_links))
+    (root / 'index.html').write_text(index_html, encoding='utf-8')
+
+    for i, (section, file_path, title) in enumerate(plan):
+        extra = []
+        for _ in range(links_per_page):
+            _, target, _ = plan[rng.randrange(len(plan))]
+            anchor = '#introduction' if target.startswith('chapters/') and rng.random() < 0.5 else ''
+            extra.append(f'<a href="../{target}{anchor}">Related topic</a>')
+        links_html = '\n                        <p>' + ' | '.join(extra) + '</p>' if extra else ''
+        code_html = ''.join(CODE_BLOCK.format(n=n + 2) for n in range(code_blocks))
+
+        content = render_page(SECTION_TYPES[section], file_path, title, i)
+        padding_needed = page_kb * 1024 - len(content) - len(links_html) - len(code_html)
+        filler = ''
+        if padding_needed > 0:
+            filler = '\n                        <p>' + (FILLER * (padding_needed // len(FILLER) + 1))[:padding_needed] + '</p>'
+
+        body = f'''
+                    <section id="further-reading">
+                        <h2>Further Reading</h2>{links_html}{code_html}{filler}
+                    </section>
+'''
+        marker = '                    <section id="common-errors">' if section == 'chapters' else '                </article>'
+        content = content.replace(marker, body + '\n' + marker, 1)
+        (root / file_path).write_text(content, encoding='utf-8')
+
+    manifest = {
+        'files': dict({'index.html': 'root'}, **{asset: 'asset' for asset in ASSETS}),
+        'sections': {
+            section: {'type': SECTION_TYPES[section], 'sidebar': True, 'discover': '*.html'}
+            for section in SECTIONS
+        },
+    }
+    with open(root / MANIFEST_NAME, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1)
+    return plan
+
+
+def run_tool_in_process(tool, root, jobs):
+    """Entry point for the measured child process (see --run-tool)"""
+    root = Path(root)
+    manifest = load_manifest(root)
+
+    if tool == 'skeletons':
+        out = root / '_skeletons'
+        for i, (file_path, section_type) in enumerate(manifest.required_files.items()):
+            if section_type not in SECTION_TYPES.values():
+                continue
+            target = out / file_path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(render_page(section_type, file_path, f"Topic {i}", i), encoding='utf-8')
+    elif tool == 'sync':
+        from sync_sidebar import sync_sidebar_stdlib
+        sync_sidebar_stdlib(str(root), manifest=manifest)
+    elif tool == 'audit':
+        from site_audit import SiteAuditor
+        SiteAuditor(root, jobs=jobs, manifest=manifest).run_audit()
+    else:
+        raise SystemExit(f"Unknown tool: {tool}")
+
+
+def measure(tool, root, jobs):
+    """Run one tool in a child process; return (wall seconds, peak RSS in KB or None).
+
+    Peak RSS is the child's own; audit worker processes (--jobs) are not included.
+    """
+    cmd = [sys.executable, str(Path(__file__).resolve()), '--run-tool', tool, str(root), '--jobs', str(jobs)]
+    start = time.perf_counter()
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if hasattr(os, 'wait4'):
+        # Drain stderr first so a chatty child can't block on a full pipe
+        stderr = proc.stderr.read().decode('utf-8', 'replace')
+        proc.stderr.close()
+        # wait4 gives this child's own rusage, unlike RUSAGE_CHILDREN which
+        # is the maximum over every child reaped so far
+        _, status, rusage = os.wait4(proc.pid, 0)
+        wall = time.perf_counter() - start
+        returncode = os.waitstatus_to_exitcode(status)
+        peak_rss = rusage.ru_maxrss // 1024 if sys.platform == 'darwin' else rusage.ru_maxrss
+        proc.returncode = returncode
+    else:
+        _, stderr = proc.communicate()
+        wall = time.perf_counter() - start
+        returncode, peak_rss, stderr = proc.returncode, None, stderr.decode('utf-8', 'replace')
+    # The audit exits 1 when it finds issues; only a crash is a benchmark failure
+    if returncode not in (0, 1):
+        raise RuntimeError(f"{tool} failed with exit code {returncode}:\n{stderr}")
+    return wall, peak_rss
+
+
+def run_benchmarks(params, tools, repeat, jobs):
+    """Generate a site per params and return {tool: result} using the best of repeat runs"""
+    results = {}
+    with tempfile.TemporaryDirectory(prefix='czh-bench-') as tmp:
+        start = time.perf_counter()
+        plan = generate_site(tmp, **params)
+        print(f"🏗️  Generated {len(plan)} pages in {time.perf_counter() - start:.2f}s at {tmp}")
+        for tool in tools:
+            runs = [measure(tool, tmp, jobs) for _ in range(repeat)]
+            wall = min(r[0] for r in runs)
+            rss = [r[1] for r in runs if r[1] is not None]
+            results[tool] = {
+                'pages': len(plan),
+                'wall_seconds': round(wall, 4),
+                'pages_per_second': round(len(plan) / wall, 1) if wall else None,
+                'peak_rss_kb': max(rss) if rss else None,
+            }
+    return results
+
+
+def compare_to_baseline(results, params, baseline, tolerance):
+    """Return a list of regression messages (throughput dropped by more than tolerance)"""
+    if baseline.get('params') != params:
+        print("⚠️  Baseline was recorded with different site parameters; comparison may be meaningless")
+    regressions = []
+    for tool, result in results.items():
+        base = baseline.get('results', {}).get(tool)
+        if not base or not base.get('pages_per_second') or not result['pages_per_second']:
+            continue
+        ratio = result['pages_per_second'] / base['pages_per_second']
+        if ratio < 1 - tolerance:
+            regressions.append(f"{tool}: {result['pages_per_second']} pages/s vs baseline "
+                               f"{base['pages_per_second']} ({(1 - ratio) * 100:.0f}% slower)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the site tools against a synthetic site")
+    parser.add_argument('--pages', type=int, default=200, help="Number of content pages (default: 200)")
+    parser.add_argument('--links', type=int, default=10, help="Extra links per page (default: 10)")
+    parser.add_argument('--code-blocks', type=int, default=3, help="Extra C code blocks per page (default: 3)")
+    parser.add_argument('--page-kb', type=int, default=20, help="Approximate page size in KB (default: 20)")
+    parser.add_argument('--sidebar-links', type=int, default=30, help="Pages listed in the sidebar (default: 30)")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed for link targets (default: 0)")
+    parser.add_argument('--tools', default=','.join(TOOLS), help=f"Comma-separated tools to run (default: {','.join(TOOLS)})")
+    parser.add_argument('--repeat', type=int, default=1, help="Runs per tool; the fastest is kept (default: 1)")
+    parser.add_argument('-j', '--jobs', type=int, default=1, help="Worker processes for the audit (default: 1)")
+    parser.add_argument('--json', metavar='PATH', help="Write results as JSON")
+    parser.add_argument('--baseline', metavar='PATH', nargs='?', const=str(DEFAULT_BASELINE_PATH),
+                        help="Compare against a stored baseline and exit 1 on regression")
+    parser.add_argument('--save-baseline', metavar='PATH', nargs='?', const=str(DEFAULT_BASELINE_PATH),
+                        help="Store these results as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help="Allowed throughput drop before flagging a regression (default: 0.2)")
+    parser.add_argument('--run-tool', nargs=2, metavar=('TOOL', 'ROOT'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_tool:
+        run_tool_in_process(args.run_tool[0], args.run_tool[1], args.jobs)
+        return 0
+
+    params = {
+        'pages': args.pages,
+        'links_per_page': args.links,
+        'code_blocks': args.code_blocks,
+        'page_kb': args.page_kb,
+        'sidebar_links': args.sidebar_links,
+        'seed': args.seed,
+    }
+    tools = [t.strip() for t in args.tools.split(',') if t.strip()]
+    unknown = [t for t in tools if t not in TOOLS]
+    if unknown:
+        parser.error(f"unknown tools: {', '.join(unknown)}")
+
+    print("⏱️  Benchmarking site tools\n")
+    results = run_benchmarks(params, tools, args.repeat, args.jobs)
+
+    print(f"\n{'tool':<10} {'pages':>7} {'wall (s)':>9} {'pages/s':>9} {'peak RSS (MB)':>14}")
+    for tool, r in results.items():
+        rss = f"{r['peak_rss_kb'] / 1024:.1f}" if r['peak_rss_kb'] else 'n/a'
+        print(f"{tool:<10} {r['pages']:>7} {r['wall_seconds']:>9.3f} {r['pages_per_second']:>9} {rss:>14}")
+
+    report = {'params': params, 'jobs': args.jobs, 'python': sys.version.split()[0], 'results': results}
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Baseline saved: {args.save_baseline}")
+
+    if args.baseline:
+        try:
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"\n❌ Cannot read baseline {args.baseline}: {e}")
+            return 1
+        regressions = compare_to_baseline(results, params, baseline, args.tolerance)
+        if regressions:
+            print("\n❌ Regressions against baseline:")
+            for message in regressions:
+                print(f"  {message}")
+            return 1
+        print("\n✅ No regressions against baseline")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
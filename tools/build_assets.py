@@ -0,0 +1,491 @@
+#!/usr/bin/env python3
+"""
+Asset build for C Programming Zero to Hero
+Writes a deployable copy of the site with minified, content-hashed CSS/JS so
+they can be served with long-lived cache headers:
+
+- assets/*.css, assets/*.js and the widget bundles in assets/widgets/ are
+  minified and renamed to ``<name>.<hash>.<ext>``
+- every ``<link href>``/``<script src>`` in the manifest's pages is rewritten
+  to the fingerprinted name
+- ``asset-manifest.json`` maps each original path to its fingerprinted one,
+  so site_audit.py run on the output accepts the new names
+
+With --critical-css, each page type's above-the-fold CSS is inlined into
+<head> and the full stylesheets load without blocking render.
+
+SVGs are optimized on the way (see optimize_svg.py), with a state file in the
+output recording each one's source hash so unchanged images are skipped;
+--inline-svg also inlines small SVG <img>s into the pages. Everything else
+the pages need (other images, the search index) is copied as-is.
+The service worker (sw.js) is copied with a precache manifest of the built
+pages and the fingerprinted files they reference (see build_precache.py).
+Files are only rewritten when their content changes, and files left over
+from previous builds are removed.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import posixpath
+import re
+import sys
+from pathlib import Path
+
+from build_precache import (PRECACHE_MANIFEST_NAME, SERVICE_WORKER_NAME, parse_pages, precache_manifest,
+                            render_manifest, stamp_version)
+from critical_css import inline_critical_css
+from optimize_svg import OPTIMIZER_VERSION, SVG_STATE_NAME, inline_svgs, optimize_svg, source_digest
+from precompress import COMPRESSED_SUFFIXES, STATE_NAME, precompress, print_stats
+from site_manifest import ASSET_MANIFEST_NAME, MANIFEST_NAME, load_manifest
+
+DEFAULT_OUTPUT_DIR = 'dist'
+FINGERPRINT_LENGTH = 10
+
+# Top-level files in these directories are minified and fingerprinted
+ASSET_DIRS = ['assets', 'assets/widgets']
+FINGERPRINT_SUFFIXES = {'.css', '.js'}
+# Directories copied to the output unchanged (apart from the assets above)
+STATIC_DIRS = ['assets', 'images']
+
+ASSET_REF_RE = re.compile(r'(<(?:link|script)\b[^>]*?\b(?:href|src)=")([^"]+)(")', re.IGNORECASE)
+
+# JS: a '/' after one of these characters (or keywords) starts a regex literal, not a division
+REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+REGEX_KEYWORDS = {'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void', 'throw', 'case', 'do', 'else'}
+# Spaces next to these characters can go; anything else (e.g. "a + +b", "x - -y") keeps them
+JS_PUNCTUATION = set('{}()[];,:=<>!?&|*')
+# Newlines after/before these can go without changing how semicolons are inserted
+JS_NEWLINE_AFTER = set('{;,([')
+JS_NEWLINE_BEFORE = set(')]}')
+
+CSS_PUNCTUATION = set('{};,>')
+
+
+def minify_css(css):
+    """Strip comments and collapse whitespace, leaving strings untouched.
+
+    Spaces are only dropped around ``{ } ; , >`` and after ``:`` (never before
+    it, where ``a :hover`` and ``a:hover`` differ), and the last ``;`` in a
+    block goes.
+    """
+    out = []
+    i = 0
+    n = len(css)
+    pending_space = False
+    while i < n:
+        c = css[i]
+        if c == '/' and css.startswith('/*', i):
+            end = css.find('*/', i + 2)
+            i = n if end < 0 else end + 2
+            pending_space = True
+            continue
+        if c.isspace():
+            pending_space = True
+            i += 1
+            continue
+        if c in '"\'':
+            end = i + 1
+            while end < n and css[end] != c:
+                end += 2 if css[end] == '\\' else 1
+            token = css[i:end + 1]
+            i = end + 1
+        else:
+            token = c
+            i += 1
+
+        if token == '}' and out and out[-1] == ';':
+            out.pop()
+        if (pending_space and out and out[-1] not in CSS_PUNCTUATION and out[-1] != ':'
+                and token not in CSS_PUNCTUATION):
+            out.append(' ')
+        pending_space = False
+        out.append(token)
+    return ''.join(out).strip() + '\n'
+
+
+def _js_regex_allowed(previous):
+    """Whether a '/' after the previous significant token starts a regex literal"""
+    if previous is None:
+        return True
+    kind, text = previous
+    if kind == 'punct':
+        return text in REGEX_PRECEDERS
+    return kind == 'word' and text in REGEX_KEYWORDS
+
+
+def js_tokens(js):
+    """Split JavaScript source into (kind, start, end) tokens.
+
+    kind is one of ``space``, ``newline`` (whitespace containing a line
+    break), ``comment``, ``string``, ``template``, ``regex``, ``word`` or
+    ``punct`` (a single character). A template literal is split at each
+    ``${...}`` so the expression inside is tokenized as code; the
+    ``template`` pieces therefore never contain a code brace, and ``punct``
+    braces always balance.
+    """
+    i = 0
+    n = len(js)
+    templates = []          # brace depth at which each open ${...} returns to its template
+    depth = 0
+    previous = None         # (kind, text) of the last significant token
+
+    def scan_template(start):
+        """Scan template text from start; return (end, opened) where opened means '${' was hit"""
+        j = start
+        while j < n:
+            if js[j] == '\\':
+                j += 2
+            elif js[j] == '`':
+                return j + 1, False
+            elif js.startswith('${', j):
+                return j + 2, True
+            else:
+                j += 1
+        return n, False
+
+    while i < n:
+        c = js[i]
+        if c in ' \t\r\n':
+            j = i
+            while j < n and js[j] in ' \t\r\n':
+                j += 1
+            kind = 'newline' if '\n' in js[i:j] else 'space'
+        elif js.startswith('//', i):
+            j = js.find('\n', i)
+            j = n if j < 0 else j
+            kind = 'comment'
+        elif js.startswith('/*', i):
+            j = js.find('*/', i + 2)
+            j = n if j < 0 else j + 2
+            kind = 'comment'
+        elif c in '"\'':
+            j = i + 1
+            while j < n and js[j] != c and js[j] != '\n':
+                j += 2 if js[j] == '\\' else 1
+            j += 1
+            kind = 'string'
+        elif c == '`' or (c == '}' and templates and templates[-1] == depth):
+            if c == '}':
+                templates.pop()
+            j, opened = scan_template(i + 1)
+            if opened:
+                templates.append(depth)
+            kind = 'template'
+        elif c == '/' and _js_regex_allowed(previous):
+            j = i + 1
+            in_class = False
+            while j < n and js[j] != '\n':
+                if js[j] == '\\':
+                    j += 2
+                    continue
+                if js[j] == '[':
+                    in_class = True
+                elif js[j] == ']':
+                    in_class = False
+                elif js[j] == '/' and not in_class:
+                    break
+                j += 1
+            j += 1
+            while j < n and (js[j].isalnum() or js[j] == '_'):
+                j += 1
+            kind = 'regex'
+        elif c.isalnum() or c in '_$':
+            j = i + 1
+            while j < n and (js[j].isalnum() or js[j] in '_$'):
+                j += 1
+            kind = 'word'
+        else:
+            if c == '{':
+                depth += 1
+            elif c == '}':
+                depth -= 1
+            j = i + 1
+            kind = 'punct'
+
+        j = min(j, n)
+        if kind not in ('space', 'newline', 'comment'):
+            previous = (kind, js[i:j])
+        yield kind, i, j
+        i = j
+
+
+def minify_js(js):
+    """Strip comments and collapse whitespace, keeping line breaks that matter.
+
+    Conservative by design: strings, template literals (including nested
+    ``${...}`` expressions) and regex literals are copied verbatim, and a
+    newline is only removed where it can't change automatic semicolon
+    insertion.
+    """
+    out = []
+    pending = ''            # '', ' ' or '\n': whitespace seen since the last token
+    for kind, start, end in js_tokens(js):
+        if kind == 'newline':
+            pending = '\n'
+            continue
+        if kind in ('space', 'comment'):
+            pending = pending or ' '
+            continue
+        token = js[start:end]
+        if pending and out:
+            prev = out[-1][-1]
+            first = token[0]
+            if pending == '\n':
+                if prev not in JS_NEWLINE_AFTER and first not in JS_NEWLINE_BEFORE:
+                    out.append('\n')
+            elif prev not in JS_PUNCTUATION and first not in JS_PUNCTUATION:
+                out.append(' ')
+        pending = ''
+        out.append(token)
+    return ''.join(out).strip() + '\n'
+
+
+MINIFIERS = {'.css': minify_css, '.js': minify_js}
+
+
+def fingerprinted_name(path, content):
+    """assets/app.js + content -> assets/app.<hash>.js"""
+    stem, ext = posixpath.splitext(path)
+    digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:FINGERPRINT_LENGTH]
+    return f"{stem}.{digest}{ext}"
+
+
+def rewrite_asset_refs(html, page_path, assets):
+    """Point every <link>/<script> reference to an asset at its fingerprinted name"""
+    page_dir = posixpath.dirname(page_path)
+
+    def replace(match):
+        ref = match.group(2)
+        target = posixpath.normpath(posixpath.join(page_dir, ref))
+        if '://' in ref or target not in assets:
+            return match.group(0)
+        new_ref = ref[:len(ref) - len(posixpath.basename(ref))] + posixpath.basename(assets[target])
+        return f"{match.group(1)}{new_ref}{match.group(3)}"
+
+    return ASSET_REF_RE.sub(replace, html)
+
+
+def write_if_changed(path, data):
+    """Write bytes to path unless it already has them; return True if written"""
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+class AssetBuilder:
+    def __init__(self, root_path, output_dir=DEFAULT_OUTPUT_DIR, manifest=None, critical_css=False,
+                 inline_svg=False):
+        self.root = Path(root_path)
+        self.critical_css = critical_css
+        self.inline_svg = inline_svg
+        self.out = self.root / output_dir if not Path(output_dir).is_absolute() else Path(output_dir)
+        self.manifest = manifest or load_manifest(self.root)
+        self.assets = {}        # original path -> fingerprinted path
+        self.outputs = set()    # every output path written or kept this build
+        self.written = 0
+        self.sizes = []         # (original path, bytes before, bytes after)
+        self.svg_state = {}     # SVG path -> {'sha256', 'source_bytes', 'bytes'}
+        self.svgs_optimized = 0
+
+    def _write(self, rel_path, data):
+        self.outputs.add(rel_path)
+        self.written += write_if_changed(self.out / rel_path, data)
+
+    def build_assets(self):
+        """Minify and fingerprint the CSS/JS files directly in ASSET_DIRS"""
+        for asset_dir, entry in self._asset_entries():
+            suffix = posixpath.splitext(entry.name)[1]
+            if not entry.is_file() or suffix not in FINGERPRINT_SUFFIXES:
+                continue
+            path = f"{asset_dir}/{entry.name}"
+            with open(entry.path, 'r', encoding='utf-8') as f:
+                source = f.read()
+            minified = MINIFIERS[suffix](source)
+            self.assets[path] = fingerprinted_name(path, minified)
+            self._write(self.assets[path], minified.encode('utf-8'))
+            self.sizes.append((path, len(source.encode('utf-8')), len(minified.encode('utf-8'))))
+
+    def _asset_entries(self):
+        for asset_dir in ASSET_DIRS:
+            try:
+                entries = sorted(os.scandir(self.root / asset_dir), key=lambda e: e.name)
+            except OSError:
+                continue
+            for entry in entries:
+                yield asset_dir, entry
+
+    def _load_svg_state(self):
+        try:
+            with open(self.out / SVG_STATE_NAME, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data.get('files', {}) if data.get('version') == OPTIMIZER_VERSION else {}
+
+    def _copy_svg(self, path, data, previous):
+        """Write the optimized SVG unless its source is unchanged since the last build"""
+        digest = source_digest(data)
+        entry = previous.get(path)
+        self.outputs.add(path)
+        if entry and entry['sha256'] == digest:
+            try:
+                if (self.out / path).stat().st_size == entry['bytes']:
+                    self.svg_state[path] = entry
+                    return
+            except OSError:
+                pass
+        optimized = optimize_svg(data.decode('utf-8')).encode('utf-8')
+        self.written += write_if_changed(self.out / path, optimized)
+        self.svgs_optimized += 1
+        self.svg_state[path] = {'sha256': digest, 'source_bytes': len(data), 'bytes': len(optimized)}
+
+    def copy_static(self):
+        """Copy the static directories, except the assets that were fingerprinted; SVGs are optimized"""
+        previous = self._load_svg_state()
+        for directory in STATIC_DIRS:
+            for dirpath, dirnames, filenames in os.walk(self.root / directory):
+                dirnames[:] = sorted(d for d in dirnames if not d.startswith('.'))
+                rel_dir = Path(dirpath).relative_to(self.root).as_posix()
+                for filename in sorted(filenames):
+                    path = f"{rel_dir}/{filename}"
+                    if path in self.assets or filename.startswith('.') or filename.endswith('.tmp'):
+                        continue
+                    data = (Path(dirpath) / filename).read_bytes()
+                    if filename.endswith('.svg'):
+                        self._copy_svg(path, data, previous)
+                    else:
+                        self._write(path, data)
+        state_json = json.dumps({'version': OPTIMIZER_VERSION, 'files': self.svg_state}, indent=1, sort_keys=True)
+        self._write(SVG_STATE_NAME, (state_json + '\n').encode('utf-8'))
+
+    def build_pages(self):
+        """Copy every manifest page with its asset references rewritten.
+
+        With critical_css, each page type's above-the-fold rules are inlined
+        and the stylesheets are loaded without blocking render (see critical_css.py).
+        With inline_svg, small SVG <img>s are replaced by their (optimized) markup.
+        """
+        pages = {}
+        for path in self.manifest.html_files:
+            if not self.manifest.exists(path):
+                continue
+            with open(self.root / path, 'r', encoding='utf-8', newline='') as f:
+                pages[path] = rewrite_asset_refs(f.read(), path, self.assets)
+            if self.inline_svg:
+                pages[path], inlined = inline_svgs(pages[path], path, self._read_output)
+                for svg in inlined:
+                    print(f"   Inlined {svg} into {path}")
+        if self.critical_css:
+            pages = inline_critical_css(pages, self.manifest.required_files, self._read_output)
+        for path, html in pages.items():
+            self._write(path, html.encode('utf-8'))
+
+    def build_precache(self):
+        """Copy sw.js with the precache manifest of the built pages; None if the site has no service worker"""
+        try:
+            with open(self.root / SERVICE_WORKER_NAME, 'r', encoding='utf-8', newline='') as f:
+                worker = f.read()
+        except OSError:
+            return None
+        # The output as site_audit.py sees it, fingerprinted names included
+        manifest_path = self.root / MANIFEST_NAME
+        manifest = load_manifest(self.out, manifest_path if manifest_path.exists() else None)
+        precache = precache_manifest(self.out, parse_pages(self.out, manifest))
+        self._write(PRECACHE_MANIFEST_NAME, render_manifest(precache).encode('utf-8'))
+        self._write(SERVICE_WORKER_NAME, stamp_version(worker, precache['version']).encode('utf-8'))
+        return precache
+
+    def _read_output(self, path):
+        try:
+            return (self.out / path).read_text(encoding='utf-8')
+        except OSError:
+            return None
+
+    def remove_stale(self):
+        """Delete output files that this build didn't produce (e.g. old fingerprints).
+
+        Precompressed variants of live outputs and precompress.py's state file
+        are kept; precompress.py cleans up after itself.
+        """
+        removed = 0
+        for dirpath, dirnames, filenames in os.walk(self.out, topdown=False):
+            for filename in filenames:
+                path = (Path(dirpath) / filename).relative_to(self.out).as_posix()
+                base, suffix = posixpath.splitext(path)
+                if path == STATE_NAME or (suffix in COMPRESSED_SUFFIXES and base in self.outputs):
+                    continue
+                if path not in self.outputs:
+                    os.unlink(Path(dirpath) / filename)
+                    removed += 1
+            if dirpath != str(self.out) and not os.listdir(dirpath):
+                os.rmdir(dirpath)
+        return removed
+
+    def build(self):
+        self.build_assets()
+        self.copy_static()
+        self.build_pages()
+        manifest_json = json.dumps(self.assets, indent=2, sort_keys=True) + '\n'
+        self._write(ASSET_MANIFEST_NAME, manifest_json.encode('utf-8'))
+        precache = self.build_precache()
+        removed = self.remove_stale()
+
+        print("📦 Fingerprinted assets:")
+        for path, before, after in self.sizes:
+            saved = 100 * (before - after) / before if before else 0
+            print(f"   {path} -> {self.assets[path]}  {before / 1024:.1f} KB -> {after / 1024:.1f} KB (-{saved:.0f}%)")
+        if self.svg_state:
+            before = sum(entry['source_bytes'] for entry in self.svg_state.values())
+            after = sum(entry['bytes'] for entry in self.svg_state.values())
+            print(f"🖼️  {len(self.svg_state)} SVGs: {before / 1024:.1f} KB -> {after / 1024:.1f} KB "
+                  f"({self.svgs_optimized} optimized, {len(self.svg_state) - self.svgs_optimized} unchanged)")
+        if precache:
+            print(f"📴 {len(precache['entries'])} files precached by {SERVICE_WORKER_NAME}, version {precache['version']}")
+        print(f"   {len(self.outputs)} files in {self.out}, {self.written} updated, {removed} stale removed")
+        return self.assets
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a deployable copy of the site with minified, fingerprinted assets")
+    parser.add_argument('root', nargs='?', default='.', help="Site root directory (default: current directory)")
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT_DIR,
+                        help=f"Output directory, relative to the root unless absolute (default: {DEFAULT_OUTPUT_DIR})")
+    parser.add_argument('--critical-css', action='store_true',
+                        help="Inline each page type's critical CSS and load stylesheets without blocking render")
+    parser.add_argument('--inline-svg', action='store_true',
+                        help="Inline small SVG images into the pages that use them (see optimize_svg.py)")
+    parser.add_argument('--compress', action='store_true',
+                        help="Also write .gz/.br variants of the output (see precompress.py)")
+    parser.add_argument('-j', '--jobs', type=int, default=0,
+                        help="Compress in N worker processes (0 = one per CPU, the default)")
+    args = parser.parse_args()
+
+    try:
+        builder = AssetBuilder(args.root, args.output, critical_css=args.critical_css, inline_svg=args.inline_svg)
+    except (OSError, ValueError) as e:
+        print(f"❌ Cannot load site manifest: {e}")
+        sys.exit(2)
+    if builder.out.resolve() == builder.root.resolve():
+        print("❌ Output directory must differ from the site root")
+        sys.exit(2)
+    try:
+        builder.build()
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(2)
+    if args.compress:
+        jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+        print_stats(precompress(builder.out, jobs=jobs))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Offline precache for C Programming Zero to Hero
+Writes precache-manifest.json, the list of files the service worker (sw.js)
+caches so students on flaky connections can keep reading, and stamps its
+version into sw.js so browsers notice a new deploy.
+
+The file set is the page and link set site_audit.py collects: every page,
+plus the stylesheets, scripts, images, quiz shards and local files those
+pages reference, plus RUNTIME_DIRS (fetched by scripts, linked from no
+page). Each entry maps the root-relative path to a hash of its content:
+
+    {"version": ..., "entries": {"index.html": "3f2a...", ...}}
+
+``version`` is a hash of the entries, so it changes exactly when some file
+does. sw.js keeps one cache per version; installing a new one copies the
+entries whose hash is unchanged from the previous cache and fetches only
+the rest.
+
+build_site.py and build_assets.py (for dist/) run this; run it by hand
+after editing a page, or let ``site_audit.py`` tell you it is stale.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import posixpath
+import re
+import sys
+from pathlib import Path
+
+from precompress import COMPRESSED_SUFFIXES, STATE_NAME
+from site_manifest import load_manifest
+from sync_sidebar import write_atomic
+
+PRECACHE_MANIFEST_NAME = 'precache-manifest.json'
+SERVICE_WORKER_NAME = 'sw.js'
+HASH_LENGTH = 16
+
+# Fetched by scripts at runtime rather than referenced by a page
+RUNTIME_DIRS = ['assets/search']
+
+# The line of sw.js this stamps; the rest of the worker is hand-written
+VERSION_LINE_RE = re.compile(r"^const PRECACHE_VERSION = '[^']*';$", re.M)
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def local_target(page, href):
+    """Root-relative path an href on page points at, or None for external, in-page and out-of-site links"""
+    if not href or href.startswith(('#', '//', 'mailto:', 'data:', 'javascript:')) or '://' in href:
+        return None
+    target = href.split('#', 1)[0].split('?', 1)[0]
+    if not target:
+        return None
+    resolved = posixpath.normpath(posixpath.join(posixpath.dirname(page), target))
+    if resolved == '..' or resolved.startswith('../'):
+        return None
+    return resolved
+
+
+def precache_paths(root, html_files_data):
+    """Paths to precache in a stable order: pages, then what they reference, then RUNTIME_DIRS.
+
+    Directory links stand for their index.html; references to files that
+    don't exist are left to the link checks and skipped here.
+    """
+    root = Path(root)
+    paths = {}
+    for f in html_files_data:
+        paths[f['path']] = None
+    for f in html_files_data:
+        refs = f['assets'] + f['images'] + f['links'] + [src for _, src, _ in f['quizzes']]
+        for href in refs:
+            path = local_target(f['path'], href)
+            if path is None:
+                continue
+            if path == '.' or (root / path).is_dir():
+                path = 'index.html' if path == '.' else f"{path}/index.html"
+            paths[path] = None
+    for directory in RUNTIME_DIRS:
+        if (root / directory).is_dir():
+            for entry in sorted(os.scandir(root / directory), key=lambda e: e.name):
+                # Precompressed variants are served in place of their file, never fetched themselves
+                name = entry.name
+                if (entry.is_file() and not name.startswith('.') and not name.endswith(('.tmp',) + COMPRESSED_SUFFIXES)
+                        and name != STATE_NAME):
+                    paths[f"{directory}/{name}"] = None
+    return [path for path in paths
+            if path not in (PRECACHE_MANIFEST_NAME, SERVICE_WORKER_NAME) and (root / path).is_file()]
+
+
+def precache_manifest(root, html_files_data):
+    entries = {path: content_hash((Path(root) / path).read_bytes()) for path in precache_paths(root, html_files_data)}
+    version = content_hash(json.dumps(entries, sort_keys=True).encode('utf-8'))
+    return {'version': version, 'entries': entries}
+
+
+def render_manifest(precache):
+    return json.dumps(precache, indent=1, sort_keys=True) + '\n'
+
+
+def stamp_version(worker, version):
+    """sw.js source with its PRECACHE_VERSION set to version"""
+    if not VERSION_LINE_RE.search(worker):
+        raise ValueError(f"{SERVICE_WORKER_NAME} has no \"const PRECACHE_VERSION = '...';\" line")
+    return VERSION_LINE_RE.sub(f"const PRECACHE_VERSION = '{version}';", worker, 1)
+
+
+def parse_pages(root, manifest):
+    """Parse every manifest page the way the audit does, for callers that haven't"""
+    # site_audit imports this module, so it is only imported when needed
+    from site_audit import audit_page
+    pages = []
+    for path in manifest.html_files:
+        if manifest.exists(path):
+            file_data, _ = audit_page(root, path, assets=manifest.assets)
+            if file_data:
+                pages.append(file_data)
+    return pages
+
+
+def build_precache(root='.', html_files_data=None, check=False, manifest=None):
+    """Write PRECACHE_MANIFEST_NAME and stamp its version into SERVICE_WORKER_NAME.
+
+    html_files_data is the audit's parsed pages (parsed here when None).
+    Returns (stale, precache): the root-relative files that were (or with
+    check=True, would be) rewritten, and the manifest itself. Raises
+    ValueError if the root has no service worker to stamp.
+    """
+    root = Path(root)
+    worker_path = root / SERVICE_WORKER_NAME
+    try:
+        with open(worker_path, 'r', encoding='utf-8', newline='') as f:
+            worker = f.read()
+    except OSError:
+        raise ValueError(f"{SERVICE_WORKER_NAME} is missing")
+
+    if html_files_data is None:
+        html_files_data = parse_pages(root, manifest or load_manifest(root))
+    precache = precache_manifest(root, html_files_data)
+    outputs = {
+        PRECACHE_MANIFEST_NAME: render_manifest(precache),
+        SERVICE_WORKER_NAME: stamp_version(worker, precache['version']),
+    }
+
+    stale = []
+    for path, content in outputs.items():
+        try:
+            with open(root / path, 'r', encoding='utf-8', newline='') as f:
+                if f.read() == content:
+                    continue
+        except OSError:
+            pass
+        stale.append(path)
+        if not check:
+            write_atomic(str(root / path), content)
+    return stale, precache
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write the service worker's precache manifest")
+    parser.add_argument('root', nargs='?', default='.', help="Site root directory (default: current directory)")
+    parser.add_argument('--check', action='store_true',
+                        help="Don't write anything; exit 1 if the manifest or sw.js is out of date")
+    args = parser.parse_args()
+
+    try:
+        stale, precache = build_precache(args.root, check=args.check)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(2)
+
+    verb = "Out of date" if args.check else "Updated"
+    for path in stale:
+        print(f"{verb}: {path}")
+    size = sum((Path(args.root) / path).stat().st_size for path in precache['entries'])
+    print(f"\n📴 {len(precache['entries'])} files ({size / 1024:.1f} KB) precached, version {precache['version']}.")
+    if args.check and stale:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
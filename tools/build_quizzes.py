@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Quiz banks for C Programming Zero to Hero
+Each quiz's questions live in quizzes/<quiz id>.json. This compiles them
+into one shard per quiz under assets/quizzes/, which the quiz widgets fetch
+by the container's ``data-quiz-src`` only when a quiz is about to be used,
+instead of every page carrying (and parsing) every question bank.
+
+Work the widgets used to do at runtime is done here once:
+
+- every question gets an ``id`` (its 1-based position unless it has one)
+  and a ``topic``: its own, or the first topic whose keywords appear in the
+  question text, or the last topic as the catch-all
+- the pass badge is named from the quiz id (BADGE_NAMES), and each extra
+  badge gets an explicit ``threshold`` (default: the pass mark) and
+  ``topic`` (null: the whole quiz)
+
+Banks are validated first (see validate_quiz(), which site_audit.py also
+runs on the shards): a quiz needs a slug id, since progress is saved under
+the ``czh.quiz.<id>`` localStorage key, and every question needs choices, an
+answer among them and a unique id.
+
+quizzes/ stays the place to edit; run this after changing a bank.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+from sync_sidebar import write_atomic
+
+QUIZ_SOURCE_DIR = 'quizzes'
+QUIZ_DIR = 'assets/quizzes'
+# Bump when the shard format changes
+SHARD_VERSION = 1
+DEFAULT_PASS_MARK = 0.8
+
+# A quiz id is one segment of the czh.quiz.<id> localStorage key
+QUIZ_ID_RE = re.compile(r'^[a-z0-9]+(?:-[a-z0-9]+)*$')
+
+# Pass badge by the first of these words in the quiz id
+BADGE_NAMES = {
+    'basics': 'Basics Badge',
+    'intro': 'Introduction Badge',
+    'control': 'Control Flow Badge',
+    'loops': 'Loops Badge',
+    'arrays': 'Arrays Badge',
+    'functions': 'Functions Badge',
+    'pointers': 'Pointers Badge',
+    'structures': 'Structures Badge',
+    'files': 'Files Badge',
+    'algorithms': 'Algorithms Badge',
+}
+DEFAULT_BADGE_NAME = 'Quiz Badge'
+
+
+def badge_name(quiz_id):
+    return next((name for key, name in BADGE_NAMES.items() if key in quiz_id.lower()), DEFAULT_BADGE_NAME)
+
+
+def _fraction(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and 0 <= value <= 1
+
+
+def validate_quiz(data):
+    """Problems with a quiz bank or shard, as a list of messages (empty when it is valid)"""
+    if not isinstance(data, dict):
+        return ["not a JSON object"]
+    problems = []
+    quiz_id = data.get('quizId')
+    if not isinstance(quiz_id, str) or not QUIZ_ID_RE.match(quiz_id):
+        problems.append(f"quizId {quiz_id!r} is not a lower-case slug usable in czh.quiz.<id>")
+    if 'passMark' in data and not _fraction(data['passMark']):
+        problems.append(f"passMark {data['passMark']!r} is not between 0 and 1")
+
+    topics = [topic.get('name') for topic in data.get('topics', []) if isinstance(topic, dict)]
+    if len(topics) != len(data.get('topics', [])) or not all(isinstance(name, str) for name in topics):
+        problems.append("every topic needs a name")
+    elif len(set(topics)) != len(topics):
+        problems.append("topic names are not unique")
+
+    items = data.get('items')
+    if not isinstance(items, list) or not items:
+        return problems + ["no questions"]
+    ids = set()
+    for number, item in enumerate(items, 1):
+        where = f"question {number}"
+        if not isinstance(item, dict):
+            problems.append(f"{where} is not a JSON object")
+            continue
+        ident = item.get('id', number)
+        if ident in ids:
+            problems.append(f"{where} reuses id {ident!r}")
+        ids.add(ident)
+        if not isinstance(item.get('q'), str) or not item['q'].strip():
+            problems.append(f"{where} has no question text")
+        choices = item.get('choices')
+        if not isinstance(choices, list) or len(choices) < 2 or not all(isinstance(c, str) for c in choices):
+            problems.append(f"{where} needs at least two choices")
+        answer = item.get('answer')
+        if not isinstance(answer, int) or isinstance(answer, bool) or not 0 <= answer < len(choices or []):
+            problems.append(f"{where} has no answer among its choices (answer: {answer!r})")
+        if topics and 'topic' in item and item['topic'] is not None and item['topic'] not in topics:
+            problems.append(f"{where} has unknown topic {item['topic']!r}")
+
+    badge_ids = set()
+    for badge in data.get('badges', []):
+        if not isinstance(badge, dict) or not isinstance(badge.get('id'), str) or not isinstance(badge.get('name'), str):
+            problems.append("every badge needs an id and a name")
+            continue
+        if badge['id'] in badge_ids:
+            problems.append(f"badge id {badge['id']!r} is not unique")
+        badge_ids.add(badge['id'])
+        if 'threshold' in badge and not _fraction(badge['threshold']):
+            problems.append(f"badge {badge['id']!r} threshold {badge['threshold']!r} is not between 0 and 1")
+        if badge.get('topic') is not None and badge['topic'] not in topics:
+            problems.append(f"badge {badge['id']!r} has unknown topic {badge['topic']!r}")
+    return problems
+
+
+def item_topic(item, topics):
+    """The topic of a question: its own, the first whose keywords it contains, else the last one"""
+    if item.get('topic'):
+        return item['topic']
+    if not topics:
+        return None
+    question = item['q'].lower()
+    for topic in topics:
+        if any(keyword in question for keyword in topic.get('keywords', [])):
+            return topic['name']
+    return topics[-1]['name']
+
+
+def compile_quiz(data):
+    """The shard for a valid quiz bank"""
+    topics = data.get('topics', [])
+    pass_mark = data.get('passMark', DEFAULT_PASS_MARK)
+    return {
+        'version': SHARD_VERSION,
+        'quizId': data['quizId'],
+        'title': data.get('title', 'Quiz'),
+        'passMark': pass_mark,
+        'shuffle': bool(data.get('shuffle', False)),
+        'badge': data.get('badge') or badge_name(data['quizId']),
+        'topics': [{'name': topic['name'], 'advice': topic.get('advice', '')} for topic in topics],
+        'badges': [{'id': badge['id'], 'name': badge['name'], 'description': badge.get('description', ''),
+                    'topic': badge.get('topic'), 'threshold': badge.get('threshold', pass_mark)}
+                   for badge in data.get('badges', [])],
+        'items': [{'id': item.get('id', number), 'q': item['q'], 'choices': item['choices'],
+                   'answer': item['answer'], 'explain': item.get('explain', ''), 'topic': item_topic(item, topics)}
+                  for number, item in enumerate(data['items'], 1)],
+    }
+
+
+def render_shard(shard):
+    return json.dumps(shard, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+
+def build_quizzes(root='.', check=False):
+    """Compile every bank in QUIZ_SOURCE_DIR into QUIZ_DIR.
+
+    Returns (stale, quiz ids): the root-relative shards that were (or with
+    check=True, would be) rewritten or removed. Raises ValueError naming
+    the first invalid bank, before anything is written.
+    """
+    root = Path(root)
+    source_dir = root / QUIZ_SOURCE_DIR
+    outputs = {}
+    for path in sorted(source_dir.glob('*.json')) if source_dir.is_dir() else []:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except ValueError as e:
+            raise ValueError(f"{QUIZ_SOURCE_DIR}/{path.name}: invalid JSON - {e}")
+        problems = validate_quiz(data)
+        if not problems and data['quizId'] != path.stem:
+            problems = [f"quizId {data['quizId']!r} doesn't match the file name"]
+        if problems:
+            raise ValueError(f"{QUIZ_SOURCE_DIR}/{path.name}: {'; '.join(problems)}")
+        outputs[f"{QUIZ_DIR}/{path.name}"] = render_shard(compile_quiz(data))
+
+    stale = []
+    for path, content in outputs.items():
+        full_path = root / path
+        try:
+            with open(full_path, 'r', encoding='utf-8', newline='') as f:
+                if f.read() == content:
+                    continue
+        except OSError:
+            pass
+        stale.append(path)
+        if not check:
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(str(full_path), content)
+
+    # Drop shards whose bank is gone
+    if (root / QUIZ_DIR).is_dir():
+        for entry in os.scandir(root / QUIZ_DIR):
+            if entry.name.endswith('.json') and f"{QUIZ_DIR}/{entry.name}" not in outputs:
+                stale.append(f"{QUIZ_DIR}/{entry.name}")
+                if not check:
+                    os.unlink(entry.path)
+    return stale, [Path(path).stem for path in outputs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile the quiz banks in quizzes/ into per-quiz JSON shards")
+    parser.add_argument('root', nargs='?', default='.', help="Site root directory (default: current directory)")
+    parser.add_argument('--check', action='store_true',
+                        help="Don't write anything; exit 1 if any shard is out of date")
+    args = parser.parse_args()
+
+    try:
+        stale, quizzes = build_quizzes(args.root, check=args.check)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(2)
+
+    verb = "Out of date" if args.check else "Updated"
+    for path in stale:
+        print(f"{verb}: {path}")
+    print(f"\n{len(quizzes)} quizzes, {len(stale)} shards {'stale' if args.check else 'updated'}.")
+    if args.check and stale:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
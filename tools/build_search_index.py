@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Search index builder for C Programming Zero to Hero
+Tokenizes every chapter, practice and reference page into a compact,
+prefix-searchable inverted index that assets/app.js queries at runtime
+"""
+
+import argparse
+import json
+import os
+import re
+from html.parser import HTMLParser
+from pathlib import Path
+
+from site_manifest import load_manifest
+
+INDEX_VERSION = 1
+DEFAULT_OUTPUT_DIR = 'assets/search'
+EXCLUDED_PAGES = {'404.html'}
+SITE_TITLE_SUFFIX = ' | C Programming: Zero to Hero'
+
+TOKEN_RE = re.compile(r"[a-z0-9_]+")
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'can', 'from', 'has',
+    'have', 'how', 'in', 'is', 'it', 'its', 'of', 'on', 'or', 'so',
+    'that', 'the', 'their', 'then', 'this', 'to', 'was', 'we', 'what', 'when',
+    'which', 'will', 'with', 'you', 'your',
+}
+
+# Score multipliers for where a term occurs within a section
+TITLE_WEIGHT = 5
+HEADING_WEIGHT = 3
+BODY_WEIGHT = 1
+TF_SATURATION = 1.2
+SNIPPET_LENGTH = 140
+
+
+def field_score(weight, tf):
+    """Integer score for tf occurrences in one field, saturating like BM25 so
+    long sections that repeat a word don't drown out focused ones"""
+    return round(weight * 10 * tf * (1 + TF_SATURATION) / (tf + TF_SATURATION))
+
+
+def tokenize(text):
+    """Lowercase text and split it into index terms"""
+    return [t for t in TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+class SearchTextExtractor(HTMLParser):
+    """Split a page into searchable sections.
+
+    A new section starts at every ``<section id>`` (and at ``<h2 id>``/``<h3 id>``
+    outside one); its title is the first heading inside it. Navigation,
+    header, footer, scripts and styles are skipped.
+    """
+
+    SKIP_TAGS = {'script', 'style', 'nav', 'header', 'footer', 'svg', 'button'}
+    HEADING_TAGS = {'h1', 'h2', 'h3', 'h4'}
+
+    def __init__(self):
+        super().__init__()
+        self.page_title = ''
+        self.sections = [self._new_section('')]
+        self._skip_depth = 0
+        self._in_title = False
+        self._heading = None
+
+    @staticmethod
+    def _new_section(anchor):
+        return {'anchor': anchor, 'title': '', 'headings': [], 'text': []}
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+            return
+        if tag == 'title':
+            self._in_title = True
+            return
+        if self._skip_depth:
+            return
+
+        element_id = dict(attrs).get('id')
+        if element_id and (tag == 'section' or (tag in ('h2', 'h3') and self._heading is None)):
+            self.sections.append(self._new_section(element_id))
+        if tag in self.HEADING_TAGS:
+            self._heading = []
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+            return
+        if tag == 'title':
+            self._in_title = False
+            return
+        if tag in self.HEADING_TAGS and self._heading is not None:
+            heading = ' '.join(''.join(self._heading).split())
+            section = self.sections[-1]
+            if tag == 'h1' and not self.page_title:
+                self.page_title = heading
+            if not section['title']:
+                section['title'] = heading
+            else:
+                section['headings'].append(heading)
+            self._heading = None
+
+    def handle_data(self, data):
+        if self._in_title:
+            if not self.page_title:
+                self.page_title = data.strip().replace(SITE_TITLE_SUFFIX, '')
+            return
+        if self._skip_depth:
+            return
+        if self._heading is not None:
+            self._heading.append(data)
+        else:
+            self.sections[-1]['text'].append(data)
+
+
+def extract_sections(path):
+    """Return (page_title, [section, ...]) for one HTML file"""
+    extractor = SearchTextExtractor()
+    with open(path, 'r', encoding='utf-8') as f:
+        extractor.feed(f.read())
+    extractor.close()
+    return extractor.page_title, extractor.sections
+
+
+def build_index(root, pages):
+    """Return (docs, postings) for the given root-relative pages.
+
+    docs is a list of [url, title, snippet]; postings maps each term to a
+    list of (doc id, score) pairs in doc id order.
+    """
+    docs = []
+    postings = {}
+    for page in pages:
+        page_title, sections = extract_sections(Path(root) / page)
+        for section in sections:
+            text = ' '.join(''.join(section['text']).split())
+            if not text and not section['title']:
+                continue
+
+            doc_id = len(docs)
+            url = f"{page}#{section['anchor']}" if section['anchor'] else page
+            if section['title'] and section['title'] != page_title:
+                title = f"{page_title} › {section['title']}"
+            else:
+                title = page_title or section['title']
+            docs.append([url, title, text[:SNIPPET_LENGTH]])
+
+            scores = {}
+            for weight, terms in ((TITLE_WEIGHT, tokenize(section['title'])),
+                                  (HEADING_WEIGHT, tokenize(' '.join(section['headings']))),
+                                  (BODY_WEIGHT, tokenize(text))):
+                counts = {}
+                for term in terms:
+                    counts[term] = counts.get(term, 0) + 1
+                for term, tf in counts.items():
+                    scores[term] = scores.get(term, 0) + field_score(weight, tf)
+            for term, score in scores.items():
+                postings.setdefault(term, []).append((doc_id, score))
+    return docs, postings
+
+
+def shard_key(term):
+    """Terms are sharded by first character so a query loads one small file"""
+    return term[0]
+
+
+def encode_shards(postings):
+    """Return {shard key: shard} with sorted terms and delta-encoded postings.
+
+    Each shard is ``{"terms": [...], "postings": [[gap, score, gap, score, ...], ...]}``
+    where ``postings[i]`` belongs to ``terms[i]`` and gaps are doc id deltas.
+    Sorted terms let the client find every completion of a prefix with a
+    binary search.
+    """
+    shards = {}
+    for term in sorted(postings):
+        shard = shards.setdefault(shard_key(term), {'terms': [], 'postings': []})
+        flat = []
+        previous = 0
+        for doc_id, score in postings[term]:
+            flat.extend((doc_id - previous, score))
+            previous = doc_id
+        shard['terms'].append(term)
+        shard['postings'].append(flat)
+    return shards
+
+
+def write_if_changed(path, data):
+    """Write compact JSON to path unless it already has that content; return True if written"""
+    content = json.dumps(data, ensure_ascii=False, separators=(',', ':'), sort_keys=True) + '\n'
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == content:
+                return False
+    except OSError:
+        pass
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+    return True
+
+
+def build_search_index(root='.', output_dir=DEFAULT_OUTPUT_DIR, manifest=None):
+    """Build the index for every manifest page and write it under output_dir"""
+    root = Path(root)
+    manifest = manifest or load_manifest(root)
+    pages = [p for p in manifest.html_files if p not in EXCLUDED_PAGES and manifest.exists(p)]
+
+    docs, postings = build_index(root, pages)
+    shards = encode_shards(postings)
+
+    out = root / output_dir
+    out.mkdir(parents=True, exist_ok=True)
+    written = 0
+    written += write_if_changed(out / 'docs.json', {
+        'version': INDEX_VERSION,
+        'docs': docs,
+        'shards': sorted(shards),
+    })
+    for key, shard in shards.items():
+        written += write_if_changed(out / f'terms-{key}.json', shard)
+
+    # Drop shards for first characters that no longer occur
+    for stale in out.glob('terms-*.json'):
+        if stale.stem[len('terms-'):] not in shards:
+            stale.unlink()
+            written += 1
+
+    total_bytes = sum(p.stat().st_size for p in out.glob('*.json'))
+    print(f"🔎 Indexed {len(pages)} pages into {len(docs)} sections, {len(postings)} terms, "
+          f"{len(shards)} shards ({total_bytes / 1024:.1f} KB)")
+    print(f"   {written} files updated in {out}")
+    return docs, shards
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the static full-text search index")
+    parser.add_argument('root', nargs='?', default='.', help="Site root directory (default: current directory)")
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT_DIR,
+                        help=f"Output directory relative to the root (default: {DEFAULT_OUTPUT_DIR})")
+    args = parser.parse_args()
+    build_search_index(args.root, args.output)
+
+
+if __name__ == '__main__':
+    main()
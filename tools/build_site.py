@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Site build for C Programming Zero to Hero
+One incremental pass that renders pages into the shared layout with the
+sidebar injected, syncs sidebars and widget bundles (build_widgets.py) of
+hand-written pages, compiles the quiz shards (build_quizzes.py), rebuilds
+the search index (build_search_index.py), refreshes the service worker's
+precache manifest (build_precache.py) and audits the result, replacing the create_skeletons ->
+sync_sidebar -> site_audit sequence.
+
+Each page declared in site.json is built one of three ways:
+- ``"source": "content/..."`` - the file holds the page's <article> body and
+  is rendered into the layout from create_skeletons.py
+- no source and the page is missing - a skeleton is rendered
+- no source and the page exists - it is hand-written; only its sidebar is synced
+
+A build state file records what each output was built from (layout, sidebar,
+manifest entry, source hash, or for hand-written pages their size/mtime), so
+pages whose inputs haven't changed are skipped entirely.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from build_precache import SERVICE_WORKER_NAME, build_precache
+from build_quizzes import build_quizzes
+from build_search_index import build_search_index
+from build_widgets import WIDGET_SOURCE, build_widgets
+from create_skeletons import (PAGE_LAYOUT, create_chapter_skeleton, create_practice_skeleton,
+                              create_reference_skeleton, page_meta, render_layout)
+from site_audit import DEFAULT_CACHE_PATH, SiteAuditor
+from site_manifest import load_manifest
+from sync_sidebar import SidebarTemplate, load_canonical_sidebar, sync_page, write_atomic
+
+# Bump when the way pages are rendered changes outside PAGE_LAYOUT itself
+BUILD_VERSION = 2
+DEFAULT_STATE_PATH = 'tools/.build-state.json'
+
+SKELETONS = {
+    'chapter': lambda path, page, sidebar: create_chapter_skeleton(path, page.get('number'), page['title'], sidebar),
+    'practice': lambda path, page, sidebar: create_practice_skeleton(path, page['title'], sidebar),
+    'reference': lambda path, page, sidebar: create_reference_skeleton(path, page['title'], sidebar),
+}
+
+# Compiled sidebar templates, per worker process: (sidebar digest, depth) -> template
+_sidebar_templates = {}
+
+
+def digest_of(*parts):
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode('utf-8') if isinstance(part, str) else part)
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+def sidebar_for(sidebar_html, sidebar_digest, file_path):
+    """Render the active-link sidebar for file_path from a cached template"""
+    depth = file_path.count('/')
+    key = (sidebar_digest, depth)
+    if key not in _sidebar_templates:
+        _sidebar_templates[key] = SidebarTemplate(sidebar_html, depth=depth)
+    return _sidebar_templates[key].render("../" * depth + file_path)
+
+
+def render_target(root, sidebar_html, sidebar_digest, target):
+    """Render one source or skeleton page; module-level so it can run in a worker"""
+    path = target['path']
+    page = target['page']
+    sidebar = sidebar_for(sidebar_html, sidebar_digest, path)
+    if target['kind'] == 'skeleton':
+        return path, SKELETONS[target['type']](path, page, sidebar)
+
+    with open(Path(root) / target['source'], 'r', encoding='utf-8') as f:
+        article = f.read()
+    title, description, quiz = page_meta(target['type'], page.get('title', ''), page.get('number'))
+    return path, render_layout(path, title, description, article, quiz=quiz, sidebar=sidebar)
+
+
+class SiteBuilder:
+    def __init__(self, root_path, jobs=1, state_path=DEFAULT_STATE_PATH, force=False):
+        self.root = Path(root_path)
+        self.jobs = jobs
+        self.force = force
+        self.state_path = self.root / state_path
+        self.state = {}
+        self.stats = {'rendered': 0, 'skeletons': 0, 'synced': 0, 'unchanged': 0}
+
+    def load_state(self, layout_digest):
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        # A different layout or build version invalidates every output
+        if not self.force and data.get('layout') == layout_digest:
+            self.state = data.get('outputs', {})
+
+    def save_state(self, layout_digest):
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix(self.state_path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'layout': layout_digest, 'outputs': self.state}, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.state_path)
+
+    def plan(self, manifest, sidebar_digest):
+        """Split the manifest's sidebar pages into (targets to render, hand-written pages to sync)"""
+        to_render = []
+        to_sync = []
+        for name, section in manifest.sections.items():
+            if not section.get('sidebar'):
+                continue
+            section_type = section.get('type', name)
+            for page in manifest.pages[name]:
+                path = page['path']
+                previous = self.state.get(path, {})
+                if page.get('source'):
+                    source_path = self.root / page['source']
+                    try:
+                        source_digest = hashlib.sha256(source_path.read_bytes()).hexdigest()
+                    except OSError:
+                        print(f"WARNING: Missing source {page['source']} for {path}")
+                        continue
+                    inputs = digest_of(sidebar_digest, json.dumps(page, sort_keys=True), source_digest)
+                    if previous.get('inputs') != inputs or not manifest.exists(path):
+                        to_render.append({'path': path, 'kind': 'source', 'type': section_type,
+                                          'page': page, 'source': page['source'], 'inputs': inputs})
+                    else:
+                        self.stats['unchanged'] += 1
+                elif not manifest.exists(path):
+                    if section_type in SKELETONS and 'title' in page:
+                        to_render.append({'path': path, 'kind': 'skeleton', 'type': section_type, 'page': page})
+                else:
+                    st = os.stat(self.root / path)
+                    fingerprint = [st.st_size, st.st_mtime_ns, sidebar_digest]
+                    if previous.get('authored') != fingerprint:
+                        to_sync.append(path)
+                    else:
+                        self.stats['unchanged'] += 1
+        return to_render, to_sync
+
+    def render(self, targets, sidebar_html, sidebar_digest):
+        """Render targets (in parallel when jobs > 1) and write those whose output changed"""
+        render = partial(render_target, self.root, sidebar_html, sidebar_digest)
+        if self.jobs > 1 and len(targets) > 1:
+            with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                results = list(executor.map(render, targets, chunksize=max(1, len(targets) // (self.jobs * 4))))
+        else:
+            results = [render(target) for target in targets]
+
+        for target, (path, html) in zip(targets, results):
+            full_path = self.root / path
+            try:
+                with open(full_path, 'r', encoding='utf-8', newline='') as f:
+                    unchanged = f.read() == html
+            except OSError:
+                unchanged = False
+            if not unchanged:
+                full_path.parent.mkdir(parents=True, exist_ok=True)
+                write_atomic(str(full_path), html)
+            if target['kind'] == 'skeleton':
+                print(f"Created {path}")
+                self.stats['skeletons'] += 1
+            else:
+                print(f"Rendered {path}" if not unchanged else f"Up to date: {path}")
+                self.stats['rendered'] += 1
+                self.state[path] = {'inputs': target['inputs']}
+
+    def sync(self, paths, sidebar_html, sidebar_digest):
+        """Sync the sidebar of hand-written pages and record their new fingerprint"""
+        templates = {}
+        for path in paths:
+            depth = path.count('/')
+            if depth not in templates:
+                templates[depth] = SidebarTemplate(sidebar_html, depth=depth)
+            full_path = self.root / path
+            entry = sync_page(str(full_path), path, "../" * depth + path, templates[depth])
+            if entry['status'] == 'changed':
+                print(f"Synced sidebar in: {path}")
+                self.stats['synced'] += 1
+            elif entry['status'] == 'missing':
+                print(f"WARNING: Could not find sidebar in {path}")
+            else:
+                self.stats['unchanged'] += 1
+            st = os.stat(full_path)
+            self.state[path] = {'authored': [st.st_size, st.st_mtime_ns, sidebar_digest]}
+
+    def build(self):
+        """Render, sync and record state; return False if the build couldn't start"""
+        print("🏗️  Building C Programming Zero to Hero\n")
+        sidebar_html = load_canonical_sidebar(str(self.root))
+        if sidebar_html is None:
+            return False
+        sidebar_digest = digest_of(sidebar_html)
+        layout_digest = digest_of(str(BUILD_VERSION), PAGE_LAYOUT.template)
+
+        self.load_state(layout_digest)
+        manifest = load_manifest(self.root)
+        to_render, to_sync = self.plan(manifest, sidebar_digest)
+        self.render(to_render, sidebar_html, sidebar_digest)
+        # Rendered pages already carry their widget tags; hand-written ones get them here
+        if manifest.exists(WIDGET_SOURCE):
+            for path in build_widgets(self.root, manifest, pages=to_sync)[0]:
+                print(f"Updated widgets: {path}")
+        self.sync(to_sync, sidebar_html, sidebar_digest)
+        try:
+            for path in build_quizzes(self.root)[0]:
+                print(f"Updated quiz: {path}")
+        except ValueError as e:
+            print(f"❌ {e}")
+            return False
+        # Reloaded so pages created by this build are indexed and precached
+        built = load_manifest(self.root)
+        build_search_index(self.root, manifest=built)
+        # Last, so it hashes the pages, quiz shards and search index as built
+        if built.exists(SERVICE_WORKER_NAME):
+            for path in build_precache(self.root, manifest=built)[0]:
+                print(f"Updated precache: {path}")
+
+        # Forget outputs that are no longer in the manifest
+        live = set(manifest.required_files)
+        self.state = {path: entry for path, entry in self.state.items() if path in live}
+        self.save_state(layout_digest)
+
+        s = self.stats
+        print(f"\nBuild complete. {s['rendered']} rendered, {s['skeletons']} skeletons created, "
+              f"{s['synced']} sidebars synced, {s['unchanged']} unchanged.\n")
+        return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build, sync and audit the site in one incremental pass")
+    parser.add_argument('root', nargs='?', default='.', help="Site root directory (default: current directory)")
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help="Render pages (and audit) in N worker processes (0 = one per CPU, default: 1)")
+    parser.add_argument('--force', action='store_true', help="Ignore the build state and rebuild every page")
+    parser.add_argument('--no-audit', action='store_true', help="Skip the audit after building")
+    args = parser.parse_args()
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    builder = SiteBuilder(args.root, jobs=jobs, force=args.force)
+    if not builder.build():
+        sys.exit(2)
+    if args.no_audit:
+        return
+    # Reload the manifest so pages created by this build are seen as present
+    auditor = SiteAuditor(args.root, jobs=jobs, cache_path=DEFAULT_CACHE_PATH, manifest=load_manifest(args.root))
+    sys.exit(auditor.run_audit())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Widget bundles for C Programming Zero to Hero
+src/quiz.js holds every interactive widget, but most pages use one or
+none of them. This splits it into one bundle per widget under
+assets/widgets/ and gives each page script tags for only the widgets whose
+containers it actually contains, so pages stop parsing and running ~75 KB
+of code they never use.
+
+src/quiz.js stays the file to edit (it sits outside assets/ so the bundles
+are the only copy that is served); run this after changing it or after
+adding a widget container to a page (build_site.py renders new pages with
+the right tags already).
+"""
+
+import argparse
+import os
+import re
+import sys
+from collections import namedtuple
+from html.parser import HTMLParser
+from pathlib import Path
+
+from build_assets import js_tokens
+from site_manifest import load_manifest
+from sync_sidebar import write_atomic
+
+WIDGET_SOURCE = 'src/quiz.js'
+WIDGET_DIR = 'assets/widgets'
+
+# name: bundle file name; declaration: class or function in WIDGET_SOURCE;
+# selector: '.class' or '#id' of the container that means a page uses it
+Widget = namedtuple('Widget', 'name declaration selector')
+
+WIDGETS = [
+    Widget('quiz', 'QuizWidget', '.quiz'),
+    Widget('timeline', 'TimelineWidget', '.timeline-container'),
+    Widget('memory-visualizer', 'MemoryVisualizerWidget', '.memory-visualizer'),
+    Widget('decision-visualizer', 'DecisionVisualizerWidget', '.decision-visualizer'),
+    Widget('loop-visualizer', 'LoopVisualizerWidget', '.loop-visualizer'),
+    Widget('pattern-generator', 'PatternGeneratorWidget', '.pattern-generator'),
+    Widget('loops-quiz', 'initializeLoopsQuiz', '#loops-quiz'),
+]
+
+BUNDLE_HEADER = f"// Generated by tools/build_widgets.py from {WIDGET_SOURCE} - edit that file instead\n\n"
+
+# A whole-line <script> tag for a widget bundle (or the unsplit assets/quiz.js), as written by render_layout()/this tool
+WIDGET_SCRIPT_RE = re.compile(r'^[ \t]*<script src="[^"]*assets/(?:quiz|widgets/[\w-]+)\.js"[^>]*></script>[ \t]*\n',
+                              re.MULTILINE)
+APP_SCRIPT_RE = re.compile(r'^([ \t]*)<script src="[^"]*assets/app\.js"[^>]*></script>[ \t]*\n', re.MULTILINE)
+
+
+class WidgetUsageParser(HTMLParser):
+    """Collect every class and id used on a page"""
+
+    def __init__(self):
+        super().__init__()
+        self.classes = set()
+        self.ids = set()
+
+    def handle_starttag(self, tag, attrs):
+        for name, value in attrs:
+            if name == 'class' and value:
+                self.classes.update(value.split())
+            elif name == 'id' and value:
+                self.ids.add(value)
+
+
+def widgets_used(html):
+    """The WIDGETS whose container appears in html, in WIDGETS order"""
+    parser = WidgetUsageParser()
+    parser.feed(html)
+    parser.close()
+    used = []
+    for widget in WIDGETS:
+        kind, name = widget.selector[0], widget.selector[1:]
+        if name in (parser.classes if kind == '.' else parser.ids):
+            used.append(widget)
+    return used
+
+
+def widget_script_tags(prefix, widgets, indent='    '):
+    """<script> lines loading the given widgets' bundles from a page at prefix"""
+    return [f'{indent}<script src="{prefix}{WIDGET_DIR}/{w.name}.js" defer></script>' for w in widgets]
+
+
+def split_declarations(js):
+    """Return {name: (keyword, source)} for each top-level class and function.
+
+    source runs from the doc comment directly above the declaration to its
+    closing brace. Uses the tokenizer from build_assets.py, so braces in
+    strings, templates and regexes don't confuse the nesting.
+    """
+    declarations = {}
+    depth = 0
+    lead = None             # start of the comments right before the next top-level token
+    keyword = None          # (keyword, start) after 'class'/'function' at the top level
+    current = None          # (name, keyword, start) of the declaration being read
+    for kind, start, end in js_tokens(js):
+        text = js[start:end]
+        if kind == 'comment':
+            if depth == 0 and current is None and lead is None:
+                lead = start
+            continue
+        if kind in ('space', 'newline'):
+            continue
+
+        if depth == 0 and current is None:
+            if keyword and kind == 'word':
+                current = (text, keyword[0], keyword[1])
+                keyword = None
+            elif kind == 'word' and text in ('class', 'function'):
+                keyword = (text, lead if lead is not None else start)
+            else:
+                keyword = None
+            lead = None
+
+        if kind == 'punct' and text == '{':
+            depth += 1
+        elif kind == 'punct' and text == '}':
+            depth -= 1
+            if depth == 0 and current is not None:
+                name, decl_keyword, decl_start = current
+                declarations[name] = (decl_keyword, js[decl_start:end])
+                current = None
+    return declarations
+
+
+def render_bundle(widget, keyword, source):
+    """One widget's declaration plus the DOMContentLoaded hook that starts it"""
+    if keyword == 'class':
+        init = f"  document.querySelectorAll('{widget.selector}').forEach(container => new {widget.declaration}(container));"
+    else:
+        init = f"  {widget.declaration}();"
+    return (f"{BUNDLE_HEADER}{source}\n\n"
+            f"document.addEventListener('DOMContentLoaded', () => {{\n{init}\n}});\n")
+
+
+def rewrite_widget_scripts(html, prefix, widgets):
+    """Replace a page's quiz.js/widget <script> lines with tags for exactly the given widgets.
+
+    New tags go right after the app.js tag (or before </body> without one).
+    """
+    html = WIDGET_SCRIPT_RE.sub('', html)
+    if not widgets:
+        return html
+    match = APP_SCRIPT_RE.search(html)
+    if match:
+        tags = ''.join(f"{line}\n" for line in widget_script_tags(prefix, widgets, match.group(1)))
+        return html[:match.end()] + tags + html[match.end():]
+    body = html.rfind('</body>')
+    if body < 0:
+        return html
+    tags = ''.join(f"{line}\n" for line in widget_script_tags(prefix, widgets))
+    return html[:body] + tags + html[body:]
+
+
+def build_widgets(root='.', manifest=None, check=False, pages=None):
+    """Write the widget bundles and each manifest page's widget tags.
+
+    pages limits which pages are rewritten (default: every manifest page).
+    Returns (stale, usage): the root-relative files that were (or with
+    check=True, would be) rewritten and {page: [widget name, ...]} for pages
+    that use any widget. Raises ValueError if a widget's declaration is
+    missing from WIDGET_SOURCE.
+    """
+    root = Path(root)
+    manifest = manifest or load_manifest(root)
+    with open(root / WIDGET_SOURCE, 'r', encoding='utf-8') as f:
+        declarations = split_declarations(f.read())
+
+    outputs = {}
+    for widget in WIDGETS:
+        if widget.declaration not in declarations:
+            raise ValueError(f"{widget.declaration} not found in {WIDGET_SOURCE}")
+        outputs[f"{WIDGET_DIR}/{widget.name}.js"] = render_bundle(widget, *declarations[widget.declaration])
+
+    usage = {}
+    for path in manifest.html_files if pages is None else pages:
+        if not manifest.exists(path):
+            continue
+        with open(root / path, 'r', encoding='utf-8', newline='') as f:
+            html = f.read()
+        widgets = widgets_used(html)
+        if widgets:
+            usage[path] = [w.name for w in widgets]
+        outputs[path] = rewrite_widget_scripts(html, "../" * path.count('/'), widgets)
+
+    stale = []
+    for path, content in outputs.items():
+        full_path = root / path
+        try:
+            with open(full_path, 'r', encoding='utf-8', newline='') as f:
+                if f.read() == content:
+                    continue
+        except OSError:
+            pass
+        stale.append(path)
+        if not check:
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(str(full_path), content)
+
+    # Drop bundles for widgets that no longer exist
+    bundles = {f"{w.name}.js" for w in WIDGETS}
+    if (root / WIDGET_DIR).is_dir():
+        for entry in os.scandir(root / WIDGET_DIR):
+            if entry.name.endswith('.js') and entry.name not in bundles:
+                stale.append(f"{WIDGET_DIR}/{entry.name}")
+                if not check:
+                    os.unlink(entry.path)
+    return stale, usage
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Split quiz.js into per-widget bundles and load only what each page uses")
+    parser.add_argument('root', nargs='?', default='.', help="Site root directory (default: current directory)")
+    parser.add_argument('--check', action='store_true',
+                        help="Don't write anything; exit 1 if bundles or page script tags are out of date")
+    args = parser.parse_args()
+
+    try:
+        stale, usage = build_widgets(args.root, check=args.check)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(2)
+
+    for path, names in usage.items():
+        print(f"🧩 {path}: {', '.join(names)}")
+    verb = "Out of date" if args.check else "Updated"
+    for path in stale:
+        print(f"{verb}: {path}")
+    print(f"\n{len(usage)} pages use widgets, {len(stale)} files {'stale' if args.check else 'updated'}.")
+    if args.check and stale:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
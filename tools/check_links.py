@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+External link checker for C Programming Zero to Hero
+Checks every ``http://``/``https://`` link on the site, which the audit's
+internal link check skips.
+
+- Each distinct URL is requested once (fragments are ignored), first with
+  HEAD and, when a server rejects or mishandles HEAD, with GET. Redirects
+  are followed up to MAX_REDIRECTS.
+- Requests run concurrently on asyncio, at most MAX_CONCURRENCY at once and
+  PER_HOST_CONNECTIONS per host, over keep-alive connections pooled per host.
+- Results are cached in tools/.link-cache.json and reused for CACHE_TTL
+  (FAILURE_TTL for links that failed, so they are retried sooner), so a
+  re-run only fetches new and expired URLs.
+- ``offline=True`` makes no requests at all: cached results are replayed
+  whatever their age and uncached URLs are reported as unchecked. ``stub``
+  sends every request to a local server instead, as
+  ``<stub>/<host>/<path>`` (``python3 -m http.server`` over a directory of
+  fixtures works), so CI can exercise the checker without a network; stub
+  results are never written to the cache.
+
+Only 404 and 410 are errors. Other failures (5xx, timeouts, refused
+connections, rate limiting) are usually temporary and are warnings.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import ssl
+import sys
+import time
+from collections import namedtuple
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+from site_manifest import load_manifest
+
+# Bump when the way results are computed changes
+CHECKER_VERSION = 1
+DEFAULT_CACHE_PATH = 'tools/.link-cache.json'
+CACHE_TTL = 7 * 24 * 3600       # seconds a successful result is trusted
+FAILURE_TTL = 24 * 3600         # ... and a failed one
+MAX_CONCURRENCY = 16
+PER_HOST_CONNECTIONS = 2
+MAX_REDIRECTS = 5
+TIMEOUT = 10                    # seconds per request
+USER_AGENT = 'czh-link-checker/1.0'
+# Statuses some servers send for HEAD when GET would work
+HEAD_FALLBACK_STATUSES = {400, 403, 404, 405, 501}
+BROKEN_STATUSES = {404, 410}
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+ExternalLink = namedtuple('ExternalLink', 'page line url')
+
+
+class LinkExtractor(HTMLParser):
+    """Collect every external <a href> on a page with its line"""
+
+    def __init__(self, page):
+        super().__init__()
+        self.page = page
+        self.links = []
+
+    def handle_starttag(self, tag, attrs):
+        href = dict(attrs).get('href') if tag == 'a' else None
+        if href and is_external(href):
+            self.links.append(ExternalLink(self.page, self.getpos()[0], href))
+
+
+def is_external(href):
+    return href.startswith(('http://', 'https://'))
+
+
+def extract_links(root, page):
+    """Every external link on one root-relative page"""
+    extractor = LinkExtractor(page)
+    with open(Path(root) / page, 'r', encoding='utf-8') as f:
+        extractor.feed(f.read())
+    extractor.close()
+    return extractor.links
+
+
+def strip_fragment(url):
+    return url.split('#', 1)[0]
+
+
+class LinkCache:
+    """Results keyed by URL: {'status', 'error', 'url' (after redirects), 'checked' (epoch seconds)}"""
+
+    def __init__(self, path):
+        self.path = Path(path) if path else None
+        self.results = {}
+        self.used = set()
+        if not self.path:
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') == CHECKER_VERSION:
+            self.results = data.get('results', {})
+
+    def get(self, url, now=None, any_age=False):
+        """The cached result for url, or None if there is none or it has expired"""
+        self.used.add(url)
+        result = self.results.get(url)
+        if result is None or any_age:
+            return result
+        ttl = CACHE_TTL if result_ok(result) else FAILURE_TTL
+        return result if (now or time.time()) - result['checked'] < ttl else None
+
+    def put(self, url, result):
+        self.used.add(url)
+        self.results[url] = result
+
+    def save(self):
+        """Write the cache, keeping only URLs seen in this run"""
+        if not self.path:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CHECKER_VERSION,
+                       'results': {k: v for k, v in self.results.items() if k in self.used}}, f, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+def result_ok(result):
+    return result['error'] is None and 200 <= result['status'] < 400
+
+
+class ConnectionPool:
+    """Keep-alive connections per (scheme, host, port), at most PER_HOST_CONNECTIONS each"""
+
+    def __init__(self, per_host=PER_HOST_CONNECTIONS):
+        self.per_host = per_host
+        self.limits = {}
+        self.idle = {}
+        self.ssl_context = ssl.create_default_context()
+
+    def limit(self, origin):
+        if origin not in self.limits:
+            self.limits[origin] = asyncio.Semaphore(self.per_host)
+        return self.limits[origin]
+
+    async def connect(self, origin):
+        """Return (reader, writer, reused) for origin, reusing an idle connection when there is one"""
+        idle = self.idle.get(origin)
+        while idle:
+            reader, writer = idle.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return reader, writer, True
+            writer.close()
+        scheme, host, port = origin
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port, ssl=self.ssl_context if scheme == 'https' else None),
+            TIMEOUT)
+        return reader, writer, False
+
+    def release(self, origin, reader, writer, reusable):
+        if reusable:
+            self.idle.setdefault(origin, []).append((reader, writer))
+        else:
+            writer.close()
+
+    def close(self):
+        for connections in self.idle.values():
+            for _, writer in connections:
+                writer.close()
+        self.idle.clear()
+
+
+class LinkChecker:
+    """Check external URLs and turn the results into issues.
+
+    Issues are ``(code, severity, page, line, message)`` tuples, compatible
+    with site_audit.AuditIssue: external-link-broken (404/410),
+    external-link-error (any other failure) and external-link-unchecked
+    (offline, with no cached result).
+    """
+
+    def __init__(self, root, cache_path=DEFAULT_CACHE_PATH, offline=False, stub=None,
+                 concurrency=MAX_CONCURRENCY, per_host=PER_HOST_CONNECTIONS):
+        self.root = Path(root)
+        self.offline = offline
+        self.stub = stub.rstrip('/') if stub else None
+        # A stub's answers say nothing about the real URLs, so keep them out of the cache
+        self.cache = LinkCache(self.root / cache_path if cache_path and not self.stub else None)
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.stats = {'links': 0, 'urls': 0, 'fetched': 0, 'cached': 0, 'unchecked': 0}
+
+    def check(self, links):
+        """Return the issues for links, an iterable of ExternalLink (or (page, line, url))"""
+        links = [ExternalLink(*link) for link in links]
+        urls = sorted({strip_fragment(link.url) for link in links})
+        self.stats['links'] += len(links)
+        self.stats['urls'] += len(urls)
+
+        results = {}
+        pending = []
+        now = time.time()
+        for url in urls:
+            result = self.cache.get(url, now, any_age=self.offline)
+            if result is not None:
+                results[url] = result
+                self.stats['cached'] += 1
+            elif self.offline:
+                self.stats['unchecked'] += 1
+            else:
+                pending.append(url)
+        if pending:
+            fetched = asyncio.run(self._fetch_all(pending))
+            for url, result in fetched.items():
+                self.cache.put(url, result)
+            results.update(fetched)
+            self.stats['fetched'] += len(pending)
+        self.cache.save()
+
+        issues = []
+        for link in links:
+            result = results.get(strip_fragment(link.url))
+            if result is None:
+                issues.append(('external-link-unchecked', 'warning', link.page, link.line,
+                               f"External link {link.url} not checked (offline, no cached result)"))
+            elif not result_ok(result):
+                code, severity = (('external-link-broken', 'error') if result['status'] in BROKEN_STATUSES
+                                  else ('external-link-error', 'warning'))
+                issues.append((code, severity, link.page, link.line,
+                               f"External link {link.url}: {describe(result)}"))
+        return issues
+
+    async def _fetch_all(self, urls):
+        pool = ConnectionPool(self.per_host)
+        limit = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(url):
+            async with limit:
+                return url, await self.fetch(pool, url)
+
+        try:
+            return dict(await asyncio.gather(*(fetch(url) for url in urls)))
+        finally:
+            pool.close()
+
+    async def fetch(self, pool, url):
+        """Check one URL, following redirects; returns a cache result"""
+        checked = time.time()
+        current = url
+        try:
+            for _ in range(MAX_REDIRECTS + 1):
+                status, headers = await self.request(pool, 'HEAD', current)
+                if status in HEAD_FALLBACK_STATUSES:
+                    status, headers = await self.request(pool, 'GET', current)
+                location = headers.get('location')
+                if status not in REDIRECT_STATUSES or not location:
+                    return {'status': status, 'error': None, 'url': current, 'checked': checked}
+                current = self.follow(current, location)
+            error = f"more than {MAX_REDIRECTS} redirects"
+        except asyncio.TimeoutError:
+            error = f"timed out after {TIMEOUT}s"
+        except (OSError, ValueError, asyncio.IncompleteReadError, asyncio.LimitOverrunError) as e:
+            error = str(e) or type(e).__name__
+        return {'status': None, 'error': error, 'url': current, 'checked': checked}
+
+    def route(self, url):
+        """(origin, request target, Host header) for url, honouring the stub server"""
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise ValueError(f"unsupported URL {url}")
+        target = urlunsplit(('', '', parts.path or '/', parts.query, ''))
+        netloc = parts.netloc.rsplit('@', 1)[-1]
+        if self.stub:
+            stub = urlsplit(self.stub)
+            parts, target = stub, f"{stub.path}/{netloc}{target}"
+            netloc = stub.netloc
+        port = parts.port or (443 if parts.scheme == 'https' else 80)
+        return (parts.scheme, parts.hostname, port), target, netloc
+
+    def follow(self, url, location):
+        """The URL a redirect from url to location points at, mapping stub paths back to real URLs"""
+        if not self.stub:
+            return strip_fragment(urljoin(url, location))
+        origin, target, host = self.route(url)
+        resolved = strip_fragment(urljoin(f"{self.stub}{target[len(urlsplit(self.stub).path):]}", location))
+        if resolved.startswith(self.stub + '/'):
+            return f"{urlsplit(url).scheme}://{resolved[len(self.stub) + 1:]}"
+        return resolved
+
+    async def request(self, pool, method, url):
+        """Send one request and return (status, {lower-case header: value}) without reading a body"""
+        origin, target, host = self.route(url)
+        request = (f"{method} {target} HTTP/1.1\r\nHost: {host}\r\nUser-Agent: {USER_AGENT}\r\n"
+                   f"Accept: */*\r\nConnection: keep-alive\r\n\r\n").encode('latin-1')
+        async with pool.limit(origin):
+            for attempt in range(2):
+                reader, writer, reused = await pool.connect(origin)
+                try:
+                    writer.write(request)
+                    await writer.drain()
+                    head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), TIMEOUT)
+                except (OSError, asyncio.IncompleteReadError):
+                    writer.close()
+                    # The server may have dropped an idle connection; retry once on a fresh one
+                    if reused and attempt == 0:
+                        continue
+                    raise
+                except BaseException:
+                    writer.close()
+                    raise
+                break
+
+        lines = head.decode('latin-1').split('\r\n')
+        version, status = lines[0].split(None, 2)[:2]
+        headers = {}
+        for line in lines[1:]:
+            name, sep, value = line.partition(':')
+            if sep:
+                headers[name.strip().lower()] = value.strip()
+        # A HEAD response has no body, so its connection can be reused; GET bodies aren't read
+        reusable = (method == 'HEAD' and version == 'HTTP/1.1'
+                    and headers.get('connection', '').lower() != 'close')
+        pool.release(origin, reader, writer, reusable)
+        return int(status), headers
+
+
+def describe(result):
+    if result['error']:
+        return result['error']
+    return f"HTTP {result['status']}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check every external link on the site")
+    parser.add_argument('root', nargs='?', default='.', help="Site root directory (default: current directory)")
+    parser.add_argument('--offline', action='store_true',
+                        help="Make no requests: replay cached results, whatever their age")
+    parser.add_argument('--stub', metavar='URL',
+                        help="Send every request to this local server as <URL>/<host>/<path> (results aren't cached)")
+    parser.add_argument('--no-cache', action='store_true', help="Re-check every URL")
+    parser.add_argument('-c', '--concurrency', type=int, default=MAX_CONCURRENCY,
+                        help=f"Requests in flight at once (default: {MAX_CONCURRENCY})")
+    args = parser.parse_args()
+
+    manifest = load_manifest(args.root)
+    checker = LinkChecker(args.root, cache_path=None if args.no_cache else DEFAULT_CACHE_PATH,
+                          offline=args.offline, stub=args.stub, concurrency=args.concurrency)
+    links = [link for page in manifest.html_files if manifest.exists(page)
+             for link in extract_links(args.root, page)]
+    start = time.perf_counter()
+    issues = checker.check(links)
+    for code, severity, page, line, message in issues:
+        icon = "❌" if severity == 'error' else "⚠️"
+        print(f"{icon} {page}:{line}: {message}")
+    s = checker.stats
+    print(f"\n🌐 {s['links']} links to {s['urls']} URLs: {s['fetched']} fetched, {s['cached']} cached, "
+          f"{s['unchecked']} unchecked ({time.perf_counter() - start:.1f}s)")
+    sys.exit(1 if any(severity == 'error' for _, severity, *_ in issues) else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,501 @@
+#!/usr/bin/env python3
+"""
+Code example checker for C Programming Zero to Hero
+Compiles every ``<code class="language-c">`` block with the local C compiler
+and reports errors and warnings by page, block index and source line.
+
+- Entities (``&lt;`` ...) are unescaped by the HTML parser, so the compiler
+  sees exactly what a reader would copy.
+- Blocks with a ``main`` function are compiled as programs, with the common
+  headers added when they have no ``#include`` of their own. Other blocks
+  are fragments: they are tried as file-scope code and as the body of
+  ``main``, and only reported if one of those compiles; fragments that need
+  surrounding context are counted, not flagged.
+- ``data-compile="fail"`` marks a block that shows a mistake on purpose: it
+  is compiled exactly as written and only reported if it compiles cleanly.
+  ``data-compile="skip"`` skips a block.
+- The compiler runs in a throwaway directory with a minimal environment,
+  CPU/memory/file-size limits and a timeout, fanned out over a process pool.
+- Results are cached by compiler, flags and source hash, so unchanged blocks
+  are never recompiled.
+
+With ``--run``, programs that state their output are also built and run, and
+their stdout is checked against it. The stated output is either an
+``// Output: ...`` comment, an ``/* Output: ... */`` comment (one output line
+per comment line) or a ``data-output`` attribute on the code element; each
+must appear in stdout as whole lines, in order, with runs of whitespace
+compared as one space. Programs run with empty stdin. Binaries are kept in a
+content-addressed directory, so re-runs only rebuild edited programs.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from html.parser import HTMLParser
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:     # not available on Windows; limits are skipped there
+    resource = None
+
+from site_manifest import load_manifest
+
+# Bump when extraction or the way results are computed changes
+CHECKER_VERSION = 1
+DEFAULT_CACHE_PATH = 'tools/.snippet-cache.json'
+DEFAULT_BINARY_DIR = 'tools/.snippet-bin'
+COMPILERS = ('cc', 'gcc', 'clang')
+COMPILE_FLAGS = ['-std=c11', '-Wall', '-Wextra']
+# Wrapping a fragment leaves its variables unused, and a statement misread as
+# a file-scope declaration (or a call to a function defined elsewhere) must
+# not count as compiling
+FRAGMENT_FLAGS = ['-Wno-unused-variable', '-Wno-unused-but-set-variable', '-Werror=implicit-int',
+                  '-Werror=implicit-function-declaration']
+LINK_FLAGS = ['-lm']
+COMPILE_TIMEOUT = 10            # seconds per compiler invocation
+RUN_TIMEOUT = 5                 # seconds per program run
+MEMORY_LIMIT = 512 * 1024 * 1024
+FILE_SIZE_LIMIT = 16 * 1024 * 1024
+
+FRAGMENT_PRELUDE = ''.join(f"#include <{h}.h>\n" for h in ('stdio', 'stdlib', 'string', 'ctype', 'math', 'stdbool'))
+MAIN_RE = re.compile(r'\bmain\s*\(')
+INCLUDE_RE = re.compile(r'^\s*#\s*include\b', re.MULTILINE)
+DIAGNOSTIC_RE = re.compile(r'^<stdin>:(\d+):(?:\d+:)? (warning|error|fatal error): (.*)$', re.MULTILINE)
+OUTPUT_COMMENT_RE = re.compile(r'//\s*Output:([^\n]*)|/\*\s*Output:(.*?)\*/', re.DOTALL)
+
+# page: root-relative path; index: 1-based position among the page's C blocks;
+# line: source line of the block's first line; expect: '', 'fail' or 'skip';
+# output: the data-output attribute, or None
+Snippet = namedtuple('Snippet', 'page index line source expect output')
+
+
+class CodeBlockExtractor(HTMLParser):
+    """Collect the text of every <code class="language-c"> block"""
+
+    def __init__(self, page):
+        super().__init__()      # convert_charrefs=True: &lt; etc. arrive unescaped
+        self.page = page
+        self.snippets = []
+        self._depth = 0         # nesting depth inside the current code block
+        self._start = None
+        self._text = []
+        self._expect = ''
+        self._output = None
+
+    def handle_starttag(self, tag, attrs):
+        if self._depth:
+            self._depth += tag == 'code'
+            return
+        attrs = dict(attrs)
+        if tag == 'code' and 'language-c' in (attrs.get('class') or '').split():
+            self._depth = 1
+            self._start = self.getpos()[0]
+            self._text = []
+            self._expect = attrs.get('data-compile', '')
+            self._output = attrs.get('data-output')
+
+    def handle_endtag(self, tag):
+        if self._depth and tag == 'code':
+            self._depth -= 1
+            if not self._depth:
+                self.snippets.append(Snippet(self.page, len(self.snippets) + 1, self._start,
+                                             ''.join(self._text), self._expect, self._output))
+
+    def handle_data(self, data):
+        if self._depth:
+            self._text.append(data)
+
+
+def extract_snippets(root, page):
+    """Every C code block on one root-relative page"""
+    extractor = CodeBlockExtractor(page)
+    with open(Path(root) / page, 'r', encoding='utf-8') as f:
+        extractor.feed(f.read())
+    extractor.close()
+    return extractor.snippets
+
+
+def find_compiler():
+    """Path of the first available C compiler, or None"""
+    for name in COMPILERS:
+        path = shutil.which(name)
+        if path:
+            return path
+    return None
+
+
+def compiler_id(compiler):
+    """First line of ``--version``, so upgrading the compiler invalidates the cache"""
+    result = subprocess.run([compiler, '--version'], capture_output=True, text=True, timeout=COMPILE_TIMEOUT)
+    return result.stdout.splitlines()[0] if result.stdout else compiler
+
+
+def _limit_resources():
+    """preexec_fn: cap CPU time, memory and output size of the compiler or program"""
+    if resource is None:
+        return
+    resource.setrlimit(resource.RLIMIT_CPU, (COMPILE_TIMEOUT, COMPILE_TIMEOUT + 1))
+    resource.setrlimit(resource.RLIMIT_AS, (MEMORY_LIMIT, MEMORY_LIMIT))
+    resource.setrlimit(resource.RLIMIT_FSIZE, (FILE_SIZE_LIMIT, FILE_SIZE_LIMIT))
+
+
+def run_sandboxed(args, stdin_text, cwd, timeout=COMPILE_TIMEOUT):
+    """Run args in cwd with a minimal environment and resource limits.
+
+    Returns (returncode, stdout, stderr); a timeout gives returncode None.
+    """
+    env = {'PATH': os.environ.get('PATH', '/usr/bin:/bin'), 'LC_ALL': 'C', 'TMPDIR': cwd}
+    try:
+        result = subprocess.run(args, input=stdin_text, capture_output=True, text=True, cwd=cwd, env=env,
+                                timeout=timeout, preexec_fn=_limit_resources, start_new_session=True,
+                                errors='replace')
+    except subprocess.TimeoutExpired as e:
+        # Partial output of a timed-out process comes back as bytes
+        decode = lambda out: out.decode('utf-8', 'replace') if isinstance(out, bytes) else out or ''
+        return None, decode(e.stdout), decode(e.stderr)
+    return result.returncode, result.stdout, result.stderr
+
+
+def translation_units(source, as_written=False):
+    """(prelude line count, extra flags, full source) candidates to compile for one block"""
+    prelude_lines = FRAGMENT_PRELUDE.count('\n')
+    if MAIN_RE.search(source):
+        if as_written or INCLUDE_RE.search(source):
+            return [(0, [], source)]
+        return [(prelude_lines, [], FRAGMENT_PRELUDE + source)]
+    return [(prelude_lines, FRAGMENT_FLAGS, FRAGMENT_PRELUDE + source + '\n'),
+            (prelude_lines + 1, FRAGMENT_FLAGS, f"{FRAGMENT_PRELUDE}int main(void) {{\n{source}\nreturn 0;\n}}\n")]
+
+
+def parse_diagnostics(stderr, offset, line_count):
+    """[[line, severity, message]] with lines relative to the block (None outside it)"""
+    diagnostics = []
+    for match in DIAGNOSTIC_RE.finditer(stderr):
+        line = int(match.group(1)) - offset
+        severity = 'warning' if match.group(2) == 'warning' else 'error'
+        diagnostics.append([line if 1 <= line <= line_count else None, severity, match.group(3)])
+    return diagnostics
+
+
+def compile_source(compiler, source, as_written=False):
+    """Compile one block; module-level so it can run in a worker process.
+
+    Returns ``{'status': ..., 'diagnostics': [...]}`` where status is 'ok',
+    'warning', 'error' (a program that doesn't compile), 'fragment' (a
+    fragment that compiles in no form) or 'timeout'. Of a fragment's forms,
+    the first that compiles without diagnostics wins, then the first that
+    compiles at all.
+    """
+    line_count = source.count('\n') + 1
+    units = translation_units(source, as_written)
+    compiled = []
+    with tempfile.TemporaryDirectory(prefix='snippet-') as workdir:
+        for offset, flags, unit in units:
+            returncode, _, stderr = run_sandboxed(
+                [compiler, '-x', 'c', *COMPILE_FLAGS, *flags, '-fsyntax-only', '-'], unit, workdir)
+            if returncode is None:
+                return {'status': 'timeout', 'diagnostics': []}
+            diagnostics = parse_diagnostics(stderr, offset, line_count)
+            if returncode == 0 and not diagnostics:
+                return {'status': 'ok', 'diagnostics': []}
+            if returncode == 0:
+                compiled.append(diagnostics)
+    if compiled:
+        return {'status': 'warning', 'diagnostics': compiled[0]}
+    if len(units) > 1:
+        return {'status': 'fragment', 'diagnostics': []}
+    return {'status': 'error', 'diagnostics': diagnostics}
+
+
+def normalize_lines(text):
+    """Lines of text with whitespace runs collapsed, dropping leading/trailing blank lines"""
+    lines = [' '.join(line.split()) for line in text.splitlines()]
+    while lines and not lines[0]:
+        lines.pop(0)
+    while lines and not lines[-1]:
+        lines.pop()
+    return lines
+
+
+def stated_outputs(snippet):
+    """[(line within the block, [normalized lines])] a program claims to print"""
+    if not MAIN_RE.search(snippet.source):
+        return []
+    stated = []
+    if snippet.output is not None:
+        stated.append((1, normalize_lines(snippet.output)))
+    for match in OUTPUT_COMMENT_RE.finditer(snippet.source):
+        lines = normalize_lines(match.group(1) if match.group(1) is not None else match.group(2))
+        if lines:
+            stated.append((snippet.source.count('\n', 0, match.start()) + 1, lines))
+    return stated
+
+
+def find_lines(needle, haystack, start):
+    """Index just past the first run of needle lines in haystack at or after start, or None"""
+    for i in range(start, len(haystack) - len(needle) + 1):
+        if haystack[i:i + len(needle)] == needle:
+            return i + len(needle)
+    return None
+
+
+def run_program(compiler, binary_dir, key, source):
+    """Build (unless cached) and run one program; module-level for worker processes.
+
+    The binary is stored as binary_dir/key, so unchanged programs are never
+    relinked. Returns ``{'status': ..., 'stdout': ..., 'detail': ...}`` with
+    status 'ok', 'build-error', 'timeout' or 'exit' (non-zero exit status or
+    killed by a signal).
+    """
+    binary = Path(binary_dir) / key
+    if not INCLUDE_RE.search(source):
+        source = FRAGMENT_PRELUDE + source
+    with tempfile.TemporaryDirectory(prefix='snippet-') as workdir:
+        if not binary.exists():
+            tmp_binary = os.path.join(workdir, 'a.out')
+            returncode, _, stderr = run_sandboxed(
+                [compiler, '-x', 'c', *COMPILE_FLAGS, '-o', tmp_binary, '-', *LINK_FLAGS], source, workdir)
+            if returncode != 0:
+                errors = [m.group(3) for m in DIAGNOSTIC_RE.finditer(stderr) if m.group(2) != 'warning']
+                return {'status': 'build-error', 'stdout': '',
+                        'detail': errors[0] if errors else (stderr.strip().splitlines() or ['timed out'])[-1]}
+            binary.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(tmp_binary, binary.with_name(binary.name + '.tmp'))
+            os.replace(binary.with_name(binary.name + '.tmp'), binary)
+        returncode, stdout, _ = run_sandboxed([str(binary.resolve())], '', workdir, timeout=RUN_TIMEOUT)
+    if returncode is None:
+        return {'status': 'timeout', 'stdout': stdout, 'detail': ''}
+    if returncode != 0:
+        detail = f"killed by signal {-returncode}" if returncode < 0 else f"exit status {returncode}"
+        return {'status': 'exit', 'stdout': stdout, 'detail': detail}
+    return {'status': 'ok', 'stdout': stdout, 'detail': ''}
+
+
+class SnippetCache:
+    """Compile results keyed by a hash of checker version, compiler, flags and source"""
+
+    def __init__(self, path):
+        self.path = Path(path) if path else None
+        self.results = {}
+        self.used = set()
+        if not self.path:
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') == CHECKER_VERSION:
+            self.results = data.get('results', {})
+
+    @staticmethod
+    def key(*parts):
+        h = hashlib.sha256()
+        for part in parts:
+            h.update(str(part).encode('utf-8'))
+            h.update(b'\0')
+        return h.hexdigest()
+
+    def get(self, key):
+        self.used.add(key)
+        return self.results.get(key)
+
+    def put(self, key, result):
+        self.used.add(key)
+        self.results[key] = result
+
+    def save(self):
+        """Write the cache, keeping only results used in this run"""
+        if not self.path:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CHECKER_VERSION,
+                       'results': {k: v for k, v in self.results.items() if k in self.used}}, f, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+class SnippetChecker:
+    """Compile every C block of the given pages and turn the results into issues.
+
+    Issues are ``(code, severity, page, line, message)`` tuples, compatible
+    with site_audit.AuditIssue: compile-error (a program that doesn't
+    compile), compile-warning, compile-timeout and compile-unexpected (a
+    data-compile="fail" block that compiles cleanly). With run=True, programs
+    that state their output are also run: output-mismatch, run-error (the
+    program fails to build or exits non-zero) and run-timeout.
+    """
+
+    def __init__(self, root, jobs=1, cache_path=DEFAULT_CACHE_PATH, compiler=None, run=False,
+                 binary_dir=DEFAULT_BINARY_DIR):
+        self.root = Path(root)
+        self.jobs = jobs
+        self.compiler = compiler or find_compiler()
+        self.cache = SnippetCache(self.root / cache_path if cache_path else None)
+        self.run = run
+        self.binary_dir = self.root / binary_dir
+        self.stats = {'blocks': 0, 'compiled': 0, 'cached': 0, 'fragments': 0, 'skipped': 0,
+                      'ran': 0, 'built': 0}
+
+    def _map(self, fn, *iterables):
+        """map() over the process pool when there is more than one item and job"""
+        if self.jobs > 1 and len(iterables[0]) > 1:
+            with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                return list(executor.map(fn, *iterables))
+        return list(map(fn, *iterables))
+
+    def check(self, pages):
+        """Return the issues for every block on pages (empty if no compiler is installed)"""
+        if not self.compiler:
+            return []
+        compiler_key = compiler_id(self.compiler)
+        snippets = []
+        for page in pages:
+            for snippet in extract_snippets(self.root, page):
+                if snippet.expect == 'skip':
+                    self.stats['skipped'] += 1
+                else:
+                    snippets.append(snippet)
+        self.stats['blocks'] += len(snippets)
+
+        keys = [self.cache.key(CHECKER_VERSION, compiler_key, ' '.join(COMPILE_FLAGS + FRAGMENT_FLAGS),
+                               s.expect, s.source)
+                for s in snippets]
+        results = {key: self.cache.get(key) for key in keys}
+        todo = {key: s for key, s in zip(keys, snippets) if results[key] is None}
+        self.stats['cached'] += len(snippets) - len(todo)
+        self.stats['compiled'] += len(todo)
+
+        fresh = self._map(partial(compile_source, self.compiler),
+                          [s.source for s in todo.values()], [s.expect == 'fail' for s in todo.values()])
+        for key, result in zip(todo, fresh):
+            if result['status'] != 'timeout':
+                self.cache.put(key, result)
+            results[key] = result
+        self.cache.save()
+
+        issues = []
+        for snippet, key in zip(snippets, keys):
+            issues.extend(self._issues_for(snippet, results[key]))
+        if self.run:
+            runnable = [s for s, key in zip(snippets, keys)
+                        if s.expect != 'fail' and results[key]['status'] in ('ok', 'warning')]
+            issues.extend(self.run_programs(runnable, compiler_key))
+        return issues
+
+    def run_programs(self, snippets, compiler_key):
+        """Run every snippet that states its output and compare stdout with it"""
+        stated = {s: stated_outputs(s) for s in snippets}
+        snippets = [s for s in snippets if stated[s]]
+        keys = [self.cache.key(CHECKER_VERSION, compiler_key, ' '.join(COMPILE_FLAGS + LINK_FLAGS), s.source)
+                for s in snippets]
+        self.stats['built'] += sum(not (self.binary_dir / key).exists() for key in set(keys))
+        self.stats['ran'] += len(snippets)
+        # Each distinct program is built and run once, so no two workers stage the same binary
+        programs = {key: s.source for key, s in zip(keys, snippets)}
+        fresh = self._map(partial(run_program, self.compiler, str(self.binary_dir)),
+                          list(programs), list(programs.values()))
+        by_key = dict(zip(programs, fresh))
+        results = [by_key[key] for key in keys]
+
+        # Binaries are content-addressed: anything not used in this run is stale
+        if self.binary_dir.is_dir():
+            live = set(keys)
+            for entry in os.scandir(self.binary_dir):
+                if entry.name not in live:
+                    os.unlink(entry.path)
+
+        issues = []
+        for snippet, result in zip(snippets, results):
+            where = f"Code block {snippet.index}"
+            if result['status'] == 'build-error':
+                issues.append(('run-error', 'error', snippet.page, snippet.line,
+                               f"{where} doesn't build: {result['detail']}"))
+                continue
+            if result['status'] == 'timeout':
+                issues.append(('run-timeout', 'error', snippet.page, snippet.line,
+                               f"{where} didn't finish within {RUN_TIMEOUT}s"))
+                continue
+            if result['status'] == 'exit':
+                issues.append(('run-error', 'warning', snippet.page, snippet.line,
+                               f"{where} ended with {result['detail']}"))
+            actual = normalize_lines(result['stdout'])
+            position = 0
+            for line, expected in stated[snippet]:
+                end = find_lines(expected, actual, position)
+                if end is None:
+                    shown = ' / '.join(expected)
+                    issues.append(('output-mismatch', 'error', snippet.page, snippet.line + line - 1,
+                                   f"{where} (line {line}): stated output \"{shown}\" not found in what it "
+                                   f"prints: \"{' / '.join(actual[position:position + len(expected) + 2])}\""))
+                    continue
+                position = end
+        return issues
+
+    def _issues_for(self, snippet, result):
+        status = result['status']
+        where = f"Code block {snippet.index}"
+        if status == 'fragment':
+            self.stats['fragments'] += 1
+            return []
+        if status == 'timeout':
+            return [('compile-timeout', 'warning', snippet.page, snippet.line,
+                     f"{where}: compiler timed out after {COMPILE_TIMEOUT}s")]
+        if snippet.expect == 'fail':
+            if status == 'ok':
+                return [('compile-unexpected', 'warning', snippet.page, snippet.line,
+                         f"{where} is marked data-compile=\"fail\" but compiles cleanly")]
+            return []
+
+        issues = []
+        for line, severity, message in result['diagnostics']:
+            page_line = snippet.line + line - 1 if line else snippet.line
+            code = 'compile-error' if severity == 'error' else 'compile-warning'
+            issues.append((code, severity, snippet.page, page_line,
+                           f"{where} (line {line or '?'}): {message}"))
+        return issues
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile every C code example on the site")
+    parser.add_argument('root', nargs='?', default='.', help="Site root directory (default: current directory)")
+    parser.add_argument('-j', '--jobs', type=int, default=0,
+                        help="Compile in N worker processes (0 = one per CPU, the default)")
+    parser.add_argument('--no-cache', action='store_true', help="Recompile every block")
+    parser.add_argument('--run', action='store_true',
+                        help="Also run programs that state their output and check that they print it")
+    args = parser.parse_args()
+
+    manifest = load_manifest(args.root)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    checker = SnippetChecker(args.root, jobs=jobs, cache_path=None if args.no_cache else DEFAULT_CACHE_PATH,
+                             run=args.run)
+    if not checker.compiler:
+        print(f"❌ No C compiler found (tried {', '.join(COMPILERS)})")
+        sys.exit(2)
+
+    issues = checker.check([p for p in manifest.html_files if manifest.exists(p)])
+    for code, severity, page, line, message in issues:
+        icon = "❌" if severity == 'error' else "⚠️"
+        print(f"{icon} {page}:{line}: {message}")
+    s = checker.stats
+    print(f"\n🛠️  {s['blocks']} blocks: {s['compiled']} compiled, {s['cached']} cached, "
+          f"{s['fragments']} fragments need context, {s['skipped']} skipped")
+    if args.run:
+        print(f"▶️  {s['ran']} programs run against their stated output ({s['built']} rebuilt)")
+    sys.exit(1 if any(severity == 'error' for _, severity, *_ in issues) else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -5,25 +5,22 @@ Create skeleton pages for missing files
 
 import os
 from pathlib import Path
+from string import Template
 
-def create_chapter_skeleton(file_path, chapter_num, title):
-    depth = len(Path(file_path).parts) - 1
-    css_path = "../" * depth + "assets/styles.css"
-    js_path = "../" * depth + "assets/app.js"
-    quiz_css_path = "../" * depth + "assets/quiz.css"
-    quiz_js_path = "../" * depth + "assets/quiz.js"
-    favicon_path = "../" * depth + "assets/favicon.svg"
-    
-    content = f'''<!DOCTYPE html>
+from build_widgets import widget_script_tags, widgets_used
+from site_manifest import load_manifest
+
+# Shared page layout: everything but the <article> body. Compiled once;
+# string.Template keeps the C braces in page bodies free of f-string escaping.
+PAGE_LAYOUT = Template('''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta name="description" content="C Programming - {title}">
-    <title>Chapter {chapter_num}: {title} | C Programming: Zero to Hero</title>
-    <link rel="icon" type="image/svg+xml" href="{favicon_path}">
-    <link rel="stylesheet" href="{css_path}">
-    <link rel="stylesheet" href="{quiz_css_path}">
+    <meta name="description" content="$description">
+    <title>$title | C Programming: Zero to Hero</title>
+    <link rel="icon" type="image/svg+xml" href="$favicon_path">
+$stylesheets
 </head>
 <body>
     <div class="app">
@@ -35,14 +32,70 @@ def create_chapter_skeleton(file_path, chapter_num, title):
             <div class="shortcuts-hint">Press / to search, t to toggle nav</div>
         </header>
 
-        <nav class="sidebar" aria-label="Course Navigation">
-            <!-- Sidebar will be populated by sync tool -->
-        </nav>
+        $sidebar
 
         <main class="main">
             <div class="content">
                 <article>
-                    <h1>Chapter {chapter_num}: {title}</h1>
+$article
+                </article>
+
+                <footer class="footer">
+                    <p>&copy; 2025 C Programming: Zero to Hero. Licensed under MIT for code, content under Creative Commons.</p>
+                    <p>Built with ❤️ for engineering students. <a href="https://github.com/anthropics/claude-code">Generated with Claude Code</a></p>
+                </footer>
+            </div>
+        </main>
+    </div>
+
+$scripts
+</body>
+</html>''')
+
+EMPTY_SIDEBAR = '''<nav class="sidebar" aria-label="Course Navigation">
+            <!-- Sidebar will be populated by sync tool -->
+        </nav>'''
+
+
+def asset_prefix(file_path):
+    """Relative path from file_path back to the site root"""
+    return "../" * (len(Path(file_path).parts) - 1)
+
+
+def render_layout(file_path, title, description, article, quiz=False, sidebar=None):
+    """Wrap an <article> body in the shared layout with paths relative to file_path.
+
+    sidebar is the page's rendered sidebar <nav>; by default an empty one
+    is emitted for sync_sidebar.py to fill in. Only the widget bundles for
+    containers found in article are loaded (see build_widgets.py).
+    """
+    prefix = asset_prefix(file_path)
+    stylesheets = [f"{prefix}assets/styles.css"] + ([f"{prefix}assets/quiz.css"] if quiz else [])
+    scripts = [f'    <script src="{prefix}assets/app.js"></script>']
+    scripts.extend(widget_script_tags(prefix, widgets_used(article)))
+    
+    return PAGE_LAYOUT.substitute(
+        description=description,
+        title=title,
+        favicon_path=f"{prefix}assets/favicon.svg",
+        stylesheets='\n'.join(f'    <link rel="stylesheet" href="{href}">' for href in stylesheets),
+        sidebar=sidebar or EMPTY_SIDEBAR,
+        article=article.rstrip('\n'),
+        scripts='\n'.join(scripts),
+    )
+
+
+def page_meta(section_type, title, number=None):
+    """Return (<title> text, meta description, loads quiz assets) for a page type"""
+    if section_type == 'chapter':
+        return f"Chapter {number}: {title}", f"C Programming - {title}", True
+    if section_type == 'practice':
+        return f"{title} Practice", f"C Programming Practice - {title}", False
+    return title, f"C Programming Reference - {title}", False
+
+
+def create_chapter_skeleton(file_path, chapter_num, title, sidebar=None):
+    article = f'''                    <h1>Chapter {chapter_num}: {title}</h1>
                     
                     <section id="introduction">
                         <h2>Introduction</h2>
@@ -83,57 +136,12 @@ int main() {{
                             <p>Details about common errors will be added here.</p>
                         </div>
                     </section>
-                </article>
-
-                <footer class="footer">
-                    <p>&copy; 2025 C Programming: Zero to Hero. Licensed under MIT for code, content under Creative Commons.</p>
-                    <p>Built with ❤️ for engineering students. <a href="https://github.com/anthropics/claude-code">Generated with Claude Code</a></p>
-                </footer>
-            </div>
-        </main>
-    </div>
-
-    <script src="{js_path}"></script>
-    <script src="{quiz_js_path}" defer></script>
-</body>
-</html>'''
-    
-    return content
-
-def create_practice_skeleton(file_path, title):
-    depth = len(Path(file_path).parts) - 1
-    css_path = "../" * depth + "assets/styles.css"
-    js_path = "../" * depth + "assets/app.js"
-    favicon_path = "../" * depth + "assets/favicon.svg"
-    
-    content = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta name="description" content="C Programming Practice - {title}">
-    <title>{title} Practice | C Programming: Zero to Hero</title>
-    <link rel="icon" type="image/svg+xml" href="{favicon_path}">
-    <link rel="stylesheet" href="{css_path}">
-</head>
-<body>
-    <div class="app">
-        <header class="header">
-            <div class="logo">C Programming: Zero to Hero</div>
-            <div class="search-container">
-                <input type="search" class="search-input" placeholder="Search topics..." aria-label="Search">
-            </div>
-            <div class="shortcuts-hint">Press / to search, t to toggle nav</div>
-        </header>
-
-        <nav class="sidebar" aria-label="Course Navigation">
-            <!-- Sidebar will be populated by sync tool -->
-        </nav>
+'''
+    page_title, description, quiz = page_meta('chapter', title, chapter_num)
+    return render_layout(file_path, page_title, description, article, quiz=quiz, sidebar=sidebar)
 
-        <main class="main">
-            <div class="content">
-                <article>
-                    <h1>{title} Practice</h1>
+def create_practice_skeleton(file_path, title, sidebar=None):
+    article = f'''                    <h1>{title} Practice</h1>
                     
                     <section id="easy-problems">
                         <h2>Easy Level Problems</h2>
@@ -155,56 +163,12 @@ def create_practice_skeleton(file_path, title):
                         <h2>Solutions</h2>
                         <p>Solutions will be added soon...</p>
                     </section>
-                </article>
-
-                <footer class="footer">
-                    <p>&copy; 2025 C Programming: Zero to Hero. Licensed under MIT for code, content under Creative Commons.</p>
-                    <p>Built with ❤️ for engineering students. <a href="https://github.com/anthropics/claude-code">Generated with Claude Code</a></p>
-                </footer>
-            </div>
-        </main>
-    </div>
-
-    <script src="{js_path}"></script>
-</body>
-</html>'''
-    
-    return content
+'''
+    page_title, description, quiz = page_meta('practice', title)
+    return render_layout(file_path, page_title, description, article, quiz=quiz, sidebar=sidebar)
 
-def create_reference_skeleton(file_path, title):
-    depth = len(Path(file_path).parts) - 1
-    css_path = "../" * depth + "assets/styles.css"
-    js_path = "../" * depth + "assets/app.js"
-    favicon_path = "../" * depth + "assets/favicon.svg"
-    
-    content = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta name="description" content="C Programming Reference - {title}">
-    <title>{title} | C Programming: Zero to Hero</title>
-    <link rel="icon" type="image/svg+xml" href="{favicon_path}">
-    <link rel="stylesheet" href="{css_path}">
-</head>
-<body>
-    <div class="app">
-        <header class="header">
-            <div class="logo">C Programming: Zero to Hero</div>
-            <div class="search-container">
-                <input type="search" class="search-input" placeholder="Search topics..." aria-label="Search">
-            </div>
-            <div class="shortcuts-hint">Press / to search, t to toggle nav</div>
-        </header>
-
-        <nav class="sidebar" aria-label="Course Navigation">
-            <!-- Sidebar will be populated by sync tool -->
-        </nav>
-
-        <main class="main">
-            <div class="content">
-                <article>
-                    <h1>{title}</h1>
+def create_reference_skeleton(file_path, title, sidebar=None):
+    article = f'''                    <h1>{title}</h1>
                     
                     <section id="overview">
                         <h2>Overview</h2>
@@ -215,69 +179,31 @@ def create_reference_skeleton(file_path, title):
                         <h2>Details</h2>
                         <p>Detailed content coming soon...</p>
                     </section>
-                </article>
-
-                <footer class="footer">
-                    <p>&copy; 2025 C Programming: Zero to Hero. Licensed under MIT for code, content under Creative Commons.</p>
-                    <p>Built with ❤️ for engineering students. <a href="https://github.com/anthropics/claude-code">Generated with Claude Code</a></p>
-                </footer>
-            </div>
-        </main>
-    </div>
-
-    <script src="{js_path}"></script>
-</body>
-</html>'''
-    
-    return content
+'''
+    page_title, description, quiz = page_meta('reference', title)
+    return render_layout(file_path, page_title, description, article, quiz=quiz, sidebar=sidebar)
 
 def main():
     root = Path('.')
+    manifest = load_manifest(root)
     
-    # Chapter skeletons
-    chapters = [
-        (5, "Arrays & Strings"),
-        (6, "Functions"),
-        (7, "Pointers"),
-        (8, "Structures"),
-        (9, "File I/O"),
-        (10, "Algorithms")
-    ]
-    
-    for num, title in chapters:
-        file_path = f"chapters/{num:02d}-{title.lower().replace(' ', '-').replace('&', '').replace('/', '')}.html"
-        full_path = root / file_path
-        if not full_path.exists():
-            content = create_chapter_skeleton(file_path, num, title)
-            with open(full_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            print(f"Created {file_path}")
-    
-    # Practice skeletons
-    practice_pages = [
-        "Arrays",
-        "Functions", 
-        "Pointers",
-        "Structures",
-        "Files"
-    ]
-    
-    for title in practice_pages:
-        file_path = f"practice/{title.lower()}.html"
-        full_path = root / file_path
-        if not full_path.exists():
-            content = create_practice_skeleton(file_path, title)
-            with open(full_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            print(f"Created {file_path}")
+    # Any page declared in site.json that doesn't exist yet gets a skeleton
+    templates = {
+        'chapter': lambda page: create_chapter_skeleton(page['path'], page['number'], page['title']),
+        'practice': lambda page: create_practice_skeleton(page['path'], page['title']),
+        'reference': lambda page: create_reference_skeleton(page['path'], page['title']),
+    }
     
-    # Reference skeleton
-    ref_file = root / "reference/tools-resources.html"
-    if not ref_file.exists():
-        content = create_reference_skeleton("reference/tools-resources.html", "Tools & Resources")
-        with open(ref_file, 'w', encoding='utf-8') as f:
-            f.write(content)
-        print("Created reference/tools-resources.html")
+    for section_type, render in templates.items():
+        for page in manifest.declared_pages(section_type):
+            file_path = page['path']
+            full_path = root / file_path
+            if not manifest.exists(file_path):
+                content = render(page)
+                full_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(full_path, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                print(f"Created {file_path}")
     
     print("All skeleton files created!")
 
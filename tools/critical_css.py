@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Critical CSS for C Programming Zero to Hero
+Every page blocks rendering on styles.css (plus quiz.css on chapters). This
+works out which rules the top of each page type actually needs, so
+build_assets.py can inline them into <head> and load the full stylesheets
+without blocking render.
+
+"Above the fold" is everything before <main> (header, sidebar) plus the
+first FOLD_MAIN_TAGS elements inside it, collected with an HTMLParser the
+same way site_audit.py's HTMLValidator walks a page. Usage is merged per
+page type (root, chapter, practice, reference) so pages of a type share one
+critical stylesheet. A rule is critical when one of its selectors only
+needs tags, classes and ids that were seen; pseudo-classes and attribute
+selectors are ignored, which errs towards including a rule.
+"""
+
+import argparse
+import posixpath
+import re
+from html.parser import HTMLParser
+from pathlib import Path
+
+from site_manifest import load_manifest
+
+# Start tags inside <main> treated as above the fold
+FOLD_MAIN_TAGS = 40
+
+# At-rules whose nested rules are filtered like top-level ones
+NESTED_AT_RULES = {'@media', '@supports', '@layer', '@container'}
+# At-rules always kept / never kept in critical CSS
+CRITICAL_AT_RULES = {'@charset', '@font-face', '@import'}
+NON_CRITICAL_MEDIA = {'print'}
+
+STYLESHEET_LINK_RE = re.compile(r'^([ \t]*)<link rel="stylesheet" href="([^"]+)">[ \t]*\n', re.MULTILINE)
+IGNORED_SELECTOR_PARTS_RE = re.compile(r'::?[\w-]+(\((?:[^()]|\([^()]*\))*\))?|\[[^\]]*\]')
+COMPOUND_SPLIT_RE = re.compile(r'\s*[>+~]\s*|\s+')
+COMPOUND_RE = re.compile(r'^(\*|[a-zA-Z][\w-]*)?((?:[.#]-?[_a-zA-Z][\w-]*)*)$')
+CLASS_RE = re.compile(r'\.(-?[_a-zA-Z][\w-]*)')
+COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+
+
+class FoldUsage:
+    """Tags, classes and ids used above the fold"""
+
+    def __init__(self):
+        self.tags = {'html', 'body'}
+        self.classes = set()
+        self.ids = set()
+
+    def update(self, other):
+        self.tags |= other.tags
+        self.classes |= other.classes
+        self.ids |= other.ids
+
+
+class FoldParser(HTMLParser):
+    """Collect FoldUsage for one page, stopping once the fold is passed"""
+
+    def __init__(self):
+        super().__init__()
+        self.usage = FoldUsage()
+        self.in_main = False
+        self.main_tags = 0
+
+    @property
+    def done(self):
+        return self.main_tags >= FOLD_MAIN_TAGS
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        if self.in_main:
+            self.main_tags += 1
+        elif tag == 'main':
+            self.in_main = True
+        self.usage.tags.add(tag)
+        for name, value in attrs:
+            if name == 'class' and value:
+                self.usage.classes.update(value.split())
+            elif name == 'id' and value:
+                self.usage.ids.add(value)
+
+
+def used_above_fold(html):
+    parser = FoldParser()
+    parser.feed(html)
+    parser.close()
+    return parser.usage
+
+
+def _scan_to(css, i, stops):
+    """Index of the first character in stops at or after i, skipping strings and comments"""
+    n = len(css)
+    while i < n and css[i] not in stops:
+        if css.startswith('/*', i):
+            end = css.find('*/', i + 2)
+            i = n if end < 0 else end + 2
+            continue
+        if css[i] in '"\'':
+            quote = css[i]
+            i += 1
+            while i < n and css[i] != quote:
+                i += 2 if css[i] == '\\' else 1
+        i += 1
+    return i
+
+
+def _parse_blocks(css, i):
+    blocks = []
+    n = len(css)
+    while i < n:
+        j = _scan_to(css, i, '{};')
+        if j >= n:
+            break
+        prelude = ' '.join(COMMENT_RE.sub(' ', css[i:j]).split())
+        if css[j] == '}':
+            return blocks, j + 1
+        if css[j] == ';':
+            if prelude:
+                blocks.append((prelude, None))
+            i = j + 1
+            continue
+        if prelude.startswith('@') and prelude.split(None, 1)[0] in NESTED_AT_RULES:
+            children, i = _parse_blocks(css, j + 1)
+            blocks.append((prelude, children))
+            continue
+        depth = 1
+        k = j + 1
+        while k < n and depth:
+            k = _scan_to(css, k, '{}')
+            if k < n:
+                depth += 1 if css[k] == '{' else -1
+                k += 1
+        blocks.append((prelude, css[j + 1:k - 1].strip()))
+        i = k
+    return blocks, i
+
+
+def parse_stylesheet(css):
+    """Split CSS into [(prelude, body)] blocks.
+
+    body is the declaration text, None for statements like ``@import ...;``
+    and a list of blocks for @media/@supports and friends. Works on raw or
+    minified CSS; serialize() output is only as compact as its input.
+    """
+    return _parse_blocks(css, 0)[0]
+
+
+def serialize(blocks):
+    out = []
+    for prelude, body in blocks:
+        if body is None:
+            out.append(f"{prelude};")
+        elif isinstance(body, list):
+            out.append(f"{prelude}{{{serialize(body)}}}")
+        else:
+            out.append(f"{prelude}{{{body}}}")
+    return ''.join(out)
+
+
+def split_selectors(prelude):
+    """Split a selector list on top-level commas"""
+    selectors = []
+    depth = 0
+    start = 0
+    for i, c in enumerate(prelude):
+        if c in '([':
+            depth += 1
+        elif c in ')]':
+            depth -= 1
+        elif c == ',' and depth == 0:
+            selectors.append(prelude[start:i].strip())
+            start = i + 1
+    selectors.append(prelude[start:].strip())
+    return selectors
+
+
+def selector_used(selector, usage):
+    """Whether every tag/class/id the selector requires is in usage"""
+    stripped = IGNORED_SELECTOR_PARTS_RE.sub('', selector).strip()
+    for compound in COMPOUND_SPLIT_RE.split(stripped):
+        if not compound:
+            continue
+        match = COMPOUND_RE.match(compound)
+        if not match:
+            # Something this matcher doesn't understand: keep the rule
+            continue
+        tag, rest = match.groups()
+        if tag and tag != '*' and tag.lower() not in usage.tags:
+            return False
+        for kind, name in re.findall(r'([.#])(-?[_a-zA-Z][\w-]*)', rest):
+            if name not in (usage.classes if kind == '.' else usage.ids):
+                return False
+    return True
+
+
+def critical_blocks(blocks, usage):
+    """The subset of parsed blocks needed to render what usage describes"""
+    critical = []
+    for prelude, body in blocks:
+        if prelude.startswith('@'):
+            name = prelude.split(None, 1)[0]
+            if name in CRITICAL_AT_RULES:
+                critical.append((prelude, body))
+            elif isinstance(body, list) and prelude.split(None, 1)[-1] not in NON_CRITICAL_MEDIA:
+                children = critical_blocks(body, usage)
+                if children:
+                    critical.append((prelude, children))
+        elif any(selector_used(selector, usage) for selector in split_selectors(prelude)):
+            critical.append((prelude, body))
+    return critical
+
+
+def defined_classes(css):
+    """Every class name that appears in a selector of the stylesheet"""
+    classes = set()
+
+    def collect(blocks):
+        for prelude, body in blocks:
+            if isinstance(body, list):
+                collect(body)
+            elif not prelude.startswith('@'):
+                classes.update(CLASS_RE.findall(prelude))
+
+    collect(parse_stylesheet(css))
+    return classes
+
+
+def defer_stylesheets(html, critical_css):
+    """Inline critical_css before the first stylesheet <link> and make every link non-blocking.
+
+    Links load as ``media="print"`` and switch to ``all`` once loaded, with a
+    <noscript> fallback; pages without stylesheet links are returned as-is.
+    """
+    matches = list(STYLESHEET_LINK_RE.finditer(html))
+    if not matches:
+        return html
+    indent = matches[0].group(1)
+    out = [html[:matches[0].start()], f"{indent}<style>{critical_css}</style>\n"]
+    previous_end = matches[0].start()
+    for match in matches:
+        out.append(html[previous_end:match.start()])
+        indent, href = match.groups()
+        out.append(f'{indent}<link rel="stylesheet" href="{href}" media="print" onload="this.media=\'all\'">\n'
+                   f'{indent}<noscript><link rel="stylesheet" href="{href}"></noscript>\n')
+        previous_end = match.end()
+    out.append(html[previous_end:])
+    return ''.join(out)
+
+
+def stylesheet_paths(html, page_path):
+    """Root-relative paths of the stylesheets a page links, in order"""
+    page_dir = posixpath.dirname(page_path)
+    return [posixpath.normpath(posixpath.join(page_dir, m.group(2))) for m in STYLESHEET_LINK_RE.finditer(html)
+            if '://' not in m.group(2)]
+
+
+def inline_critical_css(pages, page_types, read_css):
+    """Return {path: html} with critical CSS inlined into every page.
+
+    pages maps root-relative paths to HTML, page_types maps them to their
+    manifest type and read_css(path) returns a stylesheet's text (or None).
+    Critical CSS is computed once per page type and set of stylesheets.
+    """
+    usage_by_type = {}
+    for path, html in pages.items():
+        usage_by_type.setdefault(page_types.get(path), FoldUsage()).update(used_above_fold(html))
+
+    parsed = {}
+    critical = {}
+    result = {}
+    for path, html in pages.items():
+        sheets = tuple(stylesheet_paths(html, path))
+        key = (page_types.get(path), sheets)
+        if key not in critical:
+            blocks = []
+            for sheet in sheets:
+                if sheet not in parsed:
+                    css = read_css(sheet)
+                    parsed[sheet] = parse_stylesheet(css) if css is not None else []
+                blocks.extend(parsed[sheet])
+            critical[key] = serialize(critical_blocks(blocks, usage_by_type[key[0]]))
+        result[path] = defer_stylesheets(html, critical[key]) if critical[key] else html
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report the critical CSS of each page type")
+    parser.add_argument('root', nargs='?', default='.', help="Site root directory (default: current directory)")
+    args = parser.parse_args()
+
+    root = Path(args.root)
+    manifest = load_manifest(root)
+    pages = {}
+    for path in manifest.html_files:
+        if manifest.exists(path):
+            pages[path] = (root / path).read_text(encoding='utf-8')
+
+    def read_css(path):
+        try:
+            return (root / path).read_text(encoding='utf-8')
+        except OSError:
+            return None
+
+    inlined = inline_critical_css(pages, manifest.required_files, read_css)
+    reported = set()
+    for path, html in inlined.items():
+        page_type = manifest.required_files.get(path)
+        sheets = tuple(stylesheet_paths(pages[path], path))
+        if (page_type, sheets) in reported:
+            continue
+        reported.add((page_type, sheets))
+        full = sum(len(read_css(sheet) or '') for sheet in sheets)
+        match = re.search(r'<style>(.*?)</style>', html, re.DOTALL)
+        inline = len(match.group(1)) if match else 0
+        print(f"🎨 {page_type:<10} {', '.join(sheets)}: {inline / 1024:.1f} KB critical of {full / 1024:.1f} KB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate detection for C Programming Zero to Hero
+MinHash signatures of text and an LSH index over them, used by
+site_audit.py to find pages and sections that are copies of each other
+(placeholder skeletons, copy-pasted content).
+
+- Text is lower-cased, split into words and turned into overlapping
+  SHINGLE_WORDS-word shingles.
+- The signature is a one-permutation MinHash: every shingle is hashed once
+  into one of SIGNATURE_SIZE bins, keeping the smallest hash per bin, and
+  empty bins borrow from the next filled one. The fraction of bins two
+  signatures agree on estimates the Jaccard similarity of their shingle
+  sets, at one hash per shingle instead of one per shingle and bin.
+- Signatures are split into LSH_BANDS bands; items sharing any band are
+  candidates, and only candidates are compared. Each is compared with the
+  first item of its bucket rather than with every other item, so the work
+  stays linear in the number of items even when thousands are identical.
+"""
+
+import hashlib
+import re
+
+SHINGLE_WORDS = 3
+SIGNATURE_SIZE = 64
+# Of SIGNATURE_SIZE // LSH_BANDS rows each: 32 bands of 2 make pairs at the
+# threshold candidates with probability 1 - (1 - 0.5 ** 2) ** 32 > 0.9999
+LSH_BANDS = 32
+# Estimated Jaccard similarity reported as a duplicate; pages filled in from
+# one template with only the topic changed score 0.6-0.7
+DUPLICATE_THRESHOLD = 0.5
+# Texts with fewer shingles are too short to call duplicates
+MIN_SHINGLES = 12
+
+WORD_RE = re.compile(r'\w+')
+_BIN_BITS = SIGNATURE_SIZE.bit_length() - 1
+_VALUE_BITS = 64 - _BIN_BITS
+
+
+def shingles(text):
+    words = WORD_RE.findall(text.lower())
+    return {' '.join(words[i:i + SHINGLE_WORDS]) for i in range(len(words) - SHINGLE_WORDS + 1)}
+
+
+def signature(text):
+    """The MinHash signature of text as a list of ints, or None if it is too short to compare"""
+    found = shingles(text)
+    if len(found) < MIN_SHINGLES:
+        return None
+    bins = [None] * SIGNATURE_SIZE
+    for shingle in found:
+        h = int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'little')
+        index, value = h & (SIGNATURE_SIZE - 1), h >> _BIN_BITS
+        if bins[index] is None or value < bins[index]:
+            bins[index] = value
+    # Densify: an empty bin takes the next filled bin's value, offset by the
+    # distance so it can only match a bin filled the same way
+    for i in range(SIGNATURE_SIZE):
+        if bins[i] is None:
+            for distance in range(1, SIGNATURE_SIZE):
+                value = bins[(i + distance) % SIGNATURE_SIZE]
+                if value is not None and value < 1 << _VALUE_BITS:
+                    bins[i] = value + (distance << _VALUE_BITS)
+                    break
+    return bins
+
+
+def similarity(a, b):
+    """Estimated Jaccard similarity of the texts behind two signatures"""
+    return sum(x == y for x, y in zip(a, b)) / SIGNATURE_SIZE
+
+
+def near_duplicate_groups(signatures, threshold=DUPLICATE_THRESHOLD):
+    """Group near-duplicate items.
+
+    signatures maps item keys (in a stable order) to signatures. Returns a
+    list of groups, each a list of (key, similarity to the group's first
+    key) pairs in input order, first key first with similarity 1.0.
+    """
+    keys = [key for key, sig in signatures.items() if sig is not None]
+    order = {key: i for i, key in enumerate(keys)}
+    parent = {key: key for key in keys}
+
+    def find(key):
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    def union(a, b):
+        a, b = find(a), find(b)
+        if a != b:
+            # The earlier item stays the root, so groups are led by their first page
+            if order[b] < order[a]:
+                a, b = b, a
+            parent[b] = a
+
+    rows = SIGNATURE_SIZE // LSH_BANDS
+    buckets = {}
+    for key in keys:
+        sig = signatures[key]
+        for band in range(LSH_BANDS):
+            bucket = buckets.setdefault((band, tuple(sig[band * rows:(band + 1) * rows])), [])
+            if bucket and find(bucket[0]) != find(key) and similarity(signatures[bucket[0]], sig) >= threshold:
+                union(bucket[0], key)
+            bucket.append(key)
+
+    groups = {}
+    for key in keys:
+        groups.setdefault(find(key), []).append(key)
+    return [[(key, 1.0 if key == root else similarity(signatures[root], signatures[key])) for key in members]
+            for root, members in groups.items() if len(members) > 1]
+
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+SVG optimizer for C Programming Zero to Hero
+Shrinks the hand-written SVGs (images/diagrams/*.svg, assets/favicon.svg)
+for the deployable copy written by build_assets.py:
+
+- comments, <metadata> and editor-specific (Inkscape, Sodipodi, ...)
+  elements and attributes are dropped, and whitespace between elements and
+  inside <style> is collapsed
+- numbers in path data, points, transforms and coordinates are rounded to
+  DEFAULT_PRECISION decimals and path data is written compactly
+- all <defs> are merged into one and identical definitions are kept once,
+  with references to the dropped copies pointed at the kept one
+
+Text content is left exactly as written, and an optimized file is only used
+when it is actually smaller. inline_svgs() can also replace
+``<img src="...svg">`` with the SVG markup itself for small images without a
+<style> element (whose rules would leak into the page), saving a request.
+
+Run directly, this reports what the optimizer would save per file.
+"""
+
+import argparse
+import copy
+import hashlib
+import html
+import posixpath
+import re
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+# Bump when the optimizer's output changes, so build state is invalidated
+OPTIMIZER_VERSION = 1
+# Written by build_assets.py next to its output: path -> source hash and sizes
+SVG_STATE_NAME = '.svg-state.json'
+DEFAULT_PRECISION = 2
+INLINE_SVG_MAX_BYTES = 2048
+SVG_DIRS = ['assets', 'images']
+
+SVG_NS = 'http://www.w3.org/2000/svg'
+XLINK_NS = 'http://www.w3.org/1999/xlink'
+EDITOR_NAMESPACES = {
+    'http://www.inkscape.org/namespaces/inkscape',
+    'http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd',
+    'http://www.bohemiancoding.com/sketch/ns',
+    'http://ns.adobe.com/AdobeIllustrator/10.0/',
+    'http://www.w3.org/1999/02/22-rdf-syntax-ns#',
+    'http://purl.org/dc/elements/1.1/',
+    'http://creativecommons.org/ns#',
+}
+REMOVED_TAGS = {f'{{{SVG_NS}}}metadata'}
+# Elements whose text (and their children's tails) is content, not formatting
+TEXT_TAGS = {f'{{{SVG_NS}}}{name}' for name in ('text', 'tspan', 'textPath', 'title', 'desc')}
+STYLE_TAG = f'{{{SVG_NS}}}style'
+DEFS_TAG = f'{{{SVG_NS}}}defs'
+# Attributes holding lists of numbers that are safe to round
+NUMERIC_ATTRS = {'points', 'transform', 'x', 'y', 'x1', 'y1', 'x2', 'y2', 'cx', 'cy', 'r', 'rx', 'ry',
+                 'width', 'height', 'dx', 'dy', 'refX', 'refY', 'stroke-width', 'opacity',
+                 'fill-opacity', 'stroke-opacity'}
+
+NUMBER_RE = re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+PATH_TOKEN_RE = re.compile(r'[MmZzLlHhVvCcSsQqTtAa]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+STYLE_SPACE_RE = re.compile(r'\s*([{};,>])\s*')
+URL_REF_RE = re.compile(r'url\(#([^)]+)\)')
+IMG_RE = re.compile(r'<img\b[^>]*>', re.IGNORECASE)
+ATTR_RE = re.compile(r'([\w:-]+)\s*=\s*"([^"]*)"')
+ID_ATTR_RE = re.compile(r'\bid="([^"]+)"')
+
+ET.register_namespace('', SVG_NS)
+ET.register_namespace('xlink', XLINK_NS)
+
+
+def format_number(text, precision=DEFAULT_PRECISION):
+    """Round a number literal: '3.14159' -> '3.14', '0.50' -> '.5', '-0.001' -> '0'"""
+    value = round(float(text), precision)
+    out = f"{value:.{precision}f}".rstrip('0').rstrip('.') if precision else str(int(value))
+    if out in ('-0', ''):
+        out = '0'
+    if out.startswith('0.'):
+        out = out[1:]
+    elif out.startswith('-0.'):
+        out = '-' + out[2:]
+    return out
+
+
+def round_numbers(value, precision=DEFAULT_PRECISION):
+    return NUMBER_RE.sub(lambda m: format_number(m.group(0), precision), value)
+
+
+def compact_path(d, precision=DEFAULT_PRECISION):
+    """Rewrite path data with rounded numbers and only the separators it needs"""
+    out = []
+    previous = None
+    for token in PATH_TOKEN_RE.findall(d):
+        if token.isalpha():
+            out.append(token)
+            previous = None
+            continue
+        number = format_number(token, precision)
+        # A separator is only needed where the numbers would otherwise merge
+        if previous is not None and not number.startswith('-') and not (
+                number.startswith('.') and '.' in previous):
+            out.append(' ')
+        out.append(number)
+        previous = number
+    return ''.join(out)
+
+
+def minify_style(css):
+    css = STYLE_SPACE_RE.sub(r'\1', ' '.join(css.split()))
+    return re.sub(r':\s+', ':', css).replace(';}', '}')
+
+
+def _namespace(name):
+    return name[1:].split('}', 1)[0] if name.startswith('{') else None
+
+
+def _strip(element, precision, in_text=False):
+    """Remove editor cruft and formatting whitespace below element, rounding numbers"""
+    for child in list(element):
+        if not isinstance(child.tag, str) or child.tag in REMOVED_TAGS or _namespace(child.tag) in EDITOR_NAMESPACES:
+            # Keep the tail text of a removed element inside text content
+            if in_text and child.tail:
+                element.text = (element.text or '') + child.tail
+            element.remove(child)
+            continue
+        _strip(child, precision, in_text or child.tag in TEXT_TAGS)
+        if not in_text and child.tail is not None and not child.tail.strip():
+            child.tail = None
+
+    for name in list(element.attrib):
+        if _namespace(name) in EDITOR_NAMESPACES:
+            del element.attrib[name]
+        elif name == 'd':
+            element.set(name, compact_path(element.get(name), precision))
+        elif name in NUMERIC_ATTRS:
+            element.set(name, round_numbers(element.get(name), precision))
+
+    if element.tag == STYLE_TAG and element.text:
+        element.text = minify_style(element.text)
+    elif element.tag not in TEXT_TAGS and not in_text and element.text is not None and not element.text.strip():
+        element.text = None
+
+
+def _dedupe_defs(root):
+    """Merge every <defs> into the first and drop duplicate definitions; return {dropped id: kept id}"""
+    all_defs = list(root.iter(DEFS_TAG))
+    if not all_defs:
+        return {}
+    parents = {child: parent for parent in root.iter() for child in parent}
+    first = all_defs[0]
+    for defs in all_defs[1:]:
+        first.extend(list(defs))
+        parents[defs].remove(defs)
+
+    seen = {}
+    renamed = {}
+    for child in list(first):
+        ident = child.get('id')
+        probe = copy.deepcopy(child)
+        probe.attrib.pop('id', None)
+        key = ET.tostring(probe, encoding='unicode')
+        if key in seen and ident:
+            renamed[ident] = seen[key]
+            first.remove(child)
+        elif ident:
+            seen.setdefault(key, ident)
+    if not len(first):
+        parents[first].remove(first)
+    return renamed
+
+
+def _rename_refs(root, renamed):
+    for element in root.iter():
+        for name, value in list(element.attrib.items()):
+            if name in ('href', f'{{{XLINK_NS}}}href') and value.startswith('#') and value[1:] in renamed:
+                element.set(name, '#' + renamed[value[1:]])
+            elif 'url(#' in value:
+                element.set(name, URL_REF_RE.sub(lambda m: f"url(#{renamed.get(m.group(1), m.group(1))})", value))
+
+
+def optimize_svg(text, precision=DEFAULT_PRECISION):
+    """Return an optimized copy of an SVG document (or text itself if that isn't smaller)"""
+    try:
+        root = ET.fromstring(text)
+    except ET.ParseError:
+        return text
+    _strip(root, precision, root.tag in TEXT_TAGS)
+    renamed = _dedupe_defs(root)
+    if renamed:
+        _rename_refs(root, renamed)
+    optimized = ET.tostring(root, encoding='unicode').replace(' />', '/>')
+    if text.endswith('\n'):
+        optimized += '\n'
+    return optimized if len(optimized.encode('utf-8')) < len(text.encode('utf-8')) else text
+
+
+def inlinable(svg):
+    """Whether an (optimized) SVG is small and self-contained enough to inline into pages"""
+    return len(svg.encode('utf-8')) <= INLINE_SVG_MAX_BYTES and '<style' not in svg
+
+
+def inline_svgs(page_html, page_path, read_svg):
+    """Replace <img> tags pointing at small SVGs with the SVG markup.
+
+    read_svg(path) returns the optimized SVG for a root-relative path, or
+    None. The <img>'s alt becomes the SVG's accessible name, and its class,
+    width and height carry over; ids inside the SVG get a per-image prefix
+    so two inlined images can't clash. Returns (html, [inlined paths]).
+    """
+    page_dir = posixpath.dirname(page_path)
+    inlined = []
+
+    def replace(match):
+        attrs = {name.lower(): value for name, value in ATTR_RE.findall(match.group(0))}
+        src = attrs.get('src', '')
+        if '://' in src or not src.lower().endswith('.svg'):
+            return match.group(0)
+        path = posixpath.normpath(posixpath.join(page_dir, html.unescape(src)))
+        svg = read_svg(path)
+        if svg is None or not inlinable(svg):
+            return match.group(0)
+        inlined.append(path)
+
+        svg = svg.strip().replace(f' xmlns="{SVG_NS}"', '', 1)
+        prefix = posixpath.splitext(posixpath.basename(path))[0] + '-'
+        ids = set(ID_ATTR_RE.findall(svg))
+        for ident in ids:
+            svg = svg.replace(f'id="{ident}"', f'id="{prefix}{ident}"')
+            svg = svg.replace(f'url(#{ident})', f'url(#{prefix}{ident})').replace(f'href="#{ident}"', f'href="#{prefix}{ident}"')
+
+        start = svg.index('>') if svg.startswith('<svg') else -1
+        if start < 0:
+            return match.group(0)
+        open_tag = svg[:start]
+        for name in ('width', 'height'):
+            if name in attrs:
+                open_tag = re.sub(rf'\s{name}="[^"]*"', '', open_tag)
+        extra = [f'{name}="{attrs[name]}"' for name in ('class', 'width', 'height') if name in attrs]
+        alt = attrs.get('alt', '')
+        extra += ['role="img"', f'aria-label="{alt}"'] if alt else ['aria-hidden="true"']
+        return f"{open_tag} {' '.join(extra)}{svg[start:]}"
+
+    return IMG_RE.sub(replace, page_html), inlined
+
+
+def find_svgs(root):
+    """Root-relative paths of every SVG under SVG_DIRS"""
+    root = Path(root)
+    return sorted(path.relative_to(root).as_posix() for directory in SVG_DIRS
+                  for path in (root / directory).rglob('*.svg') if not path.name.startswith('.'))
+
+
+def source_digest(data):
+    return hashlib.sha256(f"{OPTIMIZER_VERSION}\0".encode('utf-8') + data).hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report what optimizing the site's SVGs would save")
+    parser.add_argument('root', nargs='?', default='.', help="Site root directory (default: current directory)")
+    parser.add_argument('--precision', type=int, default=DEFAULT_PRECISION,
+                        help=f"Decimals kept in numbers (default: {DEFAULT_PRECISION})")
+    args = parser.parse_args()
+
+    total_before = total_after = 0
+    for path in find_svgs(args.root):
+        text = (Path(args.root) / path).read_text(encoding='utf-8')
+        optimized = optimize_svg(text, args.precision)
+        before, after = len(text.encode('utf-8')), len(optimized.encode('utf-8'))
+        total_before += before
+        total_after += after
+        note = ", inlinable" if inlinable(optimized) else ""
+        print(f"🖼️  {path}: {before} -> {after} bytes (-{before - after}){note}")
+    print(f"\n{total_before / 1024:.1f} KB -> {total_after / 1024:.1f} KB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Precompression for C Programming Zero to Hero
+Writes ``.gz`` (and, when the ``brotli`` module is installed, ``.br``)
+siblings for every HTML/CSS/JS/SVG/JSON file under a site root, so static
+hosts that serve precompressed variants never send the pages uncompressed.
+
+Meant for the deployable copy written by build_assets.py (``dist/`` by
+default). A state file in the root records each file's content hash, so
+unchanged files are skipped; files are compressed in parallel, and a
+variant is only kept when it is actually smaller than the original.
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DEFAULT_ROOT = 'dist'
+STATE_NAME = '.precompress-state.json'
+COMPRESSIBLE_SUFFIXES = {'.html', '.css', '.js', '.svg', '.json'}
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+# Output suffix -> compressor; brotli is optional
+COMPRESSORS = {'.gz': lambda data: gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)}
+if brotli is not None:
+    COMPRESSORS['.br'] = lambda data: brotli.compress(data, quality=BROTLI_QUALITY)
+COMPRESSED_SUFFIXES = ('.gz', '.br')
+
+
+def compress_file(root, path):
+    """Write the compressed variants of one root-relative file.
+
+    Module-level so it can run in a worker process. Returns
+    ``{suffix: bytes written}``; variants that wouldn't be smaller than the
+    original are removed instead of written.
+    """
+    full_path = Path(root) / path
+    data = full_path.read_bytes()
+    sizes = {}
+    for suffix, compress in COMPRESSORS.items():
+        variant = full_path.with_name(full_path.name + suffix)
+        compressed = compress(data)
+        if len(compressed) >= len(data):
+            variant.unlink(missing_ok=True)
+            continue
+        tmp_path = variant.with_name(variant.name + '.tmp')
+        tmp_path.write_bytes(compressed)
+        os.replace(tmp_path, variant)
+        sizes[suffix] = len(compressed)
+    return sizes
+
+
+def find_compressible(root):
+    """Root-relative paths of every compressible file, skipping hidden entries"""
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith('.'))
+        rel_dir = Path(dirpath).relative_to(root).as_posix()
+        for filename in sorted(filenames):
+            if not filename.startswith('.') and os.path.splitext(filename)[1] in COMPRESSIBLE_SUFFIXES:
+                paths.append(filename if rel_dir == '.' else f"{rel_dir}/{filename}")
+    return paths
+
+
+def precompress(root=DEFAULT_ROOT, jobs=1, force=False):
+    """Compress every changed file under root and drop orphaned variants.
+
+    Returns a stats dict: files compressed, unchanged and removed, plus
+    total original and compressed (smallest variant) bytes.
+    """
+    root = Path(root)
+    state_path = root / STATE_NAME
+    formats = sorted(COMPRESSORS)
+    state = {}
+    if not force:
+        try:
+            with open(state_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            # A different set of formats means every file needs its new variants
+            if data.get('formats') == formats:
+                state = data.get('files', {})
+        except (OSError, ValueError):
+            pass
+
+    paths = find_compressible(root)
+    digests = {}
+    todo = []
+    for path in paths:
+        digests[path] = hashlib.sha256((root / path).read_bytes()).hexdigest()
+        previous = state.get(path)
+        if (previous and previous['sha256'] == digests[path]
+                and all((root / f"{path}{suffix}").exists() for suffix in previous['variants'])):
+            continue
+        todo.append(path)
+
+    compress = partial(compress_file, root)
+    if jobs > 1 and len(todo) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(compress, todo, chunksize=max(1, len(todo) // (jobs * 4))))
+    else:
+        results = [compress(path) for path in todo]
+    for path, sizes in zip(todo, results):
+        state[path] = {'sha256': digests[path], 'size': (root / path).stat().st_size, 'variants': sizes}
+
+    # Forget files that are gone and remove their variants
+    live = set(paths)
+    removed = 0
+    for path in [p for p in state if p not in live]:
+        del state[path]
+    for dirpath, dirnames, filenames in os.walk(root):
+        for filename in filenames:
+            base, suffix = os.path.splitext(filename)
+            if suffix in COMPRESSED_SUFFIXES and os.path.splitext(base)[1] in COMPRESSIBLE_SUFFIXES:
+                rel_path = (Path(dirpath) / base).relative_to(root).as_posix()
+                if rel_path not in live or suffix not in state[rel_path]['variants']:
+                    os.unlink(Path(dirpath) / filename)
+                    removed += 1
+
+    tmp_path = state_path.with_name(state_path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'formats': formats, 'files': state}, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, state_path)
+
+    original = sum(entry['size'] for entry in state.values())
+    smallest = sum(min([entry['size'], *entry['variants'].values()]) for entry in state.values())
+    return {'compressed': len(todo), 'unchanged': len(paths) - len(todo), 'removed': removed,
+            'bytes': original, 'transfer_bytes': smallest}
+
+
+def print_stats(stats):
+    if brotli is None:
+        print("   (brotli module not installed; writing .gz variants only)")
+    saved = 100 * (1 - stats['transfer_bytes'] / stats['bytes']) if stats['bytes'] else 0
+    print(f"🗜️  Precompressed {stats['compressed']} files ({stats['unchanged']} unchanged, "
+          f"{stats['removed']} stale variants removed): {stats['bytes'] / 1024:.1f} KB -> "
+          f"{stats['transfer_bytes'] / 1024:.1f} KB over the wire (-{saved:.0f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write .gz/.br variants of a built site's text files")
+    parser.add_argument('root', nargs='?', default=DEFAULT_ROOT, help=f"Site root to compress (default: {DEFAULT_ROOT})")
+    parser.add_argument('-j', '--jobs', type=int, default=0,
+                        help="Compress in N worker processes (0 = one per CPU, the default)")
+    parser.add_argument('--force', action='store_true', help="Ignore the state file and recompress everything")
+    args = parser.parse_args()
+
+    if not Path(args.root).is_dir():
+        print(f"❌ No such directory: {args.root}")
+        sys.exit(2)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    print_stats(precompress(args.root, jobs=jobs, force=args.force))
+
+
+if __name__ == '__main__':
+    main()
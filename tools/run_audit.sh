@@ -1,4 +1,4 @@
 #!/usr/bin/env bash
 set -euo pipefail
-python3 tools/site_audit.py
+python3 tools/site_audit.py --cache "$@"
 echo "Audit completed."
\ No newline at end of file
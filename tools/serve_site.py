@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Development server for C Programming Zero to Hero
+A replacement for ``python -m http.server`` while writing pages:
+
+- files are served from an in-memory LRU cache, checked against the file's
+  size and mtime on every request, so edits show up on the next reload
+  without pages being re-read from disk each time
+- responses carry an ETag and ``Cache-Control`` (long-lived for the
+  fingerprinted assets written by build_assets.py, revalidate otherwise), and
+  conditional requests get ``304 Not Modified``
+- ``.br``/``.gz`` siblings written by precompress.py are served to browsers
+  that accept them
+- HTML pages get an overlay listing the audit issues for that page; the
+  audit runs in a worker thread whenever the site changes, reusing
+  SiteAuditor and its cache the same way ``site_audit.py --watch`` does
+
+Built on asyncio streams, so any number of open tabs are served
+concurrently; disk reads and the audit never block the event loop.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import hashlib
+import html
+import io
+import mimetypes
+import os
+import re
+import sys
+import time
+from collections import OrderedDict, namedtuple
+from email.utils import formatdate
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+from build_assets import FINGERPRINT_LENGTH
+from site_audit import DEFAULT_CACHE_PATH, AuditCache, SiteAuditor
+from site_manifest import load_manifest
+from watch_site import POLL_INTERVAL, changed_paths, snapshot
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8000
+DEFAULT_CACHE_MB = 64
+NOT_FOUND_PAGE = '404.html'
+KEEP_ALIVE_TIMEOUT = 15         # seconds an idle connection is kept open
+MAX_HEADER_LINES = 100
+
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+REVALIDATE_CACHE_CONTROL = 'no-cache'
+FINGERPRINTED_RE = re.compile(rf'\.[0-9a-f]{{{FINGERPRINT_LENGTH}}}\.(?:css|js)$')
+# Content-Encoding -> file suffix, in order of preference
+ENCODINGS = [('br', '.br'), ('gzip', '.gz')]
+CONTENT_TYPES = {'.js': 'text/javascript', '.svg': 'image/svg+xml', '.json': 'application/json'}
+REASONS = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed'}
+
+# stamp: (size, mtime_ns) the entry was read at; etag: quoted strong validator
+CachedFile = namedtuple('CachedFile', 'stamp data etag')
+
+
+class FileCache:
+    """LRU cache of file contents, bounded by total bytes and invalidated by size/mtime"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def stamp(path):
+        """(size, mtime_ns) of a regular file, or None if there isn't one"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_size, st.st_mtime_ns) if os.path.isfile(path) else None
+
+    def get(self, path, stamp):
+        """The cached entry for path if it is still current, else None"""
+        entry = self.entries.get(path)
+        if entry is None or entry.stamp != stamp:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(path)
+        self.hits += 1
+        return entry
+
+    def put(self, path, entry):
+        old = self.entries.pop(path, None)
+        if old is not None:
+            self.size -= len(old.data)
+        if len(entry.data) > self.max_bytes:
+            return
+        self.entries[path] = entry
+        self.size += len(entry.data)
+        while self.size > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= len(evicted.data)
+
+
+def read_file(path, stamp):
+    """Read a file into a CachedFile; run in a worker thread"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return CachedFile(stamp, data, f'"{hashlib.sha256(data).hexdigest()[:16]}"')
+
+
+def render_overlay(page, issues):
+    """A self-contained (inline-styled) panel listing a page's audit issues"""
+    items = ''.join(
+        f'<li style="margin:.25rem 0">{"❌" if issue.severity == "error" else "⚠️"} '
+        f'{html.escape(issue.message)}{f" (line {issue.line})" if issue.line else ""}</li>'
+        for issue in issues)
+    return ('<div id="audit-overlay" style="position:fixed;right:1rem;bottom:1rem;z-index:10000;'
+            'max-width:32rem;max-height:40vh;overflow:auto;padding:.75rem 1rem;border-radius:8px;'
+            'background:#1e1e2e;color:#f5f5f5;font:13px/1.4 system-ui,sans-serif;'
+            'box-shadow:0 4px 16px rgba(0,0,0,.4)">'
+            '<button onclick="this.parentNode.remove()" aria-label="Close audit overlay" '
+            'style="float:right;background:none;border:0;color:inherit;font-size:1rem;cursor:pointer">✕</button>'
+            f'<strong>Audit: {html.escape(page)}</strong><ul style="margin:.5rem 0 0;padding-left:1.25rem">'
+            f'{items}</ul></div>\n')
+
+
+def inject_overlay(data, overlay):
+    """Insert overlay right before </body> (or at the end of a page without one)"""
+    end = data.rfind(b'</body>')
+    overlay = overlay.encode('utf-8')
+    return data + overlay if end < 0 else data[:end] + overlay + data[end:]
+
+
+class AuditState:
+    """Latest audit issues per page, refreshed in a worker thread when the site changes"""
+
+    def __init__(self, root, manifest_path=None):
+        self.root = Path(root)
+        self.manifest_path = manifest_path
+        self.cache = AuditCache(self.root / DEFAULT_CACHE_PATH)
+        self.files = {}
+        self.by_page = {}
+        self.version = ''      # digest of the issues, part of every overlaid page's ETag
+
+    def run(self):
+        """Re-run the audit; blocking, so called through asyncio.to_thread"""
+        manifest = load_manifest(self.root, self.manifest_path)
+        auditor = SiteAuditor(self.root, manifest=manifest, cache=self.cache)
+        # The audit reports progress on stdout; the server logs on stderr
+        with contextlib.redirect_stdout(io.StringIO()):
+            auditor.audit()
+        by_page = {}
+        for issue in auditor.errors + auditor.warnings:
+            if issue.file:
+                by_page.setdefault(issue.file, []).append(issue)
+        self.by_page = by_page
+        self.version = hashlib.sha256(repr(sorted(map(tuple, auditor.errors + auditor.warnings),
+                                                  key=repr)).encode('utf-8')).hexdigest()[:8]
+        return len(auditor.errors), len(auditor.warnings)
+
+    async def watch(self):
+        """Audit now, then again after every change to the site's files"""
+        while True:
+            current = await asyncio.to_thread(snapshot, self.root)
+            if changed_paths(self.files, current):
+                self.files = current
+                start = time.perf_counter()
+                try:
+                    errors, warnings = await asyncio.to_thread(self.run)
+                except Exception as e:
+                    # Keep watching: the next change (e.g. fixing a malformed site.json) re-audits
+                    log(f"audit failed: {type(e).__name__}: {e}")
+                else:
+                    log(f"audit: {errors} errors, {warnings} warnings "
+                        f"({(time.perf_counter() - start) * 1000:.0f} ms)")
+            await asyncio.sleep(POLL_INTERVAL)
+
+
+def log(message):
+    print(f"[{time.strftime('%H:%M:%S')}] {message}", file=sys.stderr, flush=True)
+
+
+class DevServer:
+    def __init__(self, root, cache_bytes=DEFAULT_CACHE_MB * 1024 * 1024, overlay=True, manifest_path=None):
+        self.root = Path(root).resolve()
+        self.files = FileCache(cache_bytes)
+        self.audit = AuditState(self.root, manifest_path) if overlay else None
+
+    def resolve(self, target):
+        """Map a request target to a file under root, or None (including for traversal attempts)"""
+        path = unquote(urlsplit(target).path)
+        try:
+            full_path = (self.root / path.lstrip('/')).resolve()
+            if full_path != self.root and self.root not in full_path.parents:
+                return None
+            if full_path.is_dir():
+                full_path = full_path / 'index.html'
+        except (ValueError, OSError):
+            # An embedded null byte or a name the filesystem rejects
+            return None
+        return full_path
+
+    async def load(self, full_path):
+        """The current CachedFile for full_path, or None if it doesn't exist"""
+        stamp = await asyncio.to_thread(self.files.stamp, full_path)
+        if stamp is None:
+            return None
+        entry = self.files.get(full_path, stamp)
+        if entry is None:
+            entry = await asyncio.to_thread(read_file, full_path, stamp)
+            self.files.put(full_path, entry)
+        return entry
+
+    async def respond(self, method, target, headers):
+        """Return (status, headers, body) for one GET/HEAD request"""
+        if method not in ('GET', 'HEAD'):
+            return 405, {'Allow': 'GET, HEAD'}, b''
+        full_path = self.resolve(target)
+        status = 200
+        entry = await self.load(full_path) if full_path else None
+        if entry is None:
+            status = 404
+            full_path = self.root / NOT_FOUND_PAGE
+            entry = await self.load(full_path)
+            if entry is None:
+                return 404, {'Content-Type': 'text/plain; charset=utf-8'}, b'404 Not Found\n'
+
+        suffix = full_path.suffix
+        content_type = CONTENT_TYPES.get(suffix) or mimetypes.guess_type(full_path.name)[0] or 'application/octet-stream'
+        if content_type.startswith('text/') or suffix in ('.svg', '.json'):
+            content_type += '; charset=utf-8'
+        response_headers = {
+            'Content-Type': content_type,
+            'Cache-Control': (IMMUTABLE_CACHE_CONTROL if FINGERPRINTED_RE.search(full_path.name)
+                              else REVALIDATE_CACHE_CONTROL),
+        }
+
+        data, etag = entry.data, entry.etag
+        page = full_path.relative_to(self.root).as_posix()
+        issues = self.audit.by_page.get(page) if self.audit and suffix == '.html' else None
+        if issues:
+            data = inject_overlay(data, render_overlay(page, issues))
+            etag = f'{etag[:-1]}-{self.audit.version}"'
+        else:
+            # Only unmodified files can be swapped for a precompressed variant
+            accepted = {e.split(';')[0].strip() for e in headers.get('accept-encoding', '').split(',')}
+            response_headers['Vary'] = 'Accept-Encoding'
+            for encoding, variant_suffix in ENCODINGS:
+                if encoding not in accepted:
+                    continue
+                variant_path = full_path.with_name(full_path.name + variant_suffix)
+                variant = await self.load(variant_path)
+                # A variant older than its file is stale (precompress.py hasn't re-run)
+                if variant is not None and variant.stamp[1] >= entry.stamp[1]:
+                    data = variant.data
+                    etag = f'{etag[:-1]}-{encoding}"'
+                    response_headers['Content-Encoding'] = encoding
+                    break
+
+        response_headers['ETag'] = etag
+        if status == 200 and etag in (t.strip() for t in headers.get('if-none-match', '').split(',')):
+            return 304, response_headers, b''
+        response_headers['Content-Length'] = str(len(data))
+        return status, response_headers, b'' if method == 'HEAD' else data
+
+    async def handle(self, reader, writer):
+        """Serve requests on one connection until it closes or goes idle"""
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), KEEP_ALIVE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    break
+                if not request_line:
+                    break
+                parts = request_line.decode('latin-1').split()
+                headers = {}
+                for _ in range(MAX_HEADER_LINES):
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                if len(parts) != 3 or not parts[2].startswith('HTTP/'):
+                    status, response_headers, body = 400, {}, b''
+                    keep_alive = False
+                else:
+                    method, target, version = parts
+                    status, response_headers, body = await self.respond(method, target, headers)
+                    connection = headers.get('connection', '').lower()
+                    keep_alive = connection == 'keep-alive' if version == 'HTTP/1.0' else connection != 'close'
+                    log(f"{method} {target} {status}")
+                response_headers.setdefault('Content-Length', str(len(body)))
+                response_headers['Date'] = formatdate(usegmt=True)
+                response_headers['Connection'] = 'keep-alive' if keep_alive else 'close'
+                head = f"HTTP/1.1 {status} {REASONS[status]}\r\n" + ''.join(
+                    f"{name}: {value}\r\n" for name, value in response_headers.items()) + "\r\n"
+                writer.write(head.encode('latin-1') + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def serve(self, host, port):
+        server = await asyncio.start_server(self.handle, host, port)
+        log(f"Serving {self.root} at http://{host}:{port}/ (Ctrl+C to stop)")
+        async with server:
+            if self.audit:
+                # Keep a reference so the task isn't garbage-collected
+                self._audit_task = asyncio.create_task(self.audit.watch())
+            await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the site locally with caching and an audit overlay")
+    parser.add_argument('root', nargs='?', default='.', help="Site root directory (default: current directory)")
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f"Address to listen on (default: {DEFAULT_HOST})")
+    parser.add_argument('-p', '--port', type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    parser.add_argument('--cache-mb', type=int, default=DEFAULT_CACHE_MB,
+                        help=f"Most MB of file contents kept in memory (default: {DEFAULT_CACHE_MB})")
+    parser.add_argument('--no-overlay', action='store_true', help="Don't audit the site or show issues on pages")
+    parser.add_argument('--manifest', metavar='PATH', help="Site manifest to audit against (default: <root>/site.json)")
+    args = parser.parse_args()
+
+    if not Path(args.root).is_dir():
+        print(f"❌ No such directory: {args.root}")
+        sys.exit(2)
+    server = DevServer(args.root, cache_bytes=args.cache_mb * 1024 * 1024, overlay=not args.no_overlay,
+                       manifest_path=args.manifest)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        log("Stopped")
+    except OSError as e:
+        print(f"❌ Cannot listen on {args.host}:{args.port}: {e}")
+        sys.exit(2)
+
+
+if __name__ == '__main__':
+    main()
@@ -4,126 +4,387 @@ Site Readiness Audit for C Programming Zero to Hero
 Validates completeness, structure, and quality of static site
 """
 
+import argparse
+import hashlib
+import json
 import os
+import posixpath
 import re
 import sys
+import time
+import xml.etree.ElementTree as ET
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from functools import partial
 from pathlib import Path
 from html.parser import HTMLParser
 from urllib.parse import urljoin, urlparse
 
+from audit_rules import DEFAULT_RULES, STRUCTURE_RULES, Rule, RuleContext
+from build_precache import PRECACHE_MANIFEST_NAME, build_precache
+from build_quizzes import QUIZ_SOURCE_DIR, build_quizzes, validate_quiz
+from check_links import LinkChecker, is_external
+from check_snippets import SnippetChecker
+from critical_css import defined_classes
+from near_duplicates import near_duplicate_groups
+from optimize_svg import SVG_STATE_NAME, optimize_svg
+from site_manifest import load_manifest
+
+
+# Bump whenever HTMLValidator or audit_page() checks change so cached
+# per-page results from an older validator are thrown away.
+VALIDATOR_VERSION = 11
+
+DEFAULT_CACHE_PATH = 'tools/.audit-cache.json'
+
+# Pages are read and fed to the parser in chunks of this many characters
+# so multi-megabyte generated pages never sit in memory whole.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Issue codes grouped the way the Quality Checklist reports them
+STRUCTURE_CODES = {'missing-doctype', 'missing-lang', 'missing-header',
+                   'missing-nav', 'missing-main', 'missing-footer', 'duplicate-id'}
+ACCESSIBILITY_CODES = {'missing-alt', 'heading-order'}
+ASSET_LINK_CODES = {'css-link', 'js-link'}
+LINK_CODES = {'broken-link', 'broken-anchor'}
+QUIZ_CODES = {'quiz-missing', 'quiz-invalid', 'quiz-duplicate-id', 'quiz-stale'}
+DUPLICATE_CODES = {'duplicate-page', 'duplicate-section'}
+PRECACHE_CODES = {'precache-missing', 'precache-invalid', 'precache-stale'}
+EXTERNAL_LINK_CODES = {'external-link-broken', 'external-link-error', 'external-link-unchecked'}
+COMPILE_CODES = {'compile-error', 'compile-warning', 'compile-timeout', 'compile-unexpected', 'no-compiler'}
+RUN_CODES = {'output-mismatch', 'run-error', 'run-timeout'}
+
+# Precompressed siblings (see precompress.py) a host may send instead of a file
+COMPRESSED_VARIANTS = ('.br', '.gz')
+
+
+class AuditIssue(namedtuple('AuditIssue', 'code severity file line message')):
+    """One audit finding.
+
+    ``code`` is a stable machine-readable identifier, ``file`` the page the
+    issue was found in (None for site-wide issues) and ``line`` the 1-based
+    source line when known. ``str()`` gives the human-readable form used in
+    the Markdown report and console output.
+    """
+    __slots__ = ()
+
+    def __str__(self):
+        return f"{self.file}: {self.message}" if self.file else self.message
+
+    def to_dict(self):
+        return self._asdict()
+
 
 class HTMLValidator(HTMLParser):
-    def __init__(self, file_path):
+    """Single-pass page parser that drives the rules in audit_rules.py.
+
+    Keeps the stack of open elements and hands each start/end tag only to
+    the rules subscribed to that tag, and each piece of text only to rules
+    whose ``text_in`` elements are open, so a rule costs nothing on
+    elements it didn't ask for and adding one doesn't add a pass.
+    """
+
+    # Elements that never have an end tag, so never go on the stack
+    VOID_ELEMENTS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+                     'link', 'meta', 'source', 'track', 'wbr'}
+
+    def __init__(self, file_path, rules):
         super().__init__()
         self.file_path = file_path
-        self.errors = []
-        self.warnings = []
-        self.has_doctype = False
-        self.has_html_lang = False
-        self.h1_count = 0
-        self.has_header = False
-        self.has_nav_sidebar = False
-        self.has_main = False
-        self.has_footer = False
-        self.css_links = []
-        self.js_links = []
-        self.ids = set()
-        self.links = []
-        self.current_tag = None
-        self.current_attrs = {}
-        self.code_blocks = 0
-        self.has_practice_section = False
-        self.has_common_errors = False
+        self.rules = rules
+        self.stack = []
+        self.data = {}
+        self._open = {}
+        self._start_any, self._start = self._subscribers('start')
+        self._end_any, self._end = self._subscribers('end')
+        self._text = [rule for rule in rules if self._overrides(rule, 'text')]
+        self._decl = [rule for rule in rules if self._overrides(rule, 'decl')]
+
+    @staticmethod
+    def _overrides(rule, hook):
+        return getattr(type(rule), hook) is not getattr(Rule, hook)
+
+    def _subscribers(self, hook):
+        """(rules that get every tag, {tag: rules}) for a start/end hook"""
+        any_tag, by_tag = [], {}
+        for rule in self.rules:
+            if not self._overrides(rule, hook):
+                continue
+            if rule.tags is None:
+                any_tag.append(rule)
+            else:
+                for tag in rule.tags:
+                    by_tag.setdefault(tag, []).append(rule)
+        return any_tag, by_tag
+
+    def inside(self, tag):
+        """Whether a tag is open at this point of the page"""
+        return bool(self._open.get(tag))
+
+    @property
+    def line(self):
+        return self.getpos()[0]
+
+    @property
+    def complete(self):
+        """True once every rule has seen what it needs (see --structure-only)"""
+        return all(rule.complete for rule in self.rules)
+
+    def finish(self):
+        """Run every rule's end-of-page checks; call after the last feed()"""
+        self.close()
+        for rule in self.rules:
+            rule.finish(self)
+
+    def issues(self):
+        return [AuditIssue(code, severity, self.file_path, line, message)
+                for rule in self.rules for code, severity, line, message in rule.issues]
 
     def handle_starttag(self, tag, attrs):
-        self.current_tag = tag
-        self.current_attrs = dict(attrs)
-        
-        if tag == 'html' and any(attr[0] == 'lang' for attr in attrs):
-            self.has_html_lang = True
-        elif tag == 'h1':
-            self.h1_count += 1
-        elif tag == 'header':
-            self.has_header = True
-        elif tag == 'nav' and any(attr[1] and 'sidebar' in attr[1] for attr in attrs if attr[0] == 'class'):
-            self.has_nav_sidebar = True
-        elif tag == 'main':
-            self.has_main = True
-        elif tag == 'footer':
-            self.has_footer = True
-        elif tag == 'link' and any(attr[0] == 'rel' and attr[1] == 'stylesheet' for attr in attrs):
-            href = next((attr[1] for attr in attrs if attr[0] == 'href'), None)
-            if href:
-                self.css_links.append(href)
-        elif tag == 'script':
-            src = next((attr[1] for attr in attrs if attr[0] == 'src'), None)
-            if src:
-                self.js_links.append(src)
-        elif tag == 'a':
-            href = next((attr[1] for attr in attrs if attr[0] == 'href'), None)
-            if href:
-                self.links.append(href)
-        elif tag == 'code' and self.current_attrs.get('class') == 'language-c':
-            self.code_blocks += 1
-            
-        # Check for IDs
-        id_attr = next((attr[1] for attr in attrs if attr[0] == 'id'), None)
-        if id_attr:
-            if id_attr in self.ids:
-                self.errors.append(f"Duplicate ID: {id_attr}")
-            self.ids.add(id_attr)
+        attrs = dict(attrs)
+        if tag not in self.VOID_ELEMENTS:
+            self.stack.append((tag, attrs))
+            self._open[tag] = self._open.get(tag, 0) + 1
+        for rule in self._start.get(tag, ()):
+            rule.start(self, tag, attrs)
+        for rule in self._start_any:
+            rule.start(self, tag, attrs)
+
+    def handle_endtag(self, tag):
+        for rule in self._end.get(tag, ()):
+            rule.end(self, tag)
+        for rule in self._end_any:
+            rule.end(self, tag)
+        # Close tag and anything left open inside it; ignore stray end tags
+        if self._open.get(tag):
+            while True:
+                open_tag, _ = self.stack.pop()
+                self._open[open_tag] -= 1
+                if open_tag == tag:
+                    break
 
     def handle_data(self, data):
-        if 'practice' in data.lower() and self.current_tag in ['h2', 'h3']:
-            self.has_practice_section = True
-        elif 'common errors' in data.lower() and self.current_tag in ['h2', 'h3']:
-            self.has_common_errors = True
+        for rule in self._text:
+            if rule.text_in is None or any(self._open.get(tag) for tag in rule.text_in):
+                rule.text(self, data)
 
     def handle_decl(self, decl):
-        if decl.lower().startswith('doctype html'):
-            self.has_doctype = True
+        for rule in self._decl:
+            rule.decl(self, decl)
+
+
+def audit_page(root, file_path, structure_only=False, assets=None):
+    """Parse and check one HTML page.
+
+    Module-level so it can run in a worker process; returns a picklable
+    ``(file_data, error)`` pair where exactly one side is None and error is
+    an AuditIssue.
+
+    The page is streamed through the validator in STREAM_CHUNK_SIZE pieces
+    and checked by every rule in audit_rules.DEFAULT_RULES. With
+    structure_only only STRUCTURE_RULES run and reading stops as soon as
+    they are complete, so checks that need the whole body (h1 count,
+    chapter content) are skipped. assets maps asset paths to fingerprinted
+    names (see build_assets.py); a page may include either name.
+    """
+    full_path = Path(root) / file_path
+    assets = assets or {}
+    
+    # Expected CSS/JS includes
+    depth = len(Path(file_path).parts) - 1
+    prefix = "../" * depth
+    expected_css = prefix + "assets/styles.css"
+    expected_js = prefix + "assets/app.js"
+    accepted_css = {expected_css, prefix + assets.get("assets/styles.css", "assets/styles.css")}
+    accepted_js = {expected_js, prefix + assets.get("assets/app.js", "assets/app.js")}
+    
+    context = RuleContext(file_path, structure_only, accepted_css, accepted_js, expected_css, expected_js)
+    rules = [rule(context) for rule in (STRUCTURE_RULES if structure_only else DEFAULT_RULES)
+             if rule.applies(context)]
+    validator = HTMLValidator(file_path, rules)
+    try:
+        with open(full_path, 'r', encoding='utf-8') as f:
+            while True:
+                chunk = f.read(STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                validator.feed(chunk)
+                if structure_only and validator.complete:
+                    break
+    except Exception as e:
+        return None, AuditIssue('read-error', 'error', file_path, None, f"Cannot read file - {e}")
+    validator.finish()
+    
+    # Data the cross-page checks read, whichever rules ran
+    file_data = {
+        'path': file_path,
+        'links': [],
+        'link_lines': [],
+        'ids': set(),
+        'code_blocks': 0,
+        'assets': [],
+        'stylesheets': [],
+        'images': [],
+        'classes': [],
+        'style_classes': [],
+        'quizzes': [],
+        'content': {'signature': None, 'sections': []},
+    }
+    file_data.update(validator.data)
+    file_data['issues'] = validator.issues()
+    return file_data, None
+
+
+class SiteIndex:
+    """Lookup tables shared by every link check in one audit pass.
+
+    Built once per run: page path -> set of ids from the parsed pages, plus
+    the set of every file and directory under the root from a single walk,
+    so resolving a link is a string normalisation and two dict/set lookups
+    instead of ``Path.resolve()`` + ``exists()`` syscalls per link.
+    """
+
+    def __init__(self, root, html_files_data):
+        self.ids = {f['path']: f['ids'] for f in html_files_data}
+        self.paths = set()
+        root = str(root)
+        for dirpath, dirnames, filenames in os.walk(root):
+            # Skip VCS metadata and other dot-directories
+            dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+            rel_dir = os.path.relpath(dirpath, root).replace(os.sep, '/')
+            prefix = '' if rel_dir == '.' else rel_dir + '/'
+            for name in dirnames + filenames:
+                self.paths.add(prefix + name)
+
+    @staticmethod
+    def resolve(file_path, target_path):
+        """Resolve a relative link from file_path to a root-relative path.
+
+        Returns None when the link climbs out of the site root.
+        """
+        resolved = posixpath.normpath(posixpath.join(posixpath.dirname(file_path), target_path))
+        if resolved == '..' or resolved.startswith('../'):
+            return None
+        return resolved
+
+    def exists(self, path):
+        return path == '.' or path in self.paths
+
+    def has_anchor(self, path, anchor):
+        """False only for audited pages that lack the id; unaudited targets pass"""
+        ids = self.ids.get(path)
+        return ids is None or anchor in ids
+
+
+class AuditCache:
+    """Persistent per-page audit results keyed by path + content hash.
+
+    Each entry keeps the parsed page data plus the outcome of its link check
+    (errors, resolved targets and which of them were missing) so unchanged
+    pages skip both parsing and cross-file checks on the next run.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.pages = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') == VALIDATOR_VERSION:
+            self.pages = data.get('pages', {})
+
+    def lookup(self, file_path, digest):
+        """Return cached file data for an unchanged page, else None"""
+        entry = self.pages.get(file_path)
+        if not entry or entry['hash'] != digest:
+            return None
+        file_data = dict(entry['data'])
+        file_data['ids'] = set(file_data['ids'])
+        file_data['issues'] = [AuditIssue(*i) for i in file_data['issues']]
+        return file_data
+
+    def store(self, file_path, digest, file_data):
+        data = dict(file_data)
+        data['ids'] = sorted(data['ids'])
+        self.pages[file_path] = {'hash': digest, 'data': data}
+
+    def cached_ids(self, file_path):
+        entry = self.pages.get(file_path)
+        return set(entry['data']['ids']) if entry else None
+
+    def link_result(self, file_path):
+        """Return (errors, targets, missing) from the last link check, or None"""
+        entry = self.pages.get(file_path)
+        if not entry or 'link_errors' not in entry:
+            return None
+        errors = [AuditIssue(*e) for e in entry['link_errors']]
+        return errors, entry['targets'], set(entry['missing'])
+
+    def store_link_result(self, file_path, errors, targets, missing):
+        entry = self.pages[file_path]
+        entry['link_errors'] = errors
+        entry['targets'] = sorted(targets)
+        entry['missing'] = sorted(missing)
+
+    def evict(self, live_paths):
+        """Drop entries for pages that no longer exist; return their paths"""
+        stale = [p for p in self.pages if p not in live_paths]
+        for file_path in stale:
+            del self.pages[file_path]
+        return stale
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': VALIDATOR_VERSION, 'pages': self.pages}, f, sort_keys=True)
+        os.replace(tmp_path, self.path)
 
 
 class SiteAuditor:
-    def __init__(self, root_path):
+    def __init__(self, root_path, jobs=1, cache_path=None, structure_only=False, manifest=None,
+                 compile_snippets=False, run_snippets=False, cache=None, external_links=False,
+                 offline=False):
         self.root = Path(root_path)
+        self.manifest = manifest or load_manifest(self.root)
+        self.jobs = jobs
+        self.structure_only = structure_only
+        # Running examples needs them compiled first
+        self.compile_snippets = compile_snippets or run_snippets
+        self.run_snippets = run_snippets
+        # Replaying cached external link results still checks external links
+        self.external_links = external_links or offline
+        self.offline = offline
+        # Structure-only results are partial, so they never touch the cache.
+        # A long-running caller (watch_site.py) passes its own AuditCache to keep it in memory.
+        if structure_only:
+            self.cache = None
+        else:
+            self.cache = cache or (AuditCache(self.root / cache_path) if cache_path else None)
+        # Pages whose link checks must re-run this pass (None = all of them)
+        self._dirty_links = None
+        self._changed_targets = set()
+        self.site_index = None
+        self.pages_audited = []
+        # page path -> bytes sent for the page and its CSS/JS (see check_transfer_budgets)
+        self.transfer_sizes = {}
+        # page path -> bytes the SVG optimizer saves on the SVGs it references (see check_svg_savings)
+        self.svg_savings = {}
+        self._svg_saving_by_file = {}
+        self._svg_state = None
+        # stylesheet path -> class names its selectors define
+        self._stylesheet_classes = {}
+        # Whether the root has a precache manifest to check (see check_precache)
+        self.precache_checked = False
+        # phase name -> (wall seconds, CPU seconds of this process)
+        self.timings = {}
         self.errors = []
         self.warnings = []
-        self.required_files = {
-            'index.html': 'root',
-            'assets/styles.css': 'css',
-            'assets/app.js': 'js',
-            'assets/quiz.js': 'js',
-            'assets/quiz.css': 'css',
-            'assets/favicon.svg': 'icon',
-            '404.html': 'root',
-            
-            # Chapters
-            'chapters/01-introduction.html': 'chapter',
-            'chapters/02-basics.html': 'chapter',
-            'chapters/03-control-flow.html': 'chapter',
-            'chapters/04-loops.html': 'chapter',
-            'chapters/05-arrays-strings.html': 'chapter',
-            'chapters/06-functions.html': 'chapter',
-            'chapters/07-pointers.html': 'chapter',
-            'chapters/08-structures.html': 'chapter',
-            'chapters/09-files.html': 'chapter',
-            'chapters/10-algorithms.html': 'chapter',
-            
-            # Practice
-            'practice/basics.html': 'practice',
-            'practice/control-loops.html': 'practice',
-            'practice/arrays.html': 'practice',
-            'practice/functions.html': 'practice',
-            'practice/pointers.html': 'practice',
-            'practice/structures.html': 'practice',
-            'practice/files.html': 'practice',
-            
-            # Reference
-            'reference/common-errors.html': 'reference',
-            'reference/exam-guide.html': 'reference',
-            'reference/tools-resources.html': 'reference'
-        }
+        self.required_files = self.manifest.required_files
         
     def audit_file_structure(self):
         """Check if all required files exist"""
@@ -131,104 +392,141 @@ class SiteAuditor:
         missing_files = []
         
         for file_path, file_type in self.required_files.items():
-            full_path = self.root / file_path
-            if not full_path.exists():
+            if not self.manifest.exists(self.manifest.built_path(file_path)):
                 missing_files.append(file_path)
-                self.errors.append(f"Missing required file: {file_path}")
+                self.errors.append(AuditIssue('missing-file', 'error', None, None,
+                                              f"Missing required file: {file_path}"))
         
         return len(missing_files) == 0
     
     def audit_html_file(self, file_path):
         """Audit a single HTML file"""
-        full_path = self.root / file_path
-        
-        try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except Exception as e:
-            self.errors.append(f"{file_path}: Cannot read file - {e}")
-            return None
-            
-        validator = HTMLValidator(file_path)
-        validator.feed(content)
-        
-        # Check required elements
-        issues = []
-        if not validator.has_doctype:
-            issues.append("Missing DOCTYPE html")
-        if not validator.has_html_lang:
-            issues.append("Missing <html lang='en'>")
-        if validator.h1_count != 1:
-            issues.append(f"Expected 1 <h1>, found {validator.h1_count}")
-        if not validator.has_header:
-            issues.append("Missing <header>")
-        if not validator.has_nav_sidebar:
-            issues.append("Missing <nav> with sidebar class")
-        if not validator.has_main:
-            issues.append("Missing <main>")
-        if not validator.has_footer:
-            issues.append("Missing <footer>")
-            
-        # Check CSS/JS includes
-        depth = len(Path(file_path).parts) - 1
-        expected_css = "../" * depth + "assets/styles.css" if depth > 0 else "assets/styles.css"
-        expected_js = "../" * depth + "assets/app.js" if depth > 0 else "assets/app.js"
-        
-        if expected_css not in validator.css_links:
-            issues.append(f"Missing or incorrect CSS link: expected {expected_css}")
-        if expected_js not in validator.js_links:
-            issues.append(f"Missing or incorrect JS link: expected {expected_js}")
-            
-        # Chapter-specific checks
-        if file_path.startswith('chapters/'):
-            if validator.code_blocks == 0:
-                issues.append("Chapter missing code blocks")
-            if not validator.has_practice_section:
-                issues.append("Chapter missing Practice section")
-            if not validator.has_common_errors:
-                issues.append("Chapter missing Common Errors section")
-        
-        return {
-            'path': file_path,
-            'issues': issues,
-            'links': validator.links,
-            'ids': validator.ids,
-            'code_blocks': validator.code_blocks
-        }
+        file_data, error = audit_page(self.root, file_path, self.structure_only, self.manifest.assets)
+        if error:
+            self.errors.append(error)
+        return file_data
+
+    def _audit_html_files(self, html_files):
+        """Audit HTML files, fanning out over a process pool when jobs > 1.
+
+        Results come back in input order so the merged errors match a serial run.
+        """
+        audit = partial(audit_page, self.root, structure_only=self.structure_only, assets=self.manifest.assets)
+        if self.jobs <= 1 or len(html_files) < 2:
+            return [(file_path, *audit(file_path)) for file_path in html_files]
+
+        chunksize = max(1, len(html_files) // (self.jobs * 4))
+        with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+            results = executor.map(audit, html_files, chunksize=chunksize)
+            return [(file_path, *result) for file_path, result in zip(html_files, results)]
     
+    def _audit_html_files_cached(self, html_files):
+        """Like _audit_html_files, but only re-parse pages whose content changed.
+
+        Also works out which pages need their link checks re-run: pages that
+        were re-parsed, plus (via _changed_targets) anything linking to a page
+        whose ids changed or that was added or evicted from the cache.
+        """
+        if not self.cache:
+            return self._audit_html_files(html_files)
+
+        evicted = self.cache.evict(set(html_files))
+        digests = {}
+        cached = {}
+        for file_path in html_files:
+            try:
+                digest = hashlib.sha256()
+                with open(self.root / file_path, 'rb') as f:
+                    for block in iter(lambda: f.read(STREAM_CHUNK_SIZE), b''):
+                        digest.update(block)
+                digests[file_path] = digest.hexdigest()
+            except OSError:
+                continue
+            file_data = self.cache.lookup(file_path, digests[file_path])
+            if file_data is not None:
+                cached[file_path] = file_data
+
+        stale = [f for f in html_files if f not in cached]
+        fresh = {file_path: (file_data, error) for file_path, file_data, error in self._audit_html_files(stale)}
+
+        self._dirty_links = set(stale)
+        self._changed_targets = set(evicted)
+        for file_path, (file_data, error) in fresh.items():
+            if file_data is None:
+                continue
+            if self.cache.cached_ids(file_path) != file_data['ids']:
+                self._changed_targets.add(file_path)
+            if file_path in digests:
+                self.cache.store(file_path, digests[file_path], file_data)
+
+        print(f"   ♻️  Reused {len(cached)} cached pages, re-parsed {len(stale)}")
+        return [(f, *fresh[f]) if f in fresh else (f, cached[f], None) for f in html_files]
+
     def check_internal_links(self, html_files_data):
         """Check that internal links resolve correctly"""
         print("🔗 Checking internal links...")
         
+        self.site_index = SiteIndex(self.root, html_files_data)
         for file_data in html_files_data:
             file_path = file_data['path']
-            current_dir = Path(file_path).parent
-            
-            for link in file_data['links']:
-                if link.startswith('#'):
-                    # Internal anchor
-                    anchor = link[1:]
-                    if anchor not in file_data['ids']:
-                        self.errors.append(f"{file_path}: Broken anchor #{anchor}")
-                elif not link.startswith(('http://', 'https://', 'mailto:')):
-                    # Internal link
-                    if '#' in link:
-                        target_path, anchor = link.split('#', 1)
-                    else:
-                        target_path, anchor = link, None
-                        
-                    # Resolve relative path
-                    if target_path:
-                        resolved_path = (current_dir / target_path).resolve()
-                        relative_path = resolved_path.relative_to(self.root.resolve())
-                        
-                        if not (self.root / relative_path).exists():
-                            self.errors.append(f"{file_path}: Broken link to {link}")
-                        elif anchor:
-                            # Check if target has the anchor
-                            target_data = next((f for f in html_files_data if f['path'] == str(relative_path)), None)
-                            if target_data and anchor not in target_data['ids']:
-                                self.errors.append(f"{file_path}: Broken anchor {link}")
+            cached = None
+            if self.cache and self._dirty_links is not None and file_path not in self._dirty_links:
+                cached = self.cache.link_result(file_path)
+            if cached is not None and not self._targets_changed(*cached[1:]):
+                errors = cached[0]
+            else:
+                errors, targets, missing = self._check_page_links(file_data)
+                if self.cache:
+                    self.cache.store_link_result(file_path, errors, targets, missing)
+            self.errors.extend(errors)
+
+    def _targets_changed(self, targets, missing):
+        """True if any link target appeared, vanished or changed its ids"""
+        for target in targets:
+            if target in self._changed_targets:
+                return True
+            if (target in missing) == self.site_index.exists(target):
+                return True
+        return False
+
+    def _check_page_links(self, file_data):
+        """Return (errors, targets, missing) for one page's links"""
+        errors = []
+        targets = set()
+        missing = set()
+        file_path = file_data['path']
+        index = self.site_index
+        
+        def error(code, line, message):
+            errors.append(AuditIssue(code, 'error', file_path, line, message))
+        
+        for link, line in zip(file_data['links'], file_data['link_lines']):
+            if link.startswith('#'):
+                # Internal anchor
+                anchor = link[1:]
+                if anchor not in file_data['ids']:
+                    error('broken-anchor', line, f"Broken anchor #{anchor}")
+            elif not link.startswith(('http://', 'https://', 'mailto:')):
+                # Internal link
+                if '#' in link:
+                    target_path, anchor = link.split('#', 1)
+                else:
+                    target_path, anchor = link, None
+                    
+                if target_path:
+                    relative_path = index.resolve(file_path, target_path)
+                    if relative_path is None:
+                        error('broken-link', line, f"Broken link to {link}")
+                        continue
+                    targets.add(relative_path)
+                    
+                    if not index.exists(relative_path):
+                        missing.add(relative_path)
+                        error('broken-link', line, f"Broken link to {link}")
+                    elif anchor and not index.has_anchor(relative_path, anchor):
+                        error('broken-anchor', line, f"Broken anchor {link}")
+        
+        return errors, targets, missing
     
     def check_sidebar_consistency(self, html_files_data):
         """Check that sidebar navigation is consistent"""
@@ -237,65 +535,376 @@ class SiteAuditor:
         # Extract sidebar from index.html as canonical
         index_data = next((f for f in html_files_data if f['path'] == 'index.html'), None)
         if not index_data:
-            self.errors.append("Cannot find index.html for sidebar reference")
+            self.errors.append(AuditIssue('missing-index', 'error', None, None,
+                                          "Cannot find index.html for sidebar reference"))
             return
         
         # For now, just check that each page has navigation links
         for file_data in html_files_data:
             if len([l for l in file_data['links'] if 'chapters/' in l or 'practice/' in l or 'reference/' in l]) < 5:
-                self.warnings.append(f"{file_data['path']}: Sidebar may be incomplete")
+                self.warnings.append(AuditIssue('sidebar-incomplete', 'warning', file_data['path'], None,
+                                                "Sidebar may be incomplete"))
+    
+    def _transfer_size(self, path, sizes):
+        """Bytes a host sends for path: its smallest precompressed variant, or the file itself"""
+        if path not in sizes:
+            candidates = []
+            for variant in ('',) + COMPRESSED_VARIANTS:
+                try:
+                    candidates.append(os.stat(self.root / f"{path}{variant}").st_size)
+                except OSError:
+                    pass
+            sizes[path] = min(candidates) if candidates else None
+        return sizes[path]
+
+    def check_transfer_budgets(self, html_files_data):
+        """Check each page plus its CSS/JS against the manifest's per-type budget (KB)"""
+        print("📦 Checking transfer-size budgets...")
+        budgets = self.manifest.budgets
+        sizes = {}
+        for file_data in html_files_data:
+            file_path = file_data['path']
+            html_bytes = self._transfer_size(file_path, sizes) or 0
+            assets = {}
+            for href in file_data.get('assets', []):
+                if href.startswith(('http://', 'https://', '//')):
+                    continue
+                asset = SiteIndex.resolve(file_path, href.split('?', 1)[0].split('#', 1)[0])
+                if asset is not None and asset not in assets:
+                    assets[asset] = self._transfer_size(asset, sizes) or 0
+            total = html_bytes + sum(assets.values())
+            self.transfer_sizes[file_path] = total
+
+            page_type = self.required_files.get(file_path)
+            budget = budgets.get(page_type, budgets.get('default'))
+            if budget is not None and total > budget * 1024:
+                self.errors.append(AuditIssue(
+                    'transfer-budget', 'error', file_path, None,
+                    f"Transfer size {total / 1024:.1f} KB exceeds the {budget} KB {page_type or 'default'} budget "
+                    f"(HTML {html_bytes / 1024:.1f} KB + {len(assets)} assets {sum(assets.values()) / 1024:.1f} KB)"))
     
-    def run_audit(self):
+    def _classes_defined_in(self, path):
+        if path not in self._stylesheet_classes:
+            try:
+                with open(self.root / path, 'r', encoding='utf-8') as f:
+                    self._stylesheet_classes[path] = defined_classes(f.read())
+            except OSError:
+                self._stylesheet_classes[path] = set()
+        return self._stylesheet_classes[path]
+
+    def _svg_saving(self, path):
+        """Bytes optimize_svg.py saves on one SVG.
+
+        A root built by build_assets.py records this in its SVG state file;
+        for a source tree the SVG is optimized in memory.
+        """
+        if self._svg_state is None:
+            try:
+                with open(self.root / SVG_STATE_NAME, 'r', encoding='utf-8') as f:
+                    self._svg_state = json.load(f).get('files', {})
+            except (OSError, ValueError):
+                self._svg_state = {}
+        if path not in self._svg_saving_by_file:
+            entry = self._svg_state.get(path)
+            if entry:
+                saved = entry['source_bytes'] - entry['bytes']
+            else:
+                try:
+                    text = (self.root / path).read_text(encoding='utf-8')
+                    saved = len(text.encode('utf-8')) - len(optimize_svg(text).encode('utf-8'))
+                except (OSError, UnicodeDecodeError):
+                    saved = 0
+            self._svg_saving_by_file[path] = saved
+        return self._svg_saving_by_file[path]
+
+    def check_svg_savings(self, html_files_data):
+        """Record how many bytes SVG optimization saves for each page's images"""
+        print("🖼️  Checking SVG optimization...")
+        for file_data in html_files_data:
+            file_path = file_data['path']
+            saved = 0
+            for src in set(file_data.get('images', [])):
+                if '://' in src or not src.lower().endswith('.svg'):
+                    continue
+                path = SiteIndex.resolve(file_path, src)
+                if path is not None:
+                    saved += self._svg_saving(path)
+            if saved:
+                self.svg_savings[file_path] = saved
+
+    def check_css_classes(self, html_files_data):
+        """Warn about classes a page uses that no rule in its stylesheets targets.
+
+        Catches rules renamed or dropped from the CSS (including the critical
+        subset inlined by build_assets.py). Classes listed as
+        ``unstyled_classes`` in site.json are script hooks and are skipped.
+        """
+        print("🎨 Checking CSS classes...")
+        hooks = self.manifest.unstyled_classes
+        for file_data in html_files_data:
+            file_path = file_data['path']
+            defined = set(file_data.get('style_classes', []))
+            for href in file_data.get('stylesheets', []):
+                if href.startswith(('http://', 'https://', '//')):
+                    continue
+                sheet = SiteIndex.resolve(file_path, href)
+                if sheet is not None:
+                    defined |= self._classes_defined_in(sheet)
+            unstyled = [c for c in file_data.get('classes', []) if c not in defined and c not in hooks]
+            if unstyled:
+                self.warnings.append(AuditIssue('unstyled-class', 'warning', file_path, None,
+                                                f"Classes with no CSS rule: {', '.join(unstyled)}"))
+
+    def check_duplicate_content(self, html_files_data):
+        """Warn about pages and <h2> sections whose text nearly repeats another's.
+
+        Compares the MinHash signatures ContentRule computed while parsing
+        (see near_duplicates.py), so the cost grows with the number of pages,
+        not pairs of them. Each copy is reported against the first page (in
+        manifest order) of its group; sections of pages already reported as
+        duplicates of each other aren't reported again.
+        """
+        print("🔁 Checking for near-duplicate content...")
+        page_group = {}
+        for group in near_duplicate_groups({f['path']: f['content']['signature'] for f in html_files_data}):
+            first = group[0][0]
+            for path, similar in group:
+                page_group[path] = first
+                if path != first:
+                    self.warnings.append(AuditIssue('duplicate-page', 'warning', path, None,
+                                                    f"Near-duplicate of {first} ({similar:.0%} similar)"))
+
+        sections = {}
+        for f in html_files_data:
+            for heading, line, sig in f['content']['sections']:
+                sections[(f['path'], line, heading)] = sig
+        for group in near_duplicate_groups(sections):
+            first_page, _, first_heading = group[0][0]
+            for (path, line, heading), similar in group[1:]:
+                if path != first_page and page_group.get(path, path) == page_group.get(first_page, first_page):
+                    continue
+                self.warnings.append(AuditIssue(
+                    'duplicate-section', 'warning', path, line,
+                    f"Section \"{heading}\" is a near-duplicate of \"{first_heading}\" in {first_page} "
+                    f"({similar:.0%} similar)"))
+    
+    def check_quizzes(self, html_files_data):
+        """Check every quiz container's shard (see build_quizzes.py).
+
+        A shard must exist, be valid (a slug id usable in the czh.quiz.<id>
+        key, questions with answers among their choices and unique ids) and
+        be the quiz the container names; a quiz id used by two containers
+        would share saved progress. Shards older than their bank in quizzes/
+        are warnings.
+        """
+        print("❓ Checking quizzes...")
+        shards = {}
+        seen = {}
+        for f in html_files_data:
+            for quiz_id, src, line in f['quizzes']:
+                def error(code, message):
+                    self.errors.append(AuditIssue(code, 'error', f['path'], line, message))
+                
+                if quiz_id in seen:
+                    error('quiz-duplicate-id', f"Quiz id \"{quiz_id}\" is also used in {seen[quiz_id]}")
+                seen.setdefault(quiz_id, f['path'])
+                if not src:
+                    error('quiz-missing', f"Quiz \"{quiz_id}\" has no data-quiz-src")
+                    continue
+                path = SiteIndex.resolve(f['path'], src)
+                if path is None:
+                    error('quiz-missing', f"Quiz \"{quiz_id}\" loads {src}, outside the site")
+                    continue
+                if path not in shards:
+                    try:
+                        with open(self.root / path, 'r', encoding='utf-8') as shard_file:
+                            shards[path] = json.load(shard_file)
+                    except (OSError, ValueError) as e:
+                        shards[path] = e
+                shard = shards[path]
+                if isinstance(shard, Exception):
+                    error('quiz-missing', f"Cannot load quiz \"{quiz_id}\" from {src} - {shard}")
+                    continue
+                problems = validate_quiz(shard)
+                if not problems and shard['quizId'] != quiz_id:
+                    problems = [f"{src} holds quiz \"{shard['quizId']}\""]
+                for problem in problems:
+                    error('quiz-invalid', f"Quiz \"{quiz_id}\": {problem}")
+        
+        if (self.root / QUIZ_SOURCE_DIR).is_dir():
+            try:
+                stale, _ = build_quizzes(self.root, check=True)
+            except ValueError as e:
+                self.errors.append(AuditIssue('quiz-invalid', 'error', None, None, str(e)))
+                return
+            for path in stale:
+                self.warnings.append(AuditIssue('quiz-stale', 'warning', path, None,
+                                                "Out of date; run tools/build_quizzes.py"))
+    
+    def check_precache(self, html_files_data):
+        """Check the service worker's precache manifest (see build_precache.py).
+
+        Every entry must exist, or the worker fails to install. A manifest
+        that doesn't match the audited pages and the files they reference
+        (or a sw.js without its version) is a warning: the worker would
+        serve outdated copies until it is rebuilt. Sites without a manifest
+        are skipped.
+        """
+        path = self.root / PRECACHE_MANIFEST_NAME
+        if not path.exists():
+            return
+        print("📴 Checking precache manifest...")
+        self.precache_checked = True
+        
+        def error(code, message):
+            self.errors.append(AuditIssue(code, 'error', PRECACHE_MANIFEST_NAME, None, message))
+        
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)['entries']
+            urls = list(entries)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            error('precache-invalid', f"Cannot load precache manifest - {e}")
+            return
+        for url in urls:
+            if not isinstance(url, str) or SiteIndex.resolve('', url) != url or not self.manifest.exists(url):
+                error('precache-missing', f"Precached file {url} doesn't exist")
+        
+        try:
+            stale, _ = build_precache(self.root, html_files_data, check=True)
+        except (OSError, ValueError) as e:
+            error('precache-missing', str(e))
+            return
+        for stale_path in stale:
+            self.warnings.append(AuditIssue('precache-stale', 'warning', stale_path, None,
+                                            "Out of date; run tools/build_precache.py"))
+    
+    def check_code_examples(self, html_files_data):
+        """Compile every C code block with the local compiler (see check_snippets.py)
+
+        With run_snippets, programs that state their output are also run and
+        checked against it.
+        """
+        print("🛠️  Compiling code examples...")
+        checker = SnippetChecker(self.root, jobs=self.jobs, run=self.run_snippets)
+        if not checker.compiler:
+            self.warnings.append(AuditIssue('no-compiler', 'warning', None, None,
+                                            "No C compiler found; code examples were not compiled"))
+            return
+        for issue in checker.check([f['path'] for f in html_files_data]):
+            issue = AuditIssue(*issue)
+            (self.errors if issue.severity == 'error' else self.warnings).append(issue)
+    
+    def check_external_links(self, html_files_data):
+        """Check http(s) links with check_links.py, reusing its cache of recent results"""
+        print("🌐 Checking external links...")
+        checker = LinkChecker(self.root, offline=self.offline)
+        links = [(f['path'], line, link) for f in html_files_data
+                 for link, line in zip(f['links'], f['link_lines']) if is_external(link)]
+        for issue in checker.check(links):
+            issue = AuditIssue(*issue)
+            (self.errors if issue.severity == 'error' else self.warnings).append(issue)
+    
+    @contextmanager
+    def _phase(self, name):
+        """Record wall-clock and CPU time spent in one audit phase"""
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            self.timings[name] = (time.perf_counter() - wall_start, time.process_time() - cpu_start)
+    
+    def run_audit(self, json_path=None, junit_path=None):
         """Run complete site audit"""
         print("🚀 Starting C Programming Zero to Hero Site Audit\n")
+        self.audit()
+        
+        # Generate report
+        with self._phase('report'):
+            self.generate_report()
+        if json_path:
+            self.write_json_report(json_path)
+            print(f"🧾 JSON report written: {json_path}")
+        if junit_path:
+            self.write_junit_report(junit_path)
+            print(f"🧾 JUnit report written: {junit_path}")
+        
+        self.print_timings()
+        
+        # Return exit code
+        return 0 if len(self.errors) == 0 else 1
+    
+    def audit(self):
+        """Run every check, collecting self.errors and self.warnings without writing reports"""
+        self.generated_at = datetime.now()
         
         # Check file structure
-        files_ok = self.audit_file_structure()
+        with self._phase('structure'):
+            files_ok = self.audit_file_structure()
         
         # Audit HTML files
-        html_files = [f for f in self.required_files.keys() if f.endswith('.html')]
+        html_files = self.manifest.html_files
         html_files_data = []
         
         print("\n📄 Auditing HTML files...")
-        for file_path in html_files:
-            if (self.root / file_path).exists():
-                file_data = self.audit_html_file(file_path)
+        with self._phase('parse'):
+            html_files = [f for f in html_files if self.manifest.exists(f)]
+            for file_path, file_data, error in self._audit_html_files_cached(html_files):
+                if error:
+                    self.errors.append(error)
                 if file_data:
                     html_files_data.append(file_data)
-                    if file_data['issues']:
-                        for issue in file_data['issues']:
-                            self.errors.append(f"{file_path}: {issue}")
+                    for issue in file_data['issues']:
+                        (self.errors if issue.severity == 'error' else self.warnings).append(issue)
+        self.pages_audited = [f['path'] for f in html_files_data]
         
-        # Check links and consistency
-        if html_files_data:
-            self.check_internal_links(html_files_data)
-            self.check_sidebar_consistency(html_files_data)
+        # Check links and consistency (needs full pages, so not in structure-only mode)
+        if html_files_data and not self.structure_only:
+            with self._phase('links'):
+                self.check_internal_links(html_files_data)
+            with self._phase('sidebar'):
+                self.check_sidebar_consistency(html_files_data)
+            with self._phase('budgets'):
+                self.check_transfer_budgets(html_files_data)
+            with self._phase('classes'):
+                self.check_css_classes(html_files_data)
+            with self._phase('images'):
+                self.check_svg_savings(html_files_data)
+            with self._phase('duplicates'):
+                self.check_duplicate_content(html_files_data)
+            with self._phase('quizzes'):
+                self.check_quizzes(html_files_data)
+            with self._phase('precache'):
+                self.check_precache(html_files_data)
+            if self.compile_snippets:
+                with self._phase('compile'):
+                    self.check_code_examples(html_files_data)
+            if self.external_links:
+                with self._phase('external'):
+                    self.check_external_links(html_files_data)
         
-        # Generate report
-        self.generate_report()
-        
-        # Return exit code
-        return 0 if len(self.errors) == 0 else 1
+        if self.cache:
+            self.cache.save()
     
     def generate_report(self):
         """Generate audit report"""
         report_path = self.root / 'tools' / 'audit-report.md'
+        report_path.parent.mkdir(exist_ok=True)
         
         with open(report_path, 'w', encoding='utf-8') as f:
             f.write("# Site Audit Report - C Programming Zero to Hero\n\n")
-            f.write(f"**Generated:** {__import__('datetime').datetime.now().isoformat()}\n\n")
+            f.write(f"**Generated:** {self.generated_at.isoformat()}\n\n")
             
             # Summary
-            status = "PASS ✅" if len(self.errors) == 0 else "FAIL ❌"
-            f.write(f"## Overall Status: {status}\n\n")
+            overall_status = "PASS ✅" if len(self.errors) == 0 else "FAIL ❌"
+            f.write(f"## Overall Status: {overall_status}\n\n")
             f.write(f"- **Errors:** {len(self.errors)}\n")
             f.write(f"- **Warnings:** {len(self.warnings)}\n\n")
             
             # File structure
             f.write("## File Structure\n\n")
             for file_path, file_type in self.required_files.items():
-                exists = (self.root / file_path).exists()
-                status = "✅" if exists else "❌"
+                status = "✅" if self.manifest.exists(self.manifest.built_path(file_path)) else "❌"
                 f.write(f"- {status} `{file_path}`\n")
             f.write("\n")
             
@@ -313,17 +922,47 @@ class SiteAuditor:
                     f.write(f"- ⚠️ {warning}\n")
                 f.write("\n")
             
+            # SVG optimization
+            if self.svg_savings:
+                applied = "saved by" if self._svg_state else "that would be saved by"
+                f.write("## SVG Optimization\n\n")
+                f.write(f"Bytes of referenced SVGs {applied} `optimize_svg.py`:\n\n")
+                for file_path, saved in self.svg_savings.items():
+                    f.write(f"- `{file_path}`: {saved} bytes\n")
+                f.write("\n")
+            
             # Checklist
             f.write("## Quality Checklist\n\n")
+            codes = {e.code for e in self.errors}
+            warning_codes = {w.code for w in self.warnings}
             checklist_items = [
-                ("All required pages exist", len([f for f in self.required_files.keys() if not (self.root / f).exists()]) == 0),
-                ("HTML structure valid", len([e for e in self.errors if 'Missing' in e and any(tag in e for tag in ['DOCTYPE', 'html', 'h1', 'header', 'nav', 'main', 'footer'])]) == 0),
-                ("CSS/JS paths correct", len([e for e in self.errors if 'CSS link' in e or 'JS link' in e]) == 0),
-                ("No broken internal links", len([e for e in self.errors if 'Broken link' in e or 'Broken anchor' in e]) == 0),
-                ("Chapters have code blocks", len([e for e in self.errors if 'missing code blocks' in e]) == 0),
-                ("Chapters have practice sections", len([e for e in self.errors if 'missing Practice section' in e]) == 0),
-                ("Chapters have error guidance", len([e for e in self.errors if 'missing Common Errors' in e]) == 0)
+                ("All required pages exist", 'missing-file' not in codes),
+                ("HTML structure valid", not codes & STRUCTURE_CODES),
+                ("CSS/JS paths correct", not codes & ASSET_LINK_CODES),
+                ("No broken internal links", not codes & LINK_CODES),
+                ("Chapters have code blocks", 'chapter-code-blocks' not in codes),
+                ("Chapters have practice sections", 'chapter-practice' not in codes),
+                ("Chapters have error guidance", 'chapter-common-errors' not in codes),
+                ("Pages within transfer-size budgets", 'transfer-budget' not in codes),
+                ("Used classes have CSS rules", 'unstyled-class' not in warning_codes),
+                ("Images have alt text and headings don't skip levels",
+                 not (codes | warning_codes) & ACCESSIBILITY_CODES),
+                ("Code blocks declare a language", 'code-language' not in warning_codes),
+                ("No near-duplicate pages or sections", not warning_codes & DUPLICATE_CODES),
+                ("Quizzes load valid question banks", not (codes | warning_codes) & QUIZ_CODES)
             ]
+            if self.precache_checked:
+                checklist_items.append(("Precache manifest entries exist and are current",
+                                        not (codes | warning_codes) & PRECACHE_CODES))
+            if self.compile_snippets:
+                checklist_items.append(("Code examples compile",
+                                        not (codes | warning_codes) & COMPILE_CODES))
+            if self.run_snippets:
+                checklist_items.append(("Code examples print their stated output",
+                                        not (codes | warning_codes) & RUN_CODES))
+            if self.external_links:
+                checklist_items.append(("External links reachable",
+                                        not (codes | warning_codes) & EXTERNAL_LINK_CODES))
             
             for item, passed in checklist_items:
                 status = "✅" if passed else "❌"
@@ -333,7 +972,7 @@ class SiteAuditor:
         
         # Print summary
         print(f"\n📊 AUDIT SUMMARY")
-        print(f"Status: {status}")
+        print(f"Status: {overall_status}")
         print(f"Errors: {len(self.errors)}")
         print(f"Warnings: {len(self.warnings)}")
         
@@ -343,16 +982,116 @@ class SiteAuditor:
                 print(f"  ❌ {error}")
             if len(self.errors) > 5:
                 print(f"  ... and {len(self.errors) - 5} more")
+    
+    def print_timings(self):
+        """Print per-phase timings collected by _phase()"""
+        print("\n⏱️  Phase timings (wall / CPU):")
+        for name, (wall, cpu) in self.timings.items():
+            print(f"  {name:<10} {wall * 1000:8.1f} ms / {cpu * 1000:8.1f} ms")
+    
+    def write_json_report(self, path):
+        """Write errors, warnings and phase timings as JSON for CI dashboards"""
+        report = {
+            'generated': self.generated_at.isoformat(),
+            'status': 'pass' if not self.errors else 'fail',
+            'summary': {
+                'errors': len(self.errors),
+                'warnings': len(self.warnings),
+                'pages': len(self.pages_audited),
+            },
+            'issues': [issue.to_dict() for issue in self.errors + self.warnings],
+            'transfer_bytes': self.transfer_sizes,
+            'svg_bytes_saved': self.svg_savings,
+            'timings': {
+                name: {'wall_seconds': round(wall, 6), 'cpu_seconds': round(cpu, 6)}
+                for name, (wall, cpu) in self.timings.items()
+            },
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+    
+    def write_junit_report(self, path):
+        """Write a JUnit XML report: one test case per audited page.
+
+        Errors become <failure> elements, warnings go to <system-out>, and
+        site-wide issues are reported under a 'site' test case.
+        """
+        by_file = {}
+        for issue in self.errors + self.warnings:
+            by_file.setdefault(issue.file or 'site', []).append(issue)
+        
+        cases = ['site'] + self.pages_audited
+        suite = ET.Element('testsuite', {
+            'name': 'site-audit',
+            'tests': str(len(cases)),
+            'failures': str(sum(1 for c in cases if any(i.severity == 'error' for i in by_file.get(c, [])))),
+            'errors': '0',
+            'time': f"{sum(wall for wall, _ in self.timings.values()):.3f}",
+            'timestamp': self.generated_at.isoformat(timespec='seconds'),
+        })
+        properties = ET.SubElement(suite, 'properties')
+        for name, (wall, cpu) in self.timings.items():
+            ET.SubElement(properties, 'property', {'name': f'timing.{name}.wall', 'value': f"{wall:.6f}"})
+            ET.SubElement(properties, 'property', {'name': f'timing.{name}.cpu', 'value': f"{cpu:.6f}"})
+        
+        for case in cases:
+            classname = case.split('/')[0] if '/' in case else 'root'
+            testcase = ET.SubElement(suite, 'testcase', {'classname': classname, 'name': case})
+            issues = by_file.get(case, [])
+            for issue in issues:
+                if issue.severity == 'error':
+                    location = f" (line {issue.line})" if issue.line else ""
+                    failure = ET.SubElement(testcase, 'failure', {'type': issue.code, 'message': issue.message})
+                    failure.text = f"{issue}{location}"
+            warnings = [str(i) for i in issues if i.severity != 'error']
+            if warnings:
+                ET.SubElement(testcase, 'system-out').text = '\n'.join(warnings)
+        
+        ET.ElementTree(suite).write(path, encoding='utf-8', xml_declaration=True)
 
 
 def main():
-    if len(sys.argv) > 1:
-        root_path = sys.argv[1]
-    else:
-        root_path = '.'
+    parser = argparse.ArgumentParser(description="Audit the C Programming Zero to Hero static site")
+    parser.add_argument('root', nargs='?', default='.', help="Site root directory (default: current directory)")
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help="Parse pages in N worker processes (0 = one per CPU, default: 1)")
+    parser.add_argument('--cache', nargs='?', const=DEFAULT_CACHE_PATH, default=None, metavar='PATH',
+                        help=f"Reuse results for unchanged pages via an on-disk cache (default path: {DEFAULT_CACHE_PATH})")
+    parser.add_argument('--structure-only', action='store_true',
+                        help="Only check page structure and CSS/JS includes, stopping each read early once satisfied")
+    parser.add_argument('--manifest', metavar='PATH',
+                        help="Site manifest to audit against (default: <root>/site.json)")
+    parser.add_argument('--compile', action='store_true',
+                        help="Also compile every C code example with the local compiler (results are cached)")
+    parser.add_argument('--run', action='store_true',
+                        help="Also run compiled examples that state their output and check they print it (implies --compile)")
+    parser.add_argument('--external', action='store_true',
+                        help="Also check http(s) links (results are cached for a week, failures for a day)")
+    parser.add_argument('--offline', action='store_true',
+                        help="Check external links from cached results only, making no requests (implies --external)")
+    parser.add_argument('--watch', action='store_true',
+                        help="Keep running: re-sync sidebars and re-audit whenever the site's files change")
+    parser.add_argument('--json', metavar='PATH', help="Also write issues and phase timings as JSON")
+    parser.add_argument('--junit', metavar='PATH', help="Also write a JUnit XML report for CI")
+    args = parser.parse_args()
     
-    auditor = SiteAuditor(root_path)
-    exit_code = auditor.run_audit()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    try:
+        manifest = load_manifest(args.root, args.manifest)
+    except (OSError, ValueError) as e:
+        print(f"❌ Cannot load site manifest: {e}")
+        sys.exit(2)
+    if args.watch:
+        # watch_site imports this module, so it is only imported when needed
+        from watch_site import SiteWatcher
+        SiteWatcher(args.root, manifest_path=args.manifest, cache_path=args.cache or DEFAULT_CACHE_PATH, jobs=jobs,
+                    structure_only=args.structure_only, compile_snippets=args.compile,
+                    run_snippets=args.run, external_links=args.external, offline=args.offline).run()
+    auditor = SiteAuditor(args.root, jobs=jobs, cache_path=args.cache, structure_only=args.structure_only,
+                          manifest=manifest, compile_snippets=args.compile,
+                          run_snippets=args.run, external_links=args.external, offline=args.offline)
+    exit_code = auditor.run_audit(json_path=args.json, junit_path=args.junit)
     sys.exit(exit_code)
 
 
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Site manifest for C Programming Zero to Hero
+Loads site.json, the single description of the site structure shared by
+site_audit.py, sync_sidebar.py and create_skeletons.py
+"""
+
+import fnmatch
+import json
+import os
+import sys
+from pathlib import Path
+
+MANIFEST_NAME = 'site.json'
+# Written by build_assets.py: original asset path -> fingerprinted path
+ASSET_MANIFEST_NAME = 'asset-manifest.json'
+
+# The repository's own manifest, used when a site root doesn't have one
+DEFAULT_MANIFEST_PATH = Path(__file__).resolve().parent.parent / MANIFEST_NAME
+
+
+class SiteManifest:
+    """Declared files and page sections, plus which of them exist on disk.
+
+    ``required_files`` maps every declared or discovered path to its type
+    (``root``, ``css``, ``js``, ``chapter``, ...) in manifest order, which is
+    the order the audit reports them in. Existence is answered from one
+    directory listing per directory, taken when the manifest is loaded.
+
+    ``budgets`` maps page types (or ``default``) to the most KB a page plus
+    its CSS/JS may take over the wire, as checked by site_audit.py.
+
+    ``unstyled_classes`` are classes used only as script hooks, which the
+    audit doesn't expect any CSS rule for.
+
+    ``assets`` maps asset paths to their fingerprinted names when the root is
+    the output of build_assets.py, and is empty otherwise.
+    """
+
+    def __init__(self, root, data, assets=None):
+        self.root = Path(root)
+        self.sections = data.get('sections', {})
+        self.budgets = data.get('budgets', {})
+        self.unstyled_classes = set(data.get('unstyled_classes', []))
+        self.assets = assets or {}
+        self._listings = {}
+
+        self.required_files = dict(data.get('files', {}))
+        self.pages = {}
+        for name, section in self.sections.items():
+            declared = [dict(page) for page in section.get('pages', [])]
+            section_pages = declared
+            pattern = section.get('discover')
+            if pattern:
+                directory = section.get('dir', name)
+                known = {page['path'] for page in declared}
+                for filename in sorted(self._listing(directory)):
+                    path = f"{directory}/{filename}"
+                    if fnmatch.fnmatch(filename, pattern) and path not in known:
+                        section_pages.append({'path': path})
+            self.pages[name] = section_pages
+            for page in section_pages:
+                self.required_files[page['path']] = section.get('type', name)
+
+    def _listing(self, directory):
+        """Names in a root-relative directory, listed once and cached"""
+        if directory not in self._listings:
+            try:
+                with os.scandir(self.root / directory) as entries:
+                    self._listings[directory] = {entry.name for entry in entries}
+            except OSError:
+                self._listings[directory] = set()
+        return self._listings[directory]
+
+    def exists(self, path):
+        directory, _, name = path.rpartition('/')
+        return name in self._listing(directory or '.')
+
+    def built_path(self, path):
+        """The name path is served under: its fingerprinted name if it has one"""
+        return self.assets.get(path, path)
+
+    @property
+    def html_files(self):
+        return [path for path in self.required_files if path.endswith('.html')]
+
+    @property
+    def sidebar_dirs(self):
+        """Section directories whose pages carry the synced sidebar"""
+        return [section.get('dir', name) for name, section in self.sections.items() if section.get('sidebar')]
+
+    def sidebar_pages(self):
+        """Paths of every page that should carry the synced sidebar"""
+        return [page['path'] for name, section in self.sections.items() if section.get('sidebar')
+                for page in self.pages[name]]
+
+    def declared_pages(self, section_type):
+        """Declared (not discovered) pages of a given section type, with their titles"""
+        return [page for name, section in self.sections.items() if section.get('type', name) == section_type
+                for page in section.get('pages', [])]
+
+
+def load_manifest(root='.', path=None):
+    """Load the manifest for a site root.
+
+    Uses path if given, else ``<root>/site.json``, else the repository's own
+    manifest. Raises OSError/ValueError if the chosen file can't be read.
+    A ``<root>/asset-manifest.json`` left by build_assets.py is picked up too.
+    """
+    root = Path(root)
+    if path is None:
+        path = root / MANIFEST_NAME
+        if not path.exists():
+            path = DEFAULT_MANIFEST_PATH
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    assets = None
+    asset_manifest_path = root / ASSET_MANIFEST_NAME
+    if asset_manifest_path.exists():
+        with open(asset_manifest_path, 'r', encoding='utf-8') as f:
+            assets = json.load(f)
+    return SiteManifest(root, data, assets)
+
+
+def main():
+    root = sys.argv[1] if len(sys.argv) > 1 else '.'
+    manifest = load_manifest(root)
+    for file_path, file_type in manifest.required_files.items():
+        status = "✅" if manifest.exists(manifest.built_path(file_path)) else "❌"
+        print(f"{status} {file_type:<10} {file_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,18 @@
+import argparse
+import difflib
+import hashlib
+import json
 import os
 import re
+import sys
+import tempfile
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from xml.etree.ElementTree import Element, SubElement, tostring
 
+from site_manifest import load_manifest
+
+
 def pretty_print(elem):
     """Return a pretty-printed XML string for the Element."""
     # This is a simplified pretty-printer. It's not perfect for HTML.
@@ -11,12 +21,144 @@ def pretty_print(elem):
     reparsed = minidom.parseString(rough_string)
     return reparsed.toprettyxml(indent="  ")
 
-def sync_sidebar_stdlib():
+SIDEBAR_START = '<nav class="sidebar"'
+SIDEBAR_END = '</nav>'
+HREF_RE = re.compile(r'href="([^"]*)"')
+NAV_LINK_RE = re.compile(r'<a href="([^"]*)" class="nav-link">')
+
+
+def find_sidebar(html):
+    """Return (start, end) of the sidebar <nav> in html, or None"""
+    start = html.find(SIDEBAR_START)
+    if start < 0:
+        return None
+    end = html.find(SIDEBAR_END, start)
+    if end < 0:
+        return None
+    return start, end + len(SIDEBAR_END)
+
+
+class SidebarTemplate:
+    """The canonical sidebar, compiled once for pages at a given depth.
+
+    Links are rewritten relative to the page (``chapters/x.html`` ->
+    ``../chapters/x.html``, ``#id`` -> ``../index.html#id``) and the offset
+    of every nav link is recorded, so rendering a page's sidebar is a single
+    splice of its active link rather than a round of regex passes.
     """
-    Extracts the sidebar from index.html and injects it into all other HTML files
-    using only Python's standard library.
+
+    def __init__(self, canonical_sidebar_html, depth=1):
+        prefix = "../" * depth
+        
+        def relink(match):
+            href = match.group(1)
+            if href.startswith(('http://', 'https://', 'mailto:')) or not depth:
+                return match.group(0)
+            if href.startswith('#'):
+                href = f"{prefix}index.html{href}"
+            elif href.startswith('/'):
+                href = prefix + href[1:]
+            else:
+                href = prefix + href
+            return f'href="{href}"'
+        
+        # Drop any active state baked into the canonical copy
+        sidebar = canonical_sidebar_html.replace(' class="nav-link active" aria-current="page"', ' class="nav-link"')
+        self.html = HREF_RE.sub(relink, sidebar)
+        self.slots = {}
+        for match in NAV_LINK_RE.finditer(self.html):
+            self.slots.setdefault(match.group(1), (match.start(), match.end()))
+
+    def render(self, page_href):
+        """Return the sidebar with page_href marked as the active link"""
+        slot = self.slots.get(page_href)
+        if slot is None:
+            return self.html
+        start, end = slot
+        return f'{self.html[:start]}<a href="{page_href}" class="nav-link active" aria-current="page">{self.html[end:]}'
+
+
+def write_atomic(file_path, content):
+    """Write content via a temp file in the same directory + rename"""
+    dir_name = os.path.dirname(file_path)
+    fd, tmp_path = tempfile.mkstemp(dir=dir_name, prefix='.sync-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            f.write(content)
+        # mkstemp creates 0600 files; keep the original mode, or 0644 for new files
+        mode = os.stat(file_path).st_mode & 0o777 if os.path.exists(file_path) else 0o644
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def render_page(file_path, page_href, template):
+    """Return (status, current_html, updated_html) for one target page.
+
+    status is 'changed' when the sidebar differs, 'unchanged' when it already
+    matches and 'missing' when the page has no sidebar.
+    """
+    with open(file_path, 'r', encoding='utf-8', newline='') as f:
+        target_html = f.read()
+    
+    span = find_sidebar(target_html)
+    if span is None:
+        return 'missing', target_html, None
+    
+    start, end = span
+    sidebar = template.render(page_href)
+    if target_html[start:end] == sidebar:
+        return 'unchanged', target_html, target_html
+    return 'changed', target_html, target_html[:start] + sidebar + target_html[end:]
+
+
+def sync_page(file_path, rel_path, page_href, template, write=True, diff=False):
+    """Sync one page's sidebar, writing only if it changed.
+
+    Returns a manifest entry: status, byte sizes and sha256 before/after, and
+    (with diff) a unified diff of the change. With write=False nothing is
+    written, so the entry describes what a sync would do.
     """
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    status, current_html, updated_html = render_page(file_path, page_href, template)
+    if status == 'changed' and write:
+        write_atomic(file_path, updated_html)
+    
+    before = current_html.encode('utf-8')
+    entry = {
+        'path': rel_path,
+        'status': status,
+        'bytes_before': len(before),
+        'sha256_before': hashlib.sha256(before).hexdigest(),
+    }
+    if updated_html is not None:
+        after = before if updated_html is current_html else updated_html.encode('utf-8')
+        entry['bytes_after'] = len(after)
+        entry['byte_delta'] = len(after) - len(before)
+        entry['sha256_after'] = hashlib.sha256(after).hexdigest()
+    if diff and status == 'changed':
+        entry['diff'] = ''.join(difflib.unified_diff(
+            current_html.splitlines(keepends=True), updated_html.splitlines(keepends=True),
+            fromfile=f"a/{rel_path}", tofile=f"b/{rel_path}", n=1))
+    return entry
+
+
+def collect_targets(project_root, manifest):
+    """Return [(rel_path, file_path, page_href, depth)] for every page listed in the manifest's sidebar sections"""
+    targets = []
+    for rel_path in manifest.sidebar_pages():
+        if not manifest.exists(rel_path):
+            continue
+        depth = rel_path.count('/')
+        page_href = "../" * depth + rel_path
+        targets.append((rel_path, os.path.join(project_root, *rel_path.split('/')), page_href, depth))
+    return targets
+
+
+def load_canonical_sidebar(project_root):
+    """Return the sidebar <nav> from index.html, or None after printing why"""
     source_html_path = os.path.join(project_root, 'index.html')
     
     print(f"Using '{source_html_path}' as the canonical source.")
@@ -24,59 +166,106 @@ def sync_sidebar_stdlib():
     try:
         with open(source_html_path, 'r', encoding='utf-8') as f:
             html_content = f.read()
-            # Use regex to find the sidebar content as ElementTree is not a full HTML parser
-            sidebar_match = re.search(r'<nav class="sidebar".*?>.*?</nav>', html_content, re.DOTALL)
-            if not sidebar_match:
-                print("ERROR: Could not find sidebar navigation in index.html")
-                return
-            canonical_sidebar_html = sidebar_match.group(0)
     except FileNotFoundError:
         print(f"ERROR: Canonical source file not found at '{source_html_path}'")
-        return
+        return None
+    
+    span = find_sidebar(html_content)
+    if not span:
+        print("ERROR: Could not find sidebar navigation in index.html")
+        return None
+    return html_content[span[0]:span[1]]
+
+
+def sync_sidebar_stdlib(project_root=None, jobs=None, check=False, diff=False, manifest=None):
+    """
+    Extracts the sidebar from index.html and injects it into all other HTML files
+    using only Python's standard library.
+
+    Target pages come from the sidebar sections of the site manifest
+    (site.json). Returns the change manifest (one entry per target page, see
+    sync_page), or None if the canonical sidebar could not be loaded. With
+    check=True no files are written and the entries describe what would change.
+    """
+    if project_root is None:
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    
+    canonical_sidebar_html = load_canonical_sidebar(project_root)
+    if canonical_sidebar_html is None:
+        return None
+
+    if manifest is None:
+        manifest = load_manifest(project_root)
+    targets = collect_targets(project_root, manifest)
+    templates = {depth: SidebarTemplate(canonical_sidebar_html, depth=depth)
+                 for depth in {t[3] for t in targets}}
+
+    # Pages are independent, so fan the read/compare/write work out over threads
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        changes = list(executor.map(
+            lambda t: sync_page(t[1], t[0], t[2], templates[t[3]], write=not check, diff=diff),
+            targets))
 
-    target_dirs = ['chapters', 'practice', 'reference']
     files_synced = 0
+    files_unchanged = 0
+    for entry in changes:
+        if entry['status'] == 'changed':
+            if check:
+                print(f"Stale sidebar in: {entry['path']} ({entry['byte_delta']:+d} bytes)")
+            else:
+                print(f"Synced sidebar in: {entry['path']}")
+            if 'diff' in entry:
+                print(entry['diff'], end='')
+            files_synced += 1
+        elif entry['status'] == 'unchanged':
+            files_unchanged += 1
+        else:
+            print(f"WARNING: Could not find sidebar in {entry['path']}")
 
-    for directory in target_dirs:
-        dir_path = os.path.join(project_root, directory)
-        if not os.path.isdir(dir_path):
-            continue
+    if check:
+        print(f"\nCheck complete. {files_synced} files stale, {files_unchanged} up to date.")
+    else:
+        print(f"\nSync complete. Updated {files_synced} files, {files_unchanged} already up to date.")
+    return changes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Copy the index.html sidebar into every chapter, practice and reference page")
+    parser.add_argument('root', nargs='?', default=None, help="Site root directory (default: the repository root)")
+    parser.add_argument('-j', '--jobs', type=int, default=None, help="Worker threads (default: Python's ThreadPoolExecutor default)")
+    parser.add_argument('--check', action='store_true',
+                        help="Don't write anything; exit 1 if any page's sidebar is stale or missing")
+    parser.add_argument('--diff', action='store_true', help="Print a unified diff for each changed page")
+    parser.add_argument('--manifest', metavar='PATH',
+                        help="Write a JSON manifest of changed pages (byte deltas and sha256 hashes)")
+    parser.add_argument('--site', metavar='PATH', help="Site manifest listing the pages to sync (default: <root>/site.json)")
+    args = parser.parse_args()
+    
+    root = args.root or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        site = load_manifest(root, args.site)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: Cannot load site manifest: {e}")
+        sys.exit(2)
+    
+    changes = sync_sidebar_stdlib(root, jobs=args.jobs, check=args.check, diff=args.diff, manifest=site)
+    if changes is None:
+        sys.exit(2)
+    
+    if args.manifest:
+        changed = [{k: v for k, v in entry.items() if k != 'diff'}
+                   for entry in changes if entry['status'] != 'unchanged']
+        with open(args.manifest, 'w', encoding='utf-8') as f:
+            json.dump({
+                'mode': 'check' if args.check else 'sync',
+                'pages': len(changes),
+                'changed': changed,
+            }, f, indent=2)
+            f.write('\n')
+    
+    if args.check and any(entry['status'] != 'unchanged' for entry in changes):
+        sys.exit(1)
 
-        for filename in os.listdir(dir_path):
-            if filename.endswith('.html'):
-                file_path = os.path.join(dir_path, filename)
-                
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    target_html = f.read()
-
-                # Adjust paths in the canonical sidebar for the current file
-                temp_sidebar = canonical_sidebar_html
-                
-                # Adjust asset paths like /assets/ -> ../assets/
-                temp_sidebar = re.sub(r'href="/(assets|chapters|practice|reference|index.html)', r'href="../\1', temp_sidebar)
-
-                # Set active link
-                current_page_path = f"../{directory}/{filename}"
-                # Remove any existing active state
-                temp_sidebar = temp_sidebar.replace(' active" aria-current="page"', '"')
-                # Add active state to the correct link
-                active_link_pattern = f'href="{current_page_path}"'
-                replacement = f'{active_link_pattern} class="nav-link active" aria-current="page"'
-                temp_sidebar = temp_sidebar.replace(active_link_pattern, replacement)
-                
-                # Replace the old sidebar with the new one in the target file
-                updated_html, count = re.subn(r'<nav class="sidebar".*?>.*?</nav>', temp_sidebar, target_html, flags=re.DOTALL)
-
-                if count > 0:
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(updated_html)
-                    print(f"Synced sidebar in: {directory}/{filename}")
-                    files_synced += 1
-                else:
-                    print(f"WARNING: Could not find sidebar in {directory}/{filename}")
-
-
-    print(f"\nSync complete. Updated {files_synced} files.")
 
 if __name__ == '__main__':
-    sync_sidebar_stdlib()
+    main()
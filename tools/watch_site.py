@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Watch mode for C Programming Zero to Hero
+Backs ``site_audit.py --watch``: polls the site for changes and, after each
+burst of edits settles, re-syncs sidebars if index.html changed and re-runs
+the audit in-process, printing only the issues that appeared or went away.
+
+The audit keeps its AuditCache in memory between runs, so only pages whose
+content changed are re-parsed and only their link checks (plus those of
+pages linking to a page whose ids changed, appeared or vanished) re-run.
+
+Changes are found by polling file sizes and mtimes: the standard library
+has no inotify binding, and one os.scandir() per directory of a site this
+size costs well under a millisecond per poll.
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+from pathlib import Path
+
+from site_audit import DEFAULT_CACHE_PATH, AuditCache, SiteAuditor
+from site_manifest import MANIFEST_NAME, load_manifest
+from sync_sidebar import sync_sidebar_stdlib
+
+POLL_INTERVAL = 0.25        # seconds between polls
+DEBOUNCE = 0.1              # quiet time after a change before acting on it
+WATCH_SUFFIXES = {'.html', '.css', '.js', '.json'}
+# Build outputs and tool state, never site sources
+IGNORED_DIRS = {'dist', 'tools', 'node_modules', '__pycache__'}
+CANONICAL_SIDEBAR_PAGE = 'index.html'
+
+
+def snapshot(root):
+    """{root-relative path: (size, mtime_ns)} for every watched file under root"""
+    files = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith('.') and d not in IGNORED_DIRS]
+        rel_dir = Path(dirpath).relative_to(root).as_posix()
+        for filename in filenames:
+            if filename.startswith('.') or os.path.splitext(filename)[1] not in WATCH_SUFFIXES:
+                continue
+            path = filename if rel_dir == '.' else f"{rel_dir}/{filename}"
+            try:
+                st = os.stat(os.path.join(dirpath, filename))
+            except OSError:
+                continue
+            files[path] = (st.st_size, st.st_mtime_ns)
+    return files
+
+
+def changed_paths(before, after):
+    """Paths added, removed or modified between two snapshots"""
+    return {path for path in before.keys() | after.keys() if before.get(path) != after.get(path)}
+
+
+class SiteWatcher:
+    """Re-sync and re-audit a site whenever its files change"""
+
+    def __init__(self, root, manifest_path=None, cache_path=DEFAULT_CACHE_PATH, **auditor_options):
+        self.root = Path(root)
+        self.manifest_path = manifest_path
+        self.auditor_options = auditor_options
+        self.cache = AuditCache(self.root / cache_path)
+        self.files = {}
+        self.issues = set()
+
+    def wait_for_changes(self):
+        """Block until watched files change and stay unchanged for DEBOUNCE; return their paths"""
+        while True:
+            time.sleep(POLL_INTERVAL)
+            current = snapshot(self.root)
+            changed = changed_paths(self.files, current)
+            if not changed:
+                continue
+            # Editors often write a file in several steps; wait for the burst to end
+            while True:
+                time.sleep(DEBOUNCE)
+                settled = snapshot(self.root)
+                more = changed_paths(current, settled)
+                if not more:
+                    break
+                changed |= more
+                current = settled
+            self.files = current
+            return changed
+
+    def sync(self, manifest):
+        """Copy the index.html sidebar into every page; return the pages rewritten"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            changes = sync_sidebar_stdlib(str(self.root), manifest=manifest)
+        if changes is None:
+            print("   ⚠️  Could not load the sidebar from index.html; pages left as they are")
+            return set()
+        synced = {entry['path'] for entry in changes if entry['status'] == 'changed'}
+        for path in sorted(synced):
+            print(f"   🔄 Synced sidebar in: {path}")
+        # Don't treat our own writes as the next round of edits
+        self.files = snapshot(self.root)
+        return synced
+
+    def audit(self, changed):
+        """Sync if needed, re-run the audit and print how the issues changed"""
+        start = time.perf_counter()
+        try:
+            # Reloaded every time: site.json may have changed or pages may have appeared
+            manifest = load_manifest(self.root, self.manifest_path)
+        except (OSError, ValueError) as e:
+            print(f"   ❌ Cannot load site manifest: {e}")
+            return
+        if CANONICAL_SIDEBAR_PAGE in changed or MANIFEST_NAME in changed:
+            self.sync(manifest)
+
+        auditor = SiteAuditor(self.root, manifest=manifest, cache=self.cache, **self.auditor_options)
+        with contextlib.redirect_stdout(io.StringIO()):
+            auditor.audit()
+        issues = set(auditor.errors) | set(auditor.warnings)
+        for issue in sorted(issues - self.issues, key=str):
+            print(f"   {'❌' if issue.severity == 'error' else '⚠️ '} {issue}")
+        for issue in sorted(self.issues - issues, key=str):
+            print(f"   ✅ Fixed: {issue}")
+        self.issues = issues
+
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"   📊 {len(auditor.errors)} errors, {len(auditor.warnings)} warnings ({elapsed:.0f} ms)")
+
+    def run(self):
+        """Audit once, then watch until interrupted"""
+        self.files = snapshot(self.root)
+        print(f"👀 Watching {self.root.resolve()} ({len(self.files)} files, Ctrl+C to stop)")
+        self.audit(set())
+        try:
+            while True:
+                changed = self.wait_for_changes()
+                print(f"\n✏️  Changed: {', '.join(sorted(changed)) if len(changed) <= 5 else f'{len(changed)} files'}")
+                self.audit(changed)
+        except KeyboardInterrupt:
+            print("\n👋 Stopped watching")
+            sys.exit(0)